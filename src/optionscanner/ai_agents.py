@@ -5,7 +5,7 @@ import json
 import time
 from dataclasses import dataclass, field
 from statistics import mean
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
 
 from loguru import logger
 
@@ -437,6 +437,23 @@ class AISignalSelector:
         return result[: self.top_k]  # Limit to top_k
 
 
+@dataclass(slots=True)
+class _PeerStats:
+    """Per-symbol direction counts for a batch of signals, built in one pass."""
+
+    total: int = 0
+    directions: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[TradeSignal]) -> "_PeerStats":
+        stats = cls()
+        for signal in signals:
+            counts = stats.directions.setdefault(signal.symbol, {})
+            counts[signal.direction] = counts.get(signal.direction, 0) + 1
+            stats.total += 1
+        return stats
+
+
 @dataclass(slots=True)
 class SignalValidationAgent:
     """Review a signal against lightweight market context to offer guidance."""
@@ -458,15 +475,56 @@ class SignalValidationAgent:
         peer_signals: Iterable[TradeSignal],
     ) -> str:
         peer_list = list(peer_signals)
-        trend = self._infer_trend(snapshot)
+        includes_self = any(peer is signal for peer in peer_list)
+        return self._review(
+            signal,
+            snapshot,
+            _PeerStats.from_signals(peer_list),
+            includes_self,
+            self._infer_trend(snapshot),
+            self._snapshot_overview(snapshot),
+        )
+
+    def review_batch(
+        self,
+        signals: Sequence[TradeSignal],
+        snapshot_by_symbol: Mapping[str, OptionChainSnapshot],
+    ) -> List[str]:
+        """Review every signal in a batch against its peers.
+
+        Peer statistics are computed once for the batch and each snapshot's
+        trend and overview once per symbol, so the cost grows linearly with
+        the number of signals. ``snapshot_by_symbol`` is keyed by upper-case
+        symbol, as built in ``run_once``.
+        """
+        stats = _PeerStats.from_signals(signals)
+        context: Dict[str, tuple[Optional[str], str]] = {}
+        reviews: List[str] = []
+        for signal in signals:
+            snapshot = snapshot_by_symbol.get(signal.symbol.upper())
+            if signal.symbol not in context:
+                context[signal.symbol] = (self._infer_trend(snapshot), self._snapshot_overview(snapshot))
+            trend, overview = context[signal.symbol]
+            reviews.append(self._review(signal, snapshot, stats, True, trend, overview))
+        return reviews
+
+    def _review(
+        self,
+        signal: TradeSignal,
+        snapshot: Optional[OptionChainSnapshot],
+        stats: _PeerStats,
+        includes_self: bool,
+        trend: Optional[str],
+        overview: str,
+    ) -> str:
         alignment = self._assess_alignment(signal.direction, trend)
-        peer_view = self._peer_context(signal, peer_list)
+        peer_view = self._peer_context(signal, stats, includes_self)
 
         system_prompt = (
             "You are an options risk manager. Evaluate the robustness of a trading signal "
             "using trend, peer signals, and option data, then provide validation guidance."
         )
-        peer_summary = self._peer_summary(peer_list, signal)
+        peer_summary = self._peer_summary(stats, signal)
         user_prompt = (
             "Assess whether the signal aligns with current market context. Provide 3 concise bullet points: "
             "market trend assessment, alignment with the signal, and risk/positioning advice.\n"
@@ -481,7 +539,7 @@ class SignalValidationAgent:
             f"  Trend inference: {trend or 'Unavailable'}\n"
             f"  Alignment note: {alignment or 'None'}\n"
             f"  Peer view: {peer_view or 'No peer context'}\n"
-            f"Market snapshot summary:\n{self._snapshot_overview(snapshot) or 'No snapshot data supplied.'}\n"
+            f"Market snapshot summary:\n{overview or 'No snapshot data supplied.'}\n"
             f"Peer signal summary:\n{peer_summary or 'No other signals for this batch.'}"
         )
         if not self.enable_gemini:
@@ -548,20 +606,15 @@ class SignalValidationAgent:
             f"Options captured: {option_count} | average mark {avg_mark:.2f}"
         )
 
-    def _peer_summary(self, peer_signals: List[TradeSignal], target: TradeSignal) -> str:
-        if not peer_signals:
+    def _peer_summary(self, stats: _PeerStats, target: TradeSignal) -> str:
+        if not stats.total:
             return ""
-        total = len(peer_signals)
-        same_symbol = [s for s in peer_signals if s.symbol == target.symbol]
+        same_symbol = stats.directions.get(target.symbol)
         if not same_symbol:
-            return f"Total signals evaluated: {total}; none share the symbol {target.symbol}."
-        directional_breakdown: dict[str, int] = {}
-        for sig in same_symbol:
-            directional_breakdown.setdefault(sig.direction, 0)
-            directional_breakdown[sig.direction] += 1
-        breakdown_str = ", ".join(f"{direction}: {count}" for direction, count in directional_breakdown.items())
+            return f"Total signals evaluated: {stats.total}; none share the symbol {target.symbol}."
+        breakdown_str = ", ".join(f"{direction}: {count}" for direction, count in same_symbol.items())
         return (
-            f"Total signals evaluated: {total}; matching symbol signals: {len(same_symbol)}.\n"
+            f"Total signals evaluated: {stats.total}; matching symbol signals: {sum(same_symbol.values())}.\n"
             f"Directional breakdown: {breakdown_str}"
         )
 
@@ -604,16 +657,14 @@ class SignalValidationAgent:
             return "Option pricing looks balanced; position sizing discipline is important."
         return "The signal runs counter to the detected skew, so ensure risk controls are strict."
 
-    def _peer_context(
-        self,
-        signal: TradeSignal,
-        peer_signals: Iterable[TradeSignal],
-    ) -> Optional[str]:
-        similar = [s for s in peer_signals if s.symbol == signal.symbol and s is not signal]
-        if not similar:
+    def _peer_context(self, signal: TradeSignal, stats: _PeerStats, includes_self: bool) -> Optional[str]:
+        counts = stats.directions.get(signal.symbol, {})
+        # Peers exclude the signal under review when it is part of the batch.
+        similar = sum(counts.values()) - includes_self
+        if similar <= 0:
             return None
-        same_direction = [s for s in similar if s.direction == signal.direction]
-        if len(same_direction) == len(similar):
+        same_direction = counts.get(signal.direction, 0) - includes_self
+        if same_direction == similar:
             return "Multiple strategies share this direction, adding conviction."
         if not same_direction:
             return "Other strategies disagree on direction; double-check assumptions."
@@ -12,7 +12,7 @@ import pandas as pd
 
 from loguru import logger
 
-from optionscanner.option_data import OptionChainSnapshot
+from optionscanner.option_data import OptionChainSnapshot, open_snapshot_dataset
 from optionscanner.strategies.base import BaseOptionStrategy
 
 
@@ -39,11 +39,19 @@ class BacktestRunner:
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
     def load_snapshots(self) -> List[OptionChainSnapshot]:
-        snapshots: List[OptionChainSnapshot] = []
+        frames: List[pd.DataFrame] = []
         for file_path in sorted(self.data_dir.glob("*.parquet")):
             df = pd.read_parquet(file_path)
-            if df.empty:
-                continue
+            if not df.empty:
+                frames.append(df)
+        dataset = open_snapshot_dataset(self.data_dir)
+        if dataset is not None:
+            df = dataset.to_table().to_pandas().drop(columns=["date"])
+            df["symbol"] = df["symbol"].astype(str)
+            frames.extend(group for _, group in df.groupby(["symbol", "timestamp"], sort=True))
+
+        snapshots: List[OptionChainSnapshot] = []
+        for df in frames:
             symbol = df["symbol"].iloc[0]
             timestamp = pd.to_datetime(df["timestamp"].iloc[0])
             options = df.drop(columns=["symbol", "timestamp"]).to_dict("records")
@@ -0,0 +1,20 @@
+"""Environment variable helpers shared across the scanner."""
+
+from __future__ import annotations
+
+import os
+from typing import Mapping, Optional
+
+TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def env_flag(name: str, env: Optional[Mapping[str, str]] = None) -> bool:
+    """Return whether ``name`` is set to a truthy value (1/true/yes/on, any case).
+
+    Reads ``os.environ`` unless an explicit ``env`` mapping is given.
+    """
+    source = os.environ if env is None else env
+    return source.get(name, "").strip().lower() in TRUE_VALUES
+
+
+__all__ = ["TRUE_VALUES", "env_flag"]
@@ -0,0 +1,54 @@
+"""Event loop selection shared by the command-line entrypoints."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sys
+from typing import Callable, Iterator, Optional
+
+from loguru import logger
+
+from optionscanner.env import env_flag
+
+
+def loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return ``uvloop.new_event_loop`` when uvloop is installed, else ``None``.
+
+    Set ``OPTIONSCANNER_DISABLE_UVLOOP=1`` to keep the standard loop, e.g. when
+    debugging with asyncio's debug mode, which uvloop only partially supports.
+    """
+    if sys.platform == "win32":
+        return None
+    if env_flag("OPTIONSCANNER_DISABLE_UVLOOP"):
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+@contextlib.contextmanager
+def event_loop_runner() -> Iterator[asyncio.Runner]:
+    """Yield a runner whose loop (uvloop when installed) is also the current loop.
+
+    Keeping the loop current lets ib_async's synchronous helpers, used by the
+    portfolio manager, drive the same connection between ``runner.run`` calls.
+    """
+    with asyncio.Runner(loop_factory=loop_factory()) as runner:
+        loop = runner.get_loop()
+        logger.debug(
+            "Using event loop {loop}",
+            loop=f"{type(loop).__module__}.{type(loop).__name__}",
+            component="event_loop",
+            event_type="loop_selected",
+        )
+        asyncio.set_event_loop(loop)
+        try:
+            yield runner
+        finally:
+            asyncio.set_event_loop(None)
+
+
+__all__ = ["event_loop_runner", "loop_factory"]
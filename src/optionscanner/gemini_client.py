@@ -1,7 +1,10 @@
 """Thin wrapper around google-generativeai for Gemini text generation."""
 from __future__ import annotations
 
+import hashlib
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Sequence
@@ -9,6 +12,8 @@ from typing import List, Optional, Sequence
 from loguru import logger
 import yaml
 
+from optionscanner.env import env_flag
+
 try:  # pragma: no cover - optional dependency resolved at runtime
     import google.generativeai as genai
 except ImportError:  # pragma: no cover - handled gracefully
@@ -19,6 +24,96 @@ class GeminiClientError(RuntimeError):
     """Raised when the Gemini client cannot fulfill a request."""
 
 
+@dataclass(slots=True)
+class GenerationCache:
+    """Content-addressed disk cache for Gemini generations.
+
+    Entries are keyed by a digest of the model, generation settings and
+    prompts so re-running the scanner on unchanged inputs skips the API call.
+    Off unless ``GEMINI_CACHE_ENABLE`` is set: a hit replays earlier trade
+    guidance instead of asking the model again.
+    """
+
+    cache_dir_env_var: str = "GEMINI_CACHE_DIR"
+    ttl_env_var: str = "GEMINI_CACHE_TTL_SECONDS"
+    enable_env_var: str = "GEMINI_CACHE_ENABLE"
+    default_cache_dir: str = "./.cache/gemini"
+    default_ttl_seconds: float = 24 * 60 * 60
+    max_entries: int = 512
+
+    @property
+    def enabled(self) -> bool:
+        return env_flag(self.enable_env_var)
+
+    @property
+    def cache_dir(self) -> Path:
+        return Path(os.getenv(self.cache_dir_env_var) or self.default_cache_dir).expanduser()
+
+    @property
+    def ttl_seconds(self) -> float:
+        raw = os.getenv(self.ttl_env_var, "").strip()
+        if not raw:
+            return self.default_ttl_seconds
+        try:
+            return float(raw)
+        except ValueError:
+            logger.warning(
+                "Invalid Gemini cache TTL | env={env} value={value}",
+                env=self.ttl_env_var,
+                value=raw,
+            )
+            return self.default_ttl_seconds
+
+    @staticmethod
+    def make_key(*components: object) -> str:
+        payload = "\x00".join(str(component) for component in components)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def path_for(self, key: str) -> Optional[Path]:
+        if not self.enabled:
+            return None
+        return self.cache_dir / f"{key}.txt"
+
+    def read(self, path: Path) -> Optional[str]:
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl_seconds:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def write(self, path: Path, text: str) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug(
+                "Unable to write Gemini cache entry | path={path} reason={error}",
+                path=str(path),
+                error=exc,
+            )
+            return
+        self._evict(path.parent)
+
+    def _evict(self, directory: Path) -> None:
+        try:
+            entries = [(entry.stat().st_mtime, entry) for entry in directory.glob("*.txt")]
+        except OSError:
+            return
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda item: item[0])
+        for _, entry in entries[:excess]:
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+
+
 @dataclass(slots=True)
 class GeminiClient:
     """Lightweight wrapper for Google Gemini text generation."""
@@ -36,9 +131,12 @@ class GeminiClient:
     temperature: float = 0.6
     top_p: float = 0.9
     max_output_tokens: Optional[int] = None
-    _model: Optional["genai.GenerativeModel"] = field(init=False, default=None)
+    model_cache_size: int = 4
+    _model_cache: "OrderedDict[bytes, genai.GenerativeModel]" = field(
+        init=False, default_factory=OrderedDict
+    )
     _configured: bool = field(init=False, default=False)
-    _last_system_prompt: Optional[str] = field(init=False, default=None)
+    cache: GenerationCache = field(default_factory=GenerationCache)
 
     def __post_init__(self) -> None:
         resolved_model = self._resolve_model_name()
@@ -46,19 +144,24 @@ class GeminiClient:
             self.model_name = resolved_model
 
     def _ensure_model(self, system_prompt: str) -> "genai.GenerativeModel":
-        if self._configured and self._model is not None and self._last_system_prompt == system_prompt:
-            return self._model
+        key = hashlib.blake2b(system_prompt.encode("utf-8"), digest_size=8).digest()
+        model = self._model_cache.get(key)
+        if model is not None:
+            self._model_cache.move_to_end(key)
+            return model
         if genai is None:
             raise GeminiClientError(
                 "google-generativeai is not installed; install it or disable Gemini usage."
             )
-        api_key = self._resolve_api_key()
-        if not api_key:
-            raise GeminiClientError(
-                "Gemini API key not found. Set one of: " + ", ".join(self.api_key_env_vars)
-            )
         try:
-            genai.configure(api_key=api_key)
+            if not self._configured:
+                api_key = self._resolve_api_key()
+                if not api_key:
+                    raise GeminiClientError(
+                        "Gemini API key not found. Set one of: " + ", ".join(self.api_key_env_vars)
+                    )
+                genai.configure(api_key=api_key)
+                self._configured = True
             generation_config_data = {
                 "temperature": self.temperature,
                 "top_p": self.top_p,
@@ -67,16 +170,19 @@ class GeminiClient:
                 generation_config_data["max_output_tokens"] = self.max_output_tokens
 
             generation_config = genai.GenerationConfig(**generation_config_data)
-            self._model = genai.GenerativeModel(
+            model = genai.GenerativeModel(
                 self.model_name,
                 generation_config=generation_config,
                 system_instruction=system_prompt,
             )
-            self._configured = True
-            self._last_system_prompt = system_prompt
-            return self._model
+        except GeminiClientError:
+            raise
         except Exception as exc:  # pragma: no cover - network/runtime failure
             raise GeminiClientError(f"Failed to initialise Gemini client: {exc}") from exc
+        self._model_cache[key] = model
+        while len(self._model_cache) > self.model_cache_size:
+            self._model_cache.popitem(last=False)
+        return model
 
     def _resolve_api_key(self) -> Optional[str]:
         for env_var in self.api_key_env_vars:
@@ -184,32 +290,75 @@ class GeminiClient:
         return None
 
     def generate(self, *, system_prompt: str, user_prompt: str) -> str:
-        model = self._ensure_model(system_prompt=system_prompt.strip())
+        system_prompt = system_prompt.strip()
+        user_prompt = user_prompt.strip()
+        cache_path = self.cache.path_for(
+            self.cache.make_key(
+                self.model_name,
+                self.temperature,
+                self.top_p,
+                self.max_output_tokens,
+                system_prompt,
+                user_prompt,
+            )
+        )
+        if cache_path is not None:
+            cached = self.cache.read(cache_path)
+            if cached is not None:
+                logger.info(
+                    "Gemini response served from cache | path={path}",
+                    path=str(cache_path),
+                    component="gemini",
+                    event_type="cache_hit",
+                )
+                return cached
+
+        model = self._ensure_model(system_prompt=system_prompt)
         try:
-            response = model.generate_content(user_prompt.strip())
+            response = model.generate_content(user_prompt)
         except Exception as exc:  # pragma: no cover - API/runtime failure
             raise GeminiClientError(f"Gemini generation failed: {exc}") from exc
         try:
-            return self._extract_text_from_response(response)
+            text = self._extract_text_from_response(response)
         except GeminiClientError:
             raise
         except Exception as exc:  # pragma: no cover - defensive parsing
             raise GeminiClientError(f"Unable to parse Gemini response: {exc}") from exc
+        if cache_path is not None:
+            self.cache.write(cache_path, text)
+        return text
 
     def _extract_text_from_response(self, response: object) -> str:
         """Best-effort extraction of text content from Gemini responses."""
-        text: Optional[str]
         try:
-            text = getattr(response, "text", None)
-        except ValueError:
-            text = None
-        if isinstance(text, str) and text.strip():
-            return text.strip()
+            text = response.text.strip()  # type: ignore[attr-defined]
+        except (AttributeError, ValueError):
+            text = ""
+        if text:
+            return text
+
+        try:
+            candidates = response.candidates  # type: ignore[attr-defined]
+            if len(candidates) == 1:
+                parts = candidates[0].content.parts
+                if len(parts) == 1 and parts[0].text:
+                    # Common case: a single text part needs no intermediate list.
+                    return parts[0].text.strip()
+            collected_parts = [
+                part.text
+                for candidate in candidates
+                for part in candidate.content.parts
+                if part.text
+            ]
+        except (AttributeError, TypeError):
+            # Rare dict/str shaped payloads; walk them defensively.
+            collected_parts = self._collect_parts_loosely(response)
+        text = " ".join(part for part in collected_parts if part).strip()
+        if text:
+            return text
 
         candidates = getattr(response, "candidates", None) or []
         finish_reasons: List[str] = []
-        collected_parts: List[str] = []
-
         for candidate in candidates:
             finish_reason = getattr(candidate, "finish_reason", None)
             if finish_reason is None and isinstance(candidate, dict):
@@ -217,6 +366,19 @@ class GeminiClient:
             if finish_reason:
                 finish_reasons.append(str(finish_reason))
 
+        block_reason = getattr(getattr(response, "prompt_feedback", None), "block_reason", None)
+        details: List[str] = []
+        if finish_reasons:
+            details.append(f"finish_reason={','.join(finish_reasons)}")
+        if block_reason:
+            details.append(f"block_reason={block_reason}")
+        detail_suffix = f" ({'; '.join(details)})" if details else ""
+        raise GeminiClientError(f"Gemini response did not contain text content{detail_suffix}")
+
+    @staticmethod
+    def _collect_parts_loosely(response: object) -> List[str]:
+        collected_parts: List[str] = []
+        for candidate in getattr(response, "candidates", None) or []:
             content = getattr(candidate, "content", None)
             if content is None and isinstance(candidate, dict):
                 content = candidate.get("content")
@@ -233,18 +395,7 @@ class GeminiClient:
                     collected_parts.append(part_text.strip())
                 elif isinstance(part, str) and part.strip():
                     collected_parts.append(part.strip())
-
-        if collected_parts:
-            return " ".join(collected_parts).strip()
-
-        block_reason = getattr(getattr(response, "prompt_feedback", None), "block_reason", None)
-        details: List[str] = []
-        if finish_reasons:
-            details.append(f"finish_reason={','.join(finish_reasons)}")
-        if block_reason:
-            details.append(f"block_reason={block_reason}")
-        detail_suffix = f" ({'; '.join(details)})" if details else ""
-        raise GeminiClientError(f"Gemini response did not contain text content{detail_suffix}")
+        return collected_parts
 
 
-__all__ = ["GeminiClient", "GeminiClientError"]
+__all__ = ["GeminiClient", "GeminiClientError", "GenerationCache"]
@@ -1,20 +1,30 @@
 """Google Gemini client using the new google-genai SDK (Gemini 2.5)."""
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
 
 import yaml
 from loguru import logger
 
-try:
+from optionscanner.gemini_client import GenerationCache
+
+if TYPE_CHECKING:
     from google import genai
-    from google.genai import types
-except ImportError:
-    genai = None  # type: ignore
-    types = None  # type: ignore
+
+
+@functools.lru_cache(maxsize=1)
+def _load_sdk() -> Tuple[Any, Any]:
+    """Import google-genai on first use; it is slow to import and unused when Gemini is off."""
+    try:
+        from google import genai
+        from google.genai import types
+    except ImportError:
+        return None, None
+    return genai, types
 
 
 class GeminiClientError(RuntimeError):
@@ -49,6 +59,7 @@ class GeminiClientV2:
     _client: Optional["genai.Client"] = field(init=False, default=None)
     _configured: bool = field(init=False, default=False)
     _last_system_prompt: Optional[str] = field(init=False, default=None)
+    cache: GenerationCache = field(default_factory=GenerationCache)
 
     def __post_init__(self) -> None:
         resolved_model = self._resolve_model_name()
@@ -60,6 +71,7 @@ class GeminiClientV2:
         if self._configured and self._client is not None:
             return self._client
 
+        genai, _ = _load_sdk()
         if genai is None:
             raise GeminiClientError(
                 "google-genai is not installed; install with: pip install google-genai"
@@ -177,6 +189,28 @@ class GeminiClientV2:
         Returns:
             Generated text response
         """
+        cache_path = self.cache.path_for(
+            self.cache.make_key(
+                self.model_name,
+                self.temperature,
+                self.top_p,
+                self.max_output_tokens,
+                system_prompt,
+                user_prompt,
+            )
+        )
+        if cache_path is not None:
+            cached = self.cache.read(cache_path)
+            if cached is not None:
+                logger.info(
+                    "Gemini response served from cache | path={path}",
+                    path=str(cache_path),
+                    component="gemini",
+                    event_type="cache_hit",
+                )
+                return cached
+
+        genai, types = _load_sdk()
         if genai is None:
             raise GeminiClientError("google-genai is not installed")
 
@@ -200,11 +234,15 @@ class GeminiClientV2:
                 config=types.GenerateContentConfig(**config_dict) if types else None,
             )
 
-            return self._extract_text_from_response(response)
+            text = self._extract_text_from_response(response)
 
         except Exception as exc:
             raise GeminiClientError(f"Gemini generation failed: {exc}") from exc
 
+        if cache_path is not None:
+            self.cache.write(cache_path, text)
+        return text
+
     def _extract_text_from_response(self, response: object) -> str:
         """Extract text from Gemini response."""
         # Try direct text attribute
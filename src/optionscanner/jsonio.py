@@ -0,0 +1,45 @@
+"""JSON encoding shared by the caches and notifiers."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the speedups extra is absent
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    # NumPy scalars and arrays leak in from DataFrame values; encode them as
+    # their Python equivalents, matching orjson's OPT_SERIALIZE_NUMPY.
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialise ``obj`` to compact UTF-8 JSON, using orjson when installed.
+
+    NumPy scalars and arrays are accepted on both backends. Encoding failures
+    raise ``TypeError`` and decoding failures ``ValueError`` on both backends,
+    so callers can keep catching the stdlib exceptions.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    # ensure_ascii=False writes non-ASCII text (e.g. the Slack "…" marker) as
+    # raw UTF-8 like orjson does, instead of scanning it into \uXXXX escapes.
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from ``bytes`` or ``str``, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
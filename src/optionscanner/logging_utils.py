@@ -10,6 +10,8 @@ from typing import Any, Dict, Optional
 
 from loguru import logger
 
+from optionscanner.env import env_flag
+
 try:
     from logging_loki import LokiHandler
 except Exception:  # pragma: no cover - optional dependency
@@ -44,8 +46,13 @@ def configure_logging(
 
     console_level = console_config.get("level", "INFO")
     file_level = file_config.get("level", "DEBUG")
+    text_level = file_config.get("text_level", "WARNING")
     rotation = file_config.get("rotation", rotation)
     retention = file_config.get("retention", "90 days")
+    # Frame-walking traceback details are costly; only enable when debugging.
+    diagnose = env_flag("LOG_DIAGNOSE")
+    # The multiprocess queue only pays off for the long-lived scheduled runner.
+    enqueue = (run_mode or os.getenv("APP_RUN_MODE")) == "schedule"
 
     logger.remove()
 
@@ -64,15 +71,27 @@ def configure_logging(
         format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {extra[component]: <20} | {message}",
     )
 
-    # File sink with detailed format
+    # Structured JSON-lines sink carrying the full record at the file level
     logger.add(
-        log_path,
+        log_dir / f"{log_name}.jsonl",
         level=file_level,
         rotation=rotation,
         retention=retention,
-        enqueue=True,
-        backtrace=True,
-        diagnose=True,
+        enqueue=enqueue,
+        backtrace=diagnose,
+        diagnose=diagnose,
+        serialize=True,
+    )
+
+    # Human-readable file sink for warnings and above
+    logger.add(
+        log_path,
+        level=text_level,
+        rotation=rotation,
+        retention=retention,
+        enqueue=enqueue,
+        backtrace=diagnose,
+        diagnose=diagnose,
         format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {extra[component]: <20} | {name}:{line} | {message}",
     )
 
@@ -3,35 +3,35 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import copy
+import functools
+import hashlib
 import importlib
 import logging
 import os
 import pkgutil
-import re
 import sys
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
 
-import yaml
 from loguru import logger
 
-from dotenv import load_dotenv
-from optionscanner.logging_utils import configure_logging, LoggingContext
-from optionscanner.execution import (
-    PortfolioActionExecutor,
-    PortfolioExecutionConfig,
-    TradeExecutionConfig,
-    TradeExecutor,
-)
-from optionscanner.market_hours import MarketHoursChecker
-from optionscanner.notifications import SlackNotifier
-from optionscanner.option_data import IBKRDataFetcher, MARKET_DATA_TYPE_CODES
-from optionscanner.portfolio.manager import PortfolioManager
-from optionscanner.runner import run_once, run_scheduler
-from optionscanner.strategies.base import BaseOptionStrategy
-from optionscanner.stock_data import StockDataFetcher
-from optionscanner.technical_indicators import TechnicalIndicatorProcessor
+from optionscanner import jsonio
+from optionscanner.env import env_flag
+from optionscanner.event_loop import event_loop_runner
+from optionscanner.market_hours import MARKET_DATA_TYPE_CODES, MarketHoursChecker
+
+# Heavy dependencies (yaml, pandas, ib_async, nautilus, Gemini) are imported
+# inside the functions that need them so ``--help`` and config checks start fast.
+if TYPE_CHECKING:
+    from optionscanner.execution import PortfolioActionExecutor
+    from optionscanner.option_data import IBKRDataFetcher
+    from optionscanner.stock_data import StockDataFetcher
+    from optionscanner.strategies.base import BaseOptionStrategy
+    from optionscanner.technical_indicators import TechnicalIndicatorProcessor
 
 
 logging.basicConfig(
@@ -49,44 +49,249 @@ class RunMode(str, Enum):
     SCHEDULED = "schedule"
 
 
+@dataclass(frozen=True, slots=True)
+class IBKRConnectionSettings:
+    """Resolved IBKR gateway connection parameters."""
+
+    host: str
+    port: int
+    client_id: int
+
+    @classmethod
+    def from_config(
+        cls, ibkr_settings: Mapping[str, Any], env: Mapping[str, str]
+    ) -> "IBKRConnectionSettings":
+        """Resolve settings with precedence config > environment > defaults."""
+        host = ibkr_settings.get("host") or env.get("IBKR_HOST", "ib-gateway")
+        port = ibkr_settings.get("port") or env.get("IBKR_PORT", 4004)
+        client_id = ibkr_settings.get("client_id")
+        if client_id is None:
+            client_id_env = env.get("IBKR_CLIENT_ID") or env.get("IAPI_CLIENT_ID") or ""
+            client_id = client_id_env.strip() or "1"
+
+        try:
+            port_int = int(port)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(
+                f"Invalid IBKR port '{port}'. Set 'ibkr.port' in the configuration."
+            ) from exc
+        try:
+            client_id_int = int(client_id)
+        except (TypeError, ValueError):
+            logger.warning("Invalid client_id '{client_id}', defaulting to 1", client_id=client_id)
+            client_id_int = 1
+        return cls(host=str(host), port=port_int, client_id=client_id_int)
+
+
+_RUN_MODE_CHOICES = tuple(mode.value for mode in RunMode)
+_MARKET_DATA_CHOICES = tuple(sorted(MARKET_DATA_TYPE_CODES))
+
+
+_CONFIG_CACHE_MAX_ENTRIES = 32
+_CONFIG_CACHE: "OrderedDict[tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+
+
 def load_config(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Load a YAML config, reusing the parsed result while the file is unchanged.
+
+    Parsed configs are kept in-process and in a JSON sidecar next to the
+    YAML file (``config.yaml.json``) so later processes skip the YAML parse.
+    Callers receive a deep copy so mutating the returned mapping never leaks
+    into the cache.
+    """
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        _CONFIG_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    sidecar_path = path.with_name(f"{path.name}.json")
+    config = _read_config_sidecar(sidecar_path, stat)
+    if config is None:
+        import yaml
+
+        try:
+            loader = yaml.CSafeLoader
+        except AttributeError:  # pragma: no cover - PyYAML built without libyaml
+            loader = yaml.SafeLoader
+        with path.open("r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=loader)
+        _write_config_sidecar(sidecar_path, stat, config)
+
+    _CONFIG_CACHE[key] = config
+    while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+        _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
+
+def _read_config_sidecar(sidecar_path: Path, source_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    try:
+        payload = jsonio.loads(sidecar_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if (
+        payload.get("source_mtime_ns") != source_stat.st_mtime_ns
+        or payload.get("source_size") != source_stat.st_size
+    ):
+        return None
+    return payload.get("config")
+
+
+def _write_config_sidecar(sidecar_path: Path, source_stat: os.stat_result, config: Any) -> None:
+    try:
+        encoded = jsonio.dumps(config)
+    except (TypeError, ValueError):
+        return
+    # YAML-only types (dates, non-string keys) would not survive the round trip.
+    if jsonio.loads(encoded) != config:
+        return
+    header = f'{{"source_mtime_ns":{source_stat.st_mtime_ns},"source_size":{source_stat.st_size},"config":'
+    payload = header.encode("utf-8") + encoded + b"}"
+    tmp_path = sidecar_path.with_name(f"{sidecar_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as exc:
+        logger.debug(
+            "Unable to write config cache | path={path} reason={error}",
+            path=str(sidecar_path),
+            error=exc,
+        )
+
+
+_STRATEGY_DIR = Path(__file__).parent / "strategies"
 
 
 def discover_strategies(overrides: Optional[Dict[str, Any]] = None) -> List[BaseOptionStrategy]:
-    strategy_dir = Path(__file__).parent / "strategies"
-    strategies: List[BaseOptionStrategy] = []
     overrides = overrides or {}
-    for module_info in pkgutil.iter_modules([str(strategy_dir)]):
-        if not module_info.name.startswith("strategy_"):
+    sources = _strategy_source_mtimes()
+    try:
+        enabled = _enabled_strategy_classes(_discover_strategy_classes(sources), overrides)
+    except (ImportError, AttributeError) as exc:
+        logger.warning(
+            "Strategy registry entry could not be loaded; scanning strategy modules instead | reason={error}",
+            error=exc,
+        )
+        enabled = _enabled_strategy_classes(_discover_strategy_classes(sources, use_registry=False), overrides)
+    strategies: List[BaseOptionStrategy] = []
+    for class_name, obj, config in enabled:
+        kwargs = _extract_strategy_params(config)
+        try:
+            strategies.append(obj(**kwargs))
+        except TypeError as exc:
+            logger.error(
+                "Failed to instantiate strategy {name}: {error}",
+                name=class_name,
+                error=exc,
+            )
+    logger.info("Loaded {count} strategies", count=len(strategies))
+    return strategies
+
+
+def _enabled_strategy_classes(
+    entries: Sequence[Tuple[str, str, Optional[Type[BaseOptionStrategy]]]],
+    overrides: Dict[str, Any],
+) -> List[Tuple[str, Type[BaseOptionStrategy], Optional[Dict[str, Any]]]]:
+    """Resolve the enabled entries to ``(class name, class, config)`` triples.
+
+    Registry entries are imported only once they are known to be enabled, so a
+    registry naming a module or class that no longer exists raises here.
+    """
+    enabled: List[Tuple[str, Type[BaseOptionStrategy], Optional[Dict[str, Any]]]] = []
+    for module_name, class_name, loaded in entries:
+        config = _resolve_strategy_config(overrides, class_name)
+        if config is not None and not bool(config.get("enabled", True)):
+            logger.info(
+                "Skipping disabled strategy {name}",
+                name=class_name,
+            )
             continue
-        module = importlib.import_module(f"optionscanner.strategies.{module_info.name}")
-        for attr in dir(module):
-            obj = getattr(module, attr)
+        obj = loaded or getattr(sys.modules.get(module_name) or importlib.import_module(module_name), class_name)
+        enabled.append((class_name, obj, config))
+    return enabled
+
+
+def _strategy_source_mtimes() -> Tuple[Tuple[str, int], ...]:
+    """Return ``(file name, mtime_ns)`` for every module in the strategies package."""
+    return tuple(sorted((path.name, path.stat().st_mtime_ns) for path in _STRATEGY_DIR.glob("*.py")))
+
+
+@functools.lru_cache(maxsize=2)
+def _discover_strategy_classes(
+    source_mtimes: Tuple[Tuple[str, int], ...],
+    use_registry: bool = True,
+) -> Tuple[Tuple[str, str, Optional[Type[BaseOptionStrategy]]], ...]:
+    """Resolve ``(module, class name, class)`` entries, preferring the generated registry.
+
+    ``strategies/_registry.py`` (written by ``tools/gen_strategy_registry.py``)
+    lists the classes explicitly, so its entries are returned without a class
+    and imported only when the strategy is enabled. It is trusted only when it
+    names exactly the ``strategy_*`` modules on disk and its ``SOURCE_DIGEST``
+    matches their contents; an edited module may have renamed or added a
+    class, so anything else falls back to scanning the modules. File mtimes
+    are not compared because a git checkout writes files in index order.
+    ``source_mtimes`` is only the cache key, so adding, removing, or editing a
+    strategy module triggers a fresh resolution.
+    """
+    module_names = _strategy_module_names()
+    if use_registry:
+        try:
+            from optionscanner.strategies._registry import SOURCE_DIGEST, STRATEGY_CLASSES
+        except ImportError:
+            SOURCE_DIGEST, STRATEGY_CLASSES = "", ()
+        if STRATEGY_CLASSES:
+            if _registry_is_current(STRATEGY_CLASSES, SOURCE_DIGEST, module_names):
+                return tuple((module, class_name, None) for module, class_name in STRATEGY_CLASSES)
+            logger.warning("Strategy registry is stale; scanning strategy modules instead")
+    return tuple((cls.__module__, cls.__name__, cls) for cls in _scan_strategy_classes(module_names))
+
+
+def _registry_is_current(
+    registry: Sequence[Tuple[str, str]],
+    registry_digest: str,
+    module_names: Sequence[str],
+) -> bool:
+    if {module for module, _ in registry} != set(module_names):
+        return False
+    return registry_digest == _strategy_source_digest(module_names)
+
+
+def _strategy_source_digest(module_names: Sequence[str]) -> str:
+    """Hash the source of the ``strategy_*`` modules, as recorded in the registry."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module_name in sorted(module_names):
+        file_name = f"{module_name.rsplit('.', 1)[-1]}.py"
+        digest.update(file_name.encode("utf-8"))
+        digest.update((_STRATEGY_DIR / file_name).read_bytes())
+    return digest.hexdigest()
+
+
+def _strategy_module_names() -> List[str]:
+    return [
+        f"optionscanner.strategies.{module_info.name}"
+        for module_info in pkgutil.iter_modules([str(_STRATEGY_DIR)])
+        if module_info.name.startswith("strategy_")
+    ]
+
+
+def _scan_strategy_classes(module_names: Sequence[str]) -> Tuple[Type[BaseOptionStrategy], ...]:
+    """Import ``module_names`` and collect the strategy classes they define."""
+    from optionscanner.strategies.base import BaseOptionStrategy
+
+    classes: List[Type[BaseOptionStrategy]] = []
+    for module_name in module_names:
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        for obj in vars(module).values():
             if (
                 isinstance(obj, type)
-                and issubclass(obj, BaseOptionStrategy)
                 and obj is not BaseOptionStrategy
+                and issubclass(obj, BaseOptionStrategy)
             ):
-                config = _resolve_strategy_config(overrides, obj.__name__)
-                if config is not None and not bool(config.get("enabled", True)):
-                    logger.info(
-                        "Skipping disabled strategy {name}",
-                        name=obj.__name__,
-                    )
-                    continue
-                kwargs = _extract_strategy_params(config)
-                try:
-                    strategies.append(obj(**kwargs))
-                except TypeError as exc:
-                    logger.error(
-                        "Failed to instantiate strategy {name}: {error}",
-                        name=obj.__name__,
-                        error=exc,
-                    )
-    logger.info("Loaded {count} strategies", count=len(strategies))
-    return strategies
+                classes.append(obj)
+    return tuple(classes)
 
 
 def _resolve_strategy_config(overrides: Dict[str, Any], class_name: str) -> Optional[Dict[str, Any]]:
@@ -111,24 +316,27 @@ def _extract_strategy_params(config: Optional[Dict[str, Any]]) -> Dict[str, Any]
     return {k: v for k, v in config.items() if k != "enabled"}
 
 
-_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
-
-
+@functools.lru_cache(maxsize=256)
 def _camel_to_snake(name: str) -> str:
-    return _CAMEL_RE.sub("_", name).lower()
+    parts: List[str] = []
+    for index, char in enumerate(name):
+        if index and "A" <= char <= "Z":
+            parts.append("_")
+        parts.append(char.lower())
+    return "".join(parts)
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the Nautilus option scanner.")
     parser.add_argument(
         "--run-mode",
-        choices=[RunMode.LOCAL_IMMEDIATE.value, RunMode.SCHEDULED.value],
+        choices=_RUN_MODE_CHOICES,
         default=RunMode.LOCAL_IMMEDIATE.value,
         help="Select how the scanner executes: local (single run) or schedule (loop on configured times).",
     )
     parser.add_argument(
         "--market-data",
-        choices=sorted(MARKET_DATA_TYPE_CODES.keys()),
+        choices=_MARKET_DATA_CHOICES,
         default="LIVE",
         help="Market data type requested from IBKR when using live data fetchers (LIVE, FROZEN, or AUTO). "
              "AUTO automatically selects LIVE during market hours (6:30 AM - 1:00 PM PT weekdays) "
@@ -176,6 +384,8 @@ def execute_portfolio_manager(
     portfolio_executor: Optional[PortfolioActionExecutor] = None,
 ) -> None:
     """Run the portfolio manager workflow with the provided fetcher."""
+    from optionscanner.portfolio.manager import PortfolioManager
+
     try:
         slack_config = portfolio_config.get("slack") or portfolio_config.get("notifications")
         enable_gemini = bool(portfolio_config.get("enable_gemini", True))
@@ -199,9 +409,36 @@ def execute_portfolio_manager(
         logger.exception("Portfolio manager execution failed")
 
 
+def _disconnect_all(runner: asyncio.Runner, *clients: Any) -> None:
+    """Close every IBKR client opened for this process on ``runner``'s loop."""
+    for client in clients:
+        if client is None:
+            continue
+        try:
+            runner.run(client.disconnect())
+        except Exception:
+            logger.warning(
+                "Failed to cleanly disconnect {client}",
+                client=type(client).__name__,
+            )
+
+
 def main(argv: Optional[List[str]] = None) -> None:
-    load_dotenv()
     args = parse_args(argv)
+
+    from dotenv import load_dotenv
+
+    from optionscanner.execution import (
+        PortfolioActionExecutor,
+        PortfolioExecutionConfig,
+        TradeExecutionConfig,
+        TradeExecutor,
+    )
+    from optionscanner.logging_utils import configure_logging
+    from optionscanner.notifications import SlackNotifier
+    from optionscanner.option_data import IBKRDataFetcher
+
+    load_dotenv()
     run_mode = RunMode(args.run_mode)
     os.environ.setdefault("APP_RUN_MODE", run_mode.value)
     config = load_config(args.config)
@@ -247,38 +484,24 @@ def main(argv: Optional[List[str]] = None) -> None:
     portfolio_settings.setdefault("enable_gemini", enable_gemini)
     if "slack" not in portfolio_settings and config.get("slack"):
         portfolio_settings["slack"] = config.get("slack")
-    host = ibkr_settings.get("host") or os.getenv("IBKR_HOST", "ib-gateway")
-    port = ibkr_settings.get("port") or os.getenv("IBKR_PORT", 4004)
-
-    # Get client ID with fallback chain: config > env var > default of 1
-    client_id = ibkr_settings.get("client_id")
-    if client_id is None:
-        client_id_env = os.getenv("IBKR_CLIENT_ID") or os.getenv("IAPI_CLIENT_ID") or ""
-        client_id = client_id_env.strip() or "1"
+    env = os.environ.copy()
+    connection = IBKRConnectionSettings.from_config(ibkr_settings, env)
 
     disable_portfolio_manager = (
-        os.getenv("DISABLE_PORTFOLIO_MANAGER", "").strip().lower() in {"1", "true", "yes", "on"}
+        env_flag("DISABLE_PORTFOLIO_MANAGER", env)
     )
 
-    if port is None:
-        raise ValueError("IBKR port is not configured. Set 'ibkr.port' in the configuration.")
-
-    # Validate and convert client_id to int
-    try:
-        client_id_int = int(client_id)
-    except ValueError:
-        logger.warning("Invalid client_id '%s', defaulting to 1", client_id)
-        client_id_int = 1
-
     # Resolve market data type (handles AUTO mode)
     resolved_market_data = resolve_market_data_type(args.market_data)
 
     fetcher = IBKRDataFetcher(
-        host=host,
-        port=int(port),
-        client_id=client_id_int,
+        host=connection.host,
+        port=connection.port,
+        client_id=connection.client_id,
         data_dir=data_dir,
         market_data_type=resolved_market_data,
+        fetch_mode=str(ibkr_settings.get("fetch_mode", "full")),
+        history_csv=bool(config.get("history_csv", True)),
     )
     if trade_exec_config.enabled:
         trade_executor = TradeExecutor(fetcher.ib, trade_exec_config, slack_notifier)
@@ -290,9 +513,12 @@ def main(argv: Optional[List[str]] = None) -> None:
     stock_history_kwargs: Dict[str, Any] = {}
     stock_data_settings = config.get("stock_data") or {}
     if stock_data_settings.get("enabled"):
-        stock_host = stock_data_settings.get("host", host)
-        stock_port = int(stock_data_settings.get("port", port))
-        base_client_id = client_id_int
+        from optionscanner.stock_data import StockDataFetcher
+        from optionscanner.technical_indicators import TechnicalIndicatorProcessor
+
+        stock_host = stock_data_settings.get("host", connection.host)
+        stock_port = int(stock_data_settings.get("port", connection.port))
+        base_client_id = connection.client_id
         stock_client_id = stock_data_settings.get("client_id")
         if stock_client_id is None:
             client_id_offset = int(stock_data_settings.get("client_id_offset", 50))
@@ -309,6 +535,7 @@ def main(argv: Optional[List[str]] = None) -> None:
             exchange=stock_data_settings.get("exchange", "SMART"),
             currency=stock_data_settings.get("currency", "USD"),
             history_dir=Path(history_dir_setting) if history_dir_setting else None,
+            max_concurrent_requests=int(stock_data_settings.get("max_concurrent_requests", 6)),
         )
         indicator_processor = TechnicalIndicatorProcessor()
         extra_periods = stock_data_settings.get("extra_ma_periods") or []
@@ -341,59 +568,74 @@ def main(argv: Optional[List[str]] = None) -> None:
     post_run = maybe_run_portfolio_manager if not disable_portfolio_manager else None
 
     if run_mode is RunMode.SCHEDULED:
+        from optionscanner.runner import run_scheduler
+
         logger.info("Scheduled mode enabled; running on configured schedule.")
         run_signals = not portfolio_only
-        try:
-            asyncio.run(
-                run_scheduler(
-                    config,
-                    fetcher,
-                    strategies,
-                    symbols,
-                    results_dir,
-                    slack_notifier,
-                    enable_gemini=enable_gemini,
-                    run_signals=run_signals,
-                    stock_fetcher=stock_fetcher,
-                    indicator_processor=indicator_processor,
-                    stock_history_kwargs=stock_history_kwargs,
-                    trade_executor=trade_executor,
-                    post_run=post_run if portfolio_only or not disable_portfolio_manager else None,
+        # The IBKR connection stays open (with a heartbeat) across scheduled
+        # runs and is only closed when the scheduler exits.
+        with event_loop_runner() as runner:
+            try:
+                runner.run(
+                    run_scheduler(
+                        config,
+                        fetcher,
+                        strategies,
+                        symbols,
+                        results_dir,
+                        slack_notifier,
+                        enable_gemini=enable_gemini,
+                        run_signals=run_signals,
+                        stock_fetcher=stock_fetcher,
+                        indicator_processor=indicator_processor,
+                        stock_history_kwargs=stock_history_kwargs,
+                        trade_executor=trade_executor,
+                        post_run=post_run if portfolio_only or not disable_portfolio_manager else None,
+                    )
                 )
-            )
-        except KeyboardInterrupt:
-            logger.info("Shutdown requested by user")
+            except KeyboardInterrupt:
+                logger.info("Shutdown requested by user")
+            finally:
+                _disconnect_all(runner, fetcher, stock_fetcher)
+                slack_notifier.close()
         return
 
     if portfolio_only:
         logger.info("Portfolio-only mode enabled; skipping option scanner execution.")
-        try:
-            asyncio.run(fetcher.connect())
-            execute_portfolio_manager(fetcher, portfolio_settings, portfolio_executor)
-        finally:
+        with event_loop_runner() as runner:
             try:
-                asyncio.run(fetcher.disconnect())
-            except Exception:
-                logger.warning("Failed to cleanly disconnect IBKR after portfolio-only run")
+                runner.run(fetcher.connect())
+                execute_portfolio_manager(fetcher, portfolio_settings, portfolio_executor)
+            finally:
+                _disconnect_all(runner, fetcher)
         return
 
+    from optionscanner.runner import run_once
+
     try:
-        asyncio.run(
-            run_once(
-                fetcher,
-                strategies,
-                symbols,
-                results_dir,
-                slack_notifier=slack_notifier,
-                enable_gemini=enable_gemini,
-                stock_fetcher=stock_fetcher,
-                indicator_processor=indicator_processor,
-                stock_history_kwargs=stock_history_kwargs,
-                trade_executor=trade_executor,
-                config=config,
-            )
-        )
-        maybe_run_portfolio_manager(fetcher)
+        # One loop for the scan and the portfolio manager so the latter reuses
+        # the IBKR connection opened during the scan.
+        with event_loop_runner() as runner:
+            try:
+                runner.run(
+                    run_once(
+                        fetcher,
+                        strategies,
+                        symbols,
+                        results_dir,
+                        slack_notifier=slack_notifier,
+                        enable_gemini=enable_gemini,
+                        stock_fetcher=stock_fetcher,
+                        indicator_processor=indicator_processor,
+                        stock_history_kwargs=stock_history_kwargs,
+                        trade_executor=trade_executor,
+                        config=config,
+                    )
+                )
+                maybe_run_portfolio_manager()
+            finally:
+                _disconnect_all(runner, fetcher, stock_fetcher)
+                slack_notifier.close()
     except KeyboardInterrupt:
         logger.info("Shutdown requested by user")
 
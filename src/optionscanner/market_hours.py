@@ -12,6 +12,12 @@ Market Hours:
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+MARKET_DATA_TYPE_CODES = {
+    "LIVE": 1,
+    "FROZEN": 2,
+    "AUTO": None,  # Resolved at runtime based on market hours
+}
+
 
 class MarketHoursChecker:
     """Determines if the market is currently open and provides related utilities."""
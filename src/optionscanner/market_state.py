@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Iterable, Optional, Protocol
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -12,6 +13,10 @@ from optionscanner.technical_indicators import TechnicalIndicatorProcessor
 from optionscanner.stock_data import StockDataFetcher
 
 
+_REQUIRED_COLUMNS = ("close", "ma5", "ma10", "ma30")
+_REQUIRED_COLUMNS_SET = frozenset(_REQUIRED_COLUMNS)
+
+
 class MarketState(str, Enum):
     """Enumeration of supported market states."""
 
@@ -43,32 +48,29 @@ class MarketStateClassifier:
     def classify(self, history: pd.DataFrame, symbol: Optional[str] = None) -> Optional[MarketStateResult]:
         if history is None or history.empty:
             return None
-        required_cols = {"close", "ma5", "ma10", "ma30"}
-        if not required_cols.issubset(history.columns):
+        if not _REQUIRED_COLUMNS_SET.issubset(history.columns):
             return None
-        filtered = history.dropna(subset=list(required_cols))
-        if filtered.empty:
+        values = history[list(_REQUIRED_COLUMNS)].to_numpy(np.float64)
+        complete = np.flatnonzero(~np.isnan(values).any(axis=1))
+        if not complete.size:
             return None
-        latest = filtered.iloc[-1]
-        close = float(latest["close"])
-        ma5 = float(latest["ma5"])
-        ma10 = float(latest["ma10"])
-        ma30 = float(latest["ma30"])
+        row = int(complete[-1])
+        close, ma5, ma10, ma30 = values[row].tolist()
         if close > ma5 > ma10 > ma30:
             state = MarketState.BULL
         elif close > ma30 and ma5 > ma10 > ma30:
             state = MarketState.UPTREND
         else:
             state = MarketState.BEAR
-        timestamp_value = latest.get("timestamp")
+        timestamp_value = history["timestamp"].iat[row] if "timestamp" in history.columns else None
         if pd.isna(timestamp_value):
-            timestamp_value = filtered.index[-1]
+            timestamp_value = history.index[row]
         timestamp = pd.to_datetime(timestamp_value)
         if getattr(timestamp, "tzinfo", None) is None:
             timestamp = timestamp.tz_localize("UTC")
         else:
             timestamp = timestamp.tz_convert("UTC")
-        resolved_symbol = symbol or str(latest.get("symbol", ""))
+        resolved_symbol = symbol or (str(history["symbol"].iat[row]) if "symbol" in history.columns else "")
         result = MarketStateResult(symbol=resolved_symbol, state=state, as_of=timestamp, close=close)
         logger.info(
             "Market state classified | symbol={symbol} state={state} close={close:.2f} ma5={ma5:.2f} ma10={ma10:.2f} ma30={ma30:.2f} timestamp={timestamp}",
@@ -113,12 +115,14 @@ class StockMarketStateProvider(MarketStateProvider):
     async def refresh(self, symbols: Iterable[str], **history_kwargs: Any) -> Dict[str, Optional[MarketStateResult]]:
         """Download the latest data for ``symbols`` and update the cache."""
 
+        symbols = list(symbols)
+        logger.info("Refreshing market state | symbols={symbols}", symbols=",".join(symbols))
+        histories = await self._fetcher.fetch_history_many(symbols, **history_kwargs)
         results: Dict[str, Optional[MarketStateResult]] = {}
-        for symbol in symbols:
-            logger.info("Refreshing market state | symbol={symbol}", symbol=symbol)
-            history = await self._fetcher.fetch_history(symbol, **history_kwargs)
-            enriched = self._processor.process(history)
-            result = self._classifier.classify(enriched, symbol=symbol)
+        for symbol, history in histories.items():
+            result = None
+            if not history.empty:
+                result = self._classifier.classify(self._processor.process(history), symbol=symbol)
             if result:
                 self._cache[symbol.upper()] = result
                 logger.info(
@@ -1,26 +1,134 @@
 """Slack notification utilities for formatted trade signal delivery."""
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Union
 
-import pandas as pd
-import yaml
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from optionscanner.signal_ranking import SignalScore
+from optionscanner import jsonio
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from optionscanner.market_context import MarketContextProvider
+    from optionscanner.signal_ranking import SignalScore
 
 
 PostCallable = Callable[[str, Dict[str, object]], None]
 
+# Signal columns read by _iter_signal_lines; absent ones simply render nothing.
+_SUMMARY_COLUMNS = (
+    "symbol",
+    "strategy",
+    "action",
+    "direction",
+    "option_type",
+    "strike",
+    "expiry",
+    "confidence",
+    "legs",
+    "explanation",
+    "validation",
+)
+
+SignalRows = Union["pd.DataFrame", Sequence[Mapping[str, object]]]
+
+
+def _is_frame(signals: object) -> bool:
+    # pandas is imported lazily: if it was never loaded, nothing can be a DataFrame.
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(signals, pandas.DataFrame)
+
+
+def _signal_records(signals: SignalRows) -> Sequence[Mapping[str, object]]:
+    """Return ``signals`` as row mappings, converting only the summary columns of a frame."""
+    if not _is_frame(signals):
+        return signals
+    rendered = signals[[column for column in _SUMMARY_COLUMNS if column in signals.columns]]
+    if not len(rendered.columns):
+        return [{}] * len(rendered)
+    return rendered.to_dict("records")
+
+
+# Statuses meaning the webhook itself was revoked or removed; they pause posting
+# for _CLIENT_ERROR_COOL_DOWN_SECONDS. A 429 pauses for its Retry-After instead.
+_WEBHOOK_GONE_STATUSES = frozenset({403, 404, 410})
+_CLIENT_ERROR_COOL_DOWN_SECONDS = 300.0
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _webhook_session() -> requests.Session:
+    """Return the process-wide webhook session, creating it on first use.
+
+    Every notifier shares it, so a new notifier (one per portfolio report, for
+    example) reuses warm keep-alive connections instead of redoing DNS and TLS.
+    Only connection failures are retried; a POST that reached Slack is never
+    resent, so messages cannot be duplicated.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2)
+            adapter = HTTPAdapter(pool_maxsize=8, max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+_SECRET_FILES = (
+    Path("config/secrets.yaml"),
+    Path("secrets.yaml"),
+    Path(".secrets.yaml"),
+)
+
+
+_PLACEHOLDER_TOKENS = ("XXX", "YYY", "ZZ", "ZZZ")
+
+# A top-level ``slack_webhook_url: <url>`` line, the layout checked first by
+# _extract_webhook_from_data; a plain URL value needs no YAML parse.
+_DIRECT_WEBHOOK_LINE = re.compile(
+    r"""^slack_webhook_url:[ \t]*(["']?)(https?://[^\s"'#]+)\1[ \t]*(?:#.*)?$""",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_secret_file(path: str, mtime_ns: int, size: int) -> object:
+    """Parse a secrets file once per on-disk version; the stat fields are the cache key."""
+    with open(path, "r", encoding="utf-8") as fh:
+        text = fh.read()
+    matches = _DIRECT_WEBHOOK_LINE.findall(text)
+    # YAML keeps the last duplicate key, so mirror that; placeholders fall
+    # through so the nested sections are still consulted.
+    if matches and not any(token in matches[-1][1] for token in _PLACEHOLDER_TOKENS):
+        return {"slack_webhook_url": matches[-1][1]}
+    import yaml
+
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:  # pragma: no cover - PyYAML built without libyaml
+        loader = yaml.SafeLoader
+    return yaml.load(text, Loader=loader) or {}
+
 
 @dataclass(slots=True)
 class SlackSettings:
@@ -33,9 +141,19 @@ class SlackSettings:
     timeout: float = 10.0
 
 
+class SlackClientError(RuntimeError):
+    """Slack rejected a webhook post with a 4xx status.
+
+    Posting is paused for a while when the webhook is gone (403/404/410) or
+    rate limited (429); other 4xx statuses fail only the rejected message.
+    """
+
+
 class SlackNotifier:
     """Formats DataFrame results and delivers them via Slack webhooks."""
 
+    __slots__ = ("enabled", "title", "max_rows", "settings", "_payload_base", "_post", "_executor", "_cool_down_until")
+
     def __init__(self, config: Optional[dict], post: Optional[PostCallable] = None) -> None:
         config = config or {}
         self.enabled: bool = bool(config.get("enabled", False))
@@ -50,21 +168,72 @@ class SlackNotifier:
             timeout=float(config.get("timeout", 10.0)),
         )
         self.settings = settings
+        # The sender fields never change after construction; every payload starts from them.
+        self._payload_base: Dict[str, object] = {
+            key: value
+            for key, value in (
+                ("username", settings.username),
+                ("channel", settings.channel),
+                ("icon_emoji", settings.icon_emoji),
+            )
+            if value
+        }
         self._post: PostCallable = post or self._post_to_slack
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cool_down_until = 0.0
+
+    async def send_ai_and_quant_signals_async(
+        self,
+        ai_selections: List[tuple],
+        ai_reasons: Dict[str, str],
+        quant_picks: List[SignalScore],
+        csv_path: Optional[Path] = None,
+        market_context: Optional[MarketContextProvider] = None,
+    ) -> None:
+        """Awaitable :meth:`send_ai_and_quant_signals` that posts on the notifier's own thread."""
+        await self._run_blocking(
+            self.send_ai_and_quant_signals, ai_selections, ai_reasons, quant_picks, csv_path, market_context
+        )
+
+    def close(self) -> None:
+        """Release the posting thread, if one was started.
+
+        The webhook session is shared by every notifier in the process and stays open.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _cooling_down(self) -> bool:
+        return time.monotonic() < self._cool_down_until
 
-    def send_signals(self, df: pd.DataFrame, csv_path: Optional[Path] = None) -> None:
-        """Send each signal as an individual Slack message when enabled."""
+    async def _run_blocking(self, func: Callable[..., None], *args: object) -> None:
+        # Webhook round-trips block on the network; keep them on a dedicated
+        # single thread so they never occupy the loop's default executor.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="slack-post")
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    def send_signals(self, signals: SignalRows, csv_path: Optional[Path] = None) -> None:
+        """Send each signal as an individual Slack message when enabled.
+
+        ``signals`` may be a DataFrame or a sequence of row mappings.
+        """
         if not self.enabled:
             logger.debug("Slack notifications are disabled; skipping send.")
             return
         if not self.settings.webhook_url:
-            logger.warning("Slack webhook URL is not configured; skipping notification.")
+            logger.warning("Slack notifications enabled but webhook URL is missing; skipping send.")
+            return
+        if self._cooling_down():
+            logger.warning("Slack webhook is paused (removed or rate limited); skipping notification.")
             return
-        if df.empty:
+        if signals.empty if _is_frame(signals) else not signals:
             logger.info("No signals to send to Slack.")
             return
 
-        for _, row in df.iterrows():
+        for row in _signal_records(signals):
             message = self._build_signal_message(row, csv_path)
             payload = self._build_payload(message)
             try:
@@ -94,6 +263,9 @@ class SlackNotifier:
         if not self.settings.webhook_url:
             logger.warning("Slack webhook URL is not configured; skipping notification.")
             return
+        if self._cooling_down():
+            logger.warning("Slack webhook is paused (removed or rate limited); skipping notification.")
+            return
         if not ranked_signals:
             logger.info("No ranked signals to send to Slack.")
             return
@@ -129,6 +301,9 @@ class SlackNotifier:
         if not self.settings.webhook_url:
             logger.warning("Slack webhook URL is not configured; skipping notification.")
             return
+        if self._cooling_down():
+            logger.warning("Slack webhook is paused (removed or rate limited); skipping notification.")
+            return
         if not ai_selections and not quant_picks:
             logger.info("No signals to send to Slack.")
             return
@@ -481,58 +656,82 @@ class SlackNotifier:
         return lines
 
     def _build_payload(self, message: str) -> Dict[str, object]:
-        payload: Dict[str, object] = {"text": message}
-        if self.settings.username:
-            payload["username"] = self.settings.username
-        if self.settings.channel:
-            payload["channel"] = self.settings.channel
-        if self.settings.icon_emoji:
-            payload["icon_emoji"] = self.settings.icon_emoji
-        return payload
-
-    def _build_signal_message(self, row: pd.Series, csv_path: Optional[Path]) -> str:
+        return {"text": message, **self._payload_base}
+
+    def _build_signal_message(self, row: Mapping[str, object], csv_path: Optional[Path]) -> str:
         lines: List[str] = [self.title]
-        summary_fields = {
-            "Symbol": row.get("symbol"),
-            "Strategy": row.get("strategy"),
-            "Action": row.get("action") or row.get("direction"),
-            "Option": f"{row.get('option_type')} {row.get('strike')} exp {row.get('expiry')}".strip(),
-            "Confidence": row.get("confidence"),
-        }
-        for label, value in summary_fields.items():
-            if value not in (None, ""):
-                lines.append(f"{label}: {value}")
-        legs = row.get("legs")
-        leg_lines = self._format_legs(legs)
-        if leg_lines:
-            lines.append("")
-            lines.append("Legs:")
-            lines.extend(leg_lines)
-        explanation = row.get("explanation")
-        if explanation:
-            lines.append("")
-            lines.append("Explanation:")
-            lines.append(str(explanation))
-        validation = row.get("validation")
-        if validation:
-            lines.append("")
-            lines.append("Validation:")
-            lines.append(str(validation))
+        lines.extend(self._iter_signal_lines(row))
         if csv_path:
             lines.append("")
             lines.append(f"CSV saved to {csv_path}")
         return "\n".join(lines)
 
+    def _iter_signal_lines(self, row: Mapping[str, object]) -> Iterator[str]:
+        """Yield the message lines for one signal row, skipping empty fields."""
+        get = row.get
+        for label, value in (
+            ("Symbol", get("symbol")),
+            ("Strategy", get("strategy")),
+            ("Action", get("action") or get("direction")),
+            ("Option", self._format_option(get("option_type"), get("strike"), get("expiry"))),
+            ("Confidence", get("confidence")),
+        ):
+            if value not in (None, ""):
+                yield f"{label}: {value}"
+        leg_lines = self._format_legs(get("legs"))
+        if leg_lines:
+            yield ""
+            yield "Legs:"
+            yield from leg_lines
+        for label, key in (("Explanation:", "explanation"), ("Validation:", "validation")):
+            value = get(key)
+            if value:
+                yield ""
+                yield label
+                yield str(value)
+
+    @staticmethod
+    def _format_option(option_type: object, strike: object, expiry: object) -> str:
+        """Join the option fields that are present; missing ones (None, "", NaN) are left out."""
+        parts = []
+        if option_type not in (None, "") and option_type == option_type:
+            parts.append(str(option_type))
+        if strike not in (None, "") and strike == strike:
+            parts.append(str(strike))
+        if expiry not in (None, "") and expiry == expiry:
+            parts.append(f"exp {expiry}")
+        return " ".join(parts)
+
     def _post_to_slack(self, url: str, payload: Dict[str, object]) -> None:
-        data = json.dumps(payload).encode("utf-8")
-        request = Request(url, data=data, headers={"Content-Type": "application/json"})
+        if self._cooling_down():
+            raise SlackClientError("Slack webhook is paused (removed or rate limited)")
+        data = jsonio.dumps(payload)
         try:
-            with urlopen(request, timeout=self.settings.timeout) as response:
-                status = getattr(response, "status", response.getcode())
-                if status < 200 or status >= 300:
-                    raise RuntimeError(f"Slack webhook responded with status {status}")
-        except (HTTPError, URLError) as exc:
+            response = _webhook_session().post(
+                url,
+                data=data,
+                headers=_JSON_HEADERS,
+                timeout=self.settings.timeout,
+            )
+        except requests.RequestException as exc:
             raise RuntimeError("Slack webhook request failed") from exc
+        status = response.status_code
+        if status == 429 or status in _WEBHOOK_GONE_STATUSES:
+            # A removed webhook keeps failing and a rate limit asks us to back off;
+            # pause posting rather than sending doomed requests every cycle.
+            pause = _CLIENT_ERROR_COOL_DOWN_SECONDS
+            if status == 429:
+                try:
+                    pause = float(response.headers.get("Retry-After", pause))
+                except ValueError:
+                    pass
+            self._cool_down_until = time.monotonic() + pause
+            raise SlackClientError(f"Slack webhook responded with status {status}; pausing posts for {pause:.0f}s")
+        if 400 <= status < 500:
+            # Other client errors (e.g. 400 invalid_payload) are specific to this message.
+            raise SlackClientError(f"Slack webhook rejected the message with status {status}")
+        if status < 200 or status >= 300:
+            raise RuntimeError(f"Slack webhook responded with status {status}")
 
     def _resolve_webhook_url(self, config: Dict[str, object]) -> str:
         configured = str(config.get("webhook_url", "") or "").strip()
@@ -551,20 +750,16 @@ class SlackNotifier:
 
     def _is_placeholder_webhook(self, url: str) -> bool:
         """Detect sample/placeholder webhook strings so we can fall back to real secrets."""
-        return any(token in url for token in ("XXX", "YYY", "ZZ", "ZZZ"))
+        return any(token in url for token in _PLACEHOLDER_TOKENS)
 
     def _load_webhook_from_secrets(self) -> str:
-        candidates: Iterable[Path] = (
-            Path("config/secrets.yaml"),
-            Path("secrets.yaml"),
-            Path(".secrets.yaml"),
-        )
-        for path in candidates:
-            if not path.exists():
+        for path in _SECRET_FILES:
+            try:
+                stat = path.stat()
+            except OSError:
                 continue
             try:
-                with path.open("r", encoding="utf-8") as fh:
-                    data = yaml.safe_load(fh) or {}
+                data = _read_secret_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
             except Exception as exc:  # pragma: no cover - defensive logging
                 logger.warning(
                     "Unable to read Slack webhook secret file | path={path} reason={error}",
@@ -609,7 +804,7 @@ class SlackNotifier:
             ]
         elif isinstance(raw, str):
             try:
-                parsed = json.loads(raw)
+                parsed = jsonio.loads(raw)
                 if isinstance(parsed, list):
                     legs = [leg for leg in parsed if isinstance(leg, dict)]
             except Exception:
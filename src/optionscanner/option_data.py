@@ -2,23 +2,32 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import math
-from dataclasses import dataclass
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-from ib_async import Contract, IB, Option, Stock
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from ib_async import Contract, IB, Option, OptionChain, Stock, util
 from loguru import logger
 from zoneinfo import ZoneInfo
 
+from optionscanner import jsonio
+from optionscanner.market_hours import MARKET_DATA_TYPE_CODES
+from optionscanner.pacing import RequestPacer
 
-MARKET_DATA_TYPE_CODES = {
-    "LIVE": 1,
-    "FROZEN": 2,
-    "AUTO": None,  # Resolved at runtime based on market hours
-}
 MARKET_DATA_CODE_TO_NAME = {code: name for name, code in MARKET_DATA_TYPE_CODES.items()}
 
 # Hard-coded venue preferences for symbols that require a specific routing.
@@ -35,6 +44,14 @@ OPTION_EXCHANGE_OVERRIDES: Dict[str, str] = {
     "JPM": "BOX",
 }
 
+# Chain coverage per fetch mode: (max expiries, strikes per side, include LEAPS).
+# "summary" quotes only the nearest ATM band, cutting option requests ~20x for
+# screening runs that do not need the full surface.
+FETCH_MODES: Dict[str, Tuple[int, int, bool]] = {
+    "full": (32, 8, True),
+    "summary": (4, 3, False),
+}
+
 FALLBACK_OPTION_EXCHANGES = [
     "SMART",
     "CBOE",
@@ -44,6 +61,44 @@ FALLBACK_OPTION_EXCHANGES = [
     "BATSOP",
 ]
 
+# Column layout of persisted option snapshots. Numbers stay float64 so quotes
+# and greeks read back exactly as fetched; zstd handles the size.
+OPTION_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.dictionary(pa.int32(), pa.string())),
+        ("expiry", pa.timestamp("ns", tz="UTC")),
+        ("strike", pa.float64()),
+        ("option_type", pa.dictionary(pa.int8(), pa.string())),
+        ("bid", pa.float64()),
+        ("ask", pa.float64()),
+        ("mark", pa.float64()),
+        ("delta", pa.float64()),
+        ("gamma", pa.float64()),
+        ("vega", pa.float64()),
+        ("theta", pa.float64()),
+        ("rho", pa.float64()),
+        ("implied_volatility", pa.float64()),
+        ("underlying_price", pa.float64()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("price", pa.float64()),
+    ]
+)
+# Ticker.modelGreeks attribute -> snapshot column.
+_GREEK_FIELDS = {
+    "delta": "delta",
+    "gamma": "gamma",
+    "vega": "vega",
+    "theta": "theta",
+    "rho": "rho",
+    "impliedVol": "implied_volatility",
+}
+
+# Snapshots are stored as a hive-partitioned dataset: data_dir/symbol=X/date=Y/.
+SNAPSHOT_PARTITIONING = ds.partitioning(
+    pa.schema([("symbol", pa.string()), ("date", pa.string())]),
+    flavor="hive",
+)
+
 
 @dataclass(slots=True)
 class OptionChainSnapshot:
@@ -54,25 +109,132 @@ class OptionChainSnapshot:
     timestamp: datetime
     options: List[Dict[str, Any]]
     context: Optional[Dict[str, Any]] = None
+    # Columnar copy of ``options`` when the fetcher assembled one; reused on persist.
+    table: Optional[pa.Table] = field(default=None, repr=False, compare=False)
 
     def to_pandas(self) -> pd.DataFrame:
-        frame = pd.DataFrame(self.options)
+        if self.table is not None:
+            # Columnar fast path: skips re-inferring a frame from the row dicts.
+            table = self.table
+            index = table.schema.get_field_index("option_type")
+            if index >= 0 and pa.types.is_dictionary(table.schema.field(index).type):
+                table = table.set_column(index, "option_type", table.column(index).cast(pa.string()))
+            frame = table.to_pandas()
+        else:
+            frame = pd.DataFrame(self.options)
         if frame.empty:
             return frame
         frame["symbol"] = self.symbol
         frame["underlying_price"] = self.underlying_price
         frame["timestamp"] = self.timestamp
-        frame["expiry"] = pd.to_datetime(frame["expiry"], utc=True)
+        # Arrow-backed frames already carry a tz-aware expiry; only row dicts need parsing.
+        if not isinstance(frame["expiry"].dtype, pd.DatetimeTZDtype):
+            frame["expiry"] = pd.to_datetime(frame["expiry"], utc=True)
         if self.context:
             for key, value in self.context.items():
                 frame[key] = value
         return frame
 
 
+def open_snapshot_dataset(data_dir: Path) -> Optional[ds.Dataset]:
+    """Open every partitioned snapshot under ``data_dir`` as one dataset.
+
+    Returns ``None`` when nothing has been written in the partitioned layout yet.
+    Filters on ``symbol``/``date`` prune whole directories before any file is read.
+    """
+    files = sorted(str(path) for path in data_dir.glob("symbol=*/date=*/*.parquet"))
+    if not files:
+        return None
+    return ds.dataset(
+        files,
+        format="parquet",
+        partitioning=SNAPSHOT_PARTITIONING,
+        partition_base_dir=str(data_dir),
+    )
+
+
+_SCALAR_COLUMNS = frozenset({"symbol", "price", "underlying_price", "timestamp"})
+_ROW_SCHEMA = pa.schema([field for field in OPTION_SCHEMA if field.name not in _SCALAR_COLUMNS])
+_OPTION_TYPES = pa.array(["CALL", "PUT"], pa.string())
+# The daily history CSV: OPTION_SCHEMA with plain strings for the dictionary
+# columns and the snapshot time rendered in the history timezone.
+_HISTORY_SCHEMA = pa.schema(
+    [
+        pa.field(field.name, pa.string()) if pa.types.is_dictionary(field.type) or field.name == "timestamp" else field
+        for field in OPTION_SCHEMA
+    ]
+)
+
+
+def _widen_field(field: pa.Field) -> pa.Field:
+    """Map a stored column to its in-memory type: float64 numbers, plain string labels."""
+    if pa.types.is_float32(field.type):
+        return field.with_type(pa.float64())
+    if pa.types.is_dictionary(field.type):
+        return field.with_type(field.type.value_type)
+    return field
+
+
+def snapshot_to_table(snapshot: OptionChainSnapshot) -> pa.Table:
+    """Build an ``OPTION_SCHEMA`` table from the snapshot's columns or rows."""
+    table = snapshot.table
+    if table is None:
+        table = pa.Table.from_pylist(snapshot.options, schema=_ROW_SCHEMA)
+    else:
+        table = table.select(_ROW_SCHEMA.names).cast(_ROW_SCHEMA)
+    count = table.num_rows
+    scalars = {
+        "symbol": pa.repeat(pa.scalar(snapshot.symbol, pa.string()), count).dictionary_encode(),
+        "price": table.column("mark"),
+        "underlying_price": pa.repeat(pa.scalar(snapshot.underlying_price, pa.float64()), count),
+        "timestamp": pa.repeat(pa.scalar(snapshot.timestamp, pa.timestamp("us", tz="UTC")), count),
+    }
+    columns = [scalars[name] if name in scalars else table.column(name) for name in OPTION_SCHEMA.names]
+    return pa.Table.from_arrays(columns, schema=OPTION_SCHEMA)
+
+
+@dataclass(slots=True)
+class _ChainPlan:
+    """Per-symbol selection state while option chains are fetched in batch."""
+
+    symbol: str
+    underlying_price: float
+    expiries: List[str]
+    strikes: List[float]
+    exchanges: List[str]
+    trading_class: str
+    tables: List[pa.Table] = field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_expiry(value: str) -> date:
+    """Parse an IBKR ``YYYYMMDD`` expiry; much cheaper than ``strptime`` and memoised."""
+    if len(value) != 8 or not value.isdigit():
+        raise ValueError(f"Invalid expiry '{value}'; expected YYYYMMDD")
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+
+def _write_json_atomic(path: Path, payload: Any) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        tmp_path.write_bytes(jsonio.dumps(payload))
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning(
+            "Unable to persist cache file {path}: {error}",
+            path=str(path),
+            error=exc,
+            component="option_data",
+            event_type="cache_save_failed",
+        )
+
+
 class BaseDataFetcher:
     """Interface used by executors that need to load option chains."""
 
-    async def fetch_all(self, symbols: Iterable[str]) -> List[OptionChainSnapshot]:  # pragma: no cover - abstract
+    async def fetch_all(
+        self, symbols: Iterable[str], timestamp: Optional[datetime] = None
+    ) -> List[OptionChainSnapshot]:  # pragma: no cover - abstract
         raise NotImplementedError
 
 
@@ -86,6 +248,8 @@ class IBKRDataFetcher(BaseDataFetcher):
         client_id: int,
         data_dir: Path,
         market_data_type: str,
+        fetch_mode: str = "full",
+        history_csv: bool = True,
     ) -> None:
         self.host = host
         self.port = port
@@ -103,21 +267,51 @@ class IBKRDataFetcher(BaseDataFetcher):
                 "Use MarketHoursChecker.get_market_data_type() or resolve_market_data_type()."
             )
 
+        self.fetch_mode = fetch_mode.lower()
+        if self.fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unsupported fetch mode '{fetch_mode}'. Choose one of {sorted(FETCH_MODES)}.")
+
         self._market_data_type_code = MARKET_DATA_TYPE_CODES[self.market_data_type]
         self._ib = IB()
         self._lock = asyncio.Lock()
         self._current_market_data_type_code: Optional[int] = None
         self._history_timezone = ZoneInfo("America/Los_Angeles")
-        self._max_expiries = 32  # cover ≈3 months of weekly expirations
+        # Full mode covers ≈3 months of weekly expirations plus LEAPS.
+        self._max_expiries, self._max_strikes_per_side, self._include_leaps = FETCH_MODES[self.fetch_mode]
         self._expiry_horizon_days = 92
         self._leaps_min_days = 240
         self._leaps_max_days = 300
-        self._max_strikes_per_side = 8
-        self._contracts_per_chunk = 40
+        self._contracts_per_chunk = 50
+        self._pacer = RequestPacer()
+        self._snapshot_timeout = 11.0  # IBKR completes snapshots within ~11s
+        # Open snapshot requests count against the account's market data lines
+        # (100 by default); leave headroom for the underlying quotes.
+        self._max_inflight_snapshots = 90
+        # reqSecDefOptParams replies carry every strike and expiry of a chain;
+        # cap how many are outstanding at once on large watchlists.
+        self._max_inflight_chain_requests = 6
+        self._qualified_cache_size = 50_000
+        self._heartbeat_interval = 60.0
+        self._chain_cache_ttl = 24 * 3600.0
+        self._chain_cache: Dict[str, Tuple[float, OptionChain]] = {}
+        self._chains_dirty = False
+        self._qualified_dirty = False
+        self._heartbeat_task: Optional[asyncio.Task[None]] = None
+        self._persist_task: Optional[asyncio.Task[None]] = None
+        self._qualified: OrderedDict[Tuple[Any, ...], Contract] = OrderedDict()
+        self._qualified_stocks: Dict[str, Tuple[date, Stock]] = {}
 
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._qualified_path = self.data_dir / "qualified_contracts.json"
+        self._load_qualified()
+        self._chains_path = self.data_dir / "chains.json"
+        self._load_chains()
+        # The partitioned Parquet dataset under data_dir is the full history;
+        # the daily CSV is a text copy kept for tools that still read it.
+        self.history_csv = history_csv
         self.history_dir = Path("historydata")
-        self.history_dir.mkdir(parents=True, exist_ok=True)
+        if history_csv:
+            self.history_dir.mkdir(parents=True, exist_ok=True)
 
     @property
     def ib(self) -> IB:
@@ -125,6 +319,9 @@ class IBKRDataFetcher(BaseDataFetcher):
         return self._ib
 
     async def connect(self) -> None:
+        # Every fetch pass calls this; skip the lock when the session is already up.
+        if self._ib.isConnected():
+            return
         async with self._lock:
             if self._ib.isConnected():
                 return
@@ -146,6 +343,7 @@ class IBKRDataFetcher(BaseDataFetcher):
                     )
                     raise ConnectionError("Failed to connect to IBKR Gateway")
                 self._set_market_data_type(self._market_data_type_code)
+                self._start_heartbeat()
                 logger.info(
                     "Connected to IBKR Gateway successfully",
                     component="ibkr_connection",
@@ -160,7 +358,34 @@ class IBKRDataFetcher(BaseDataFetcher):
                 )
                 raise
 
+    def _start_heartbeat(self) -> None:
+        if self._heartbeat_task is not None and not self._heartbeat_task.done():
+            return
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+
+    async def _heartbeat(self) -> None:
+        """Keep the idle connection warm between scheduled runs."""
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            if not self._ib.isConnected():
+                continue
+            try:
+                await self._pacer.acquire()
+                await asyncio.wait_for(self._ib.reqCurrentTimeAsync(), timeout=10)
+            except Exception as exc:
+                logger.warning(
+                    "IBKR heartbeat failed | error={error}",
+                    error=exc,
+                    component="ibkr_connection",
+                    event_type="heartbeat_failed",
+                )
+
     async def disconnect(self) -> None:
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        await self.flush()
+        self._save_qualified()
         if self._ib.isConnected():
             logger.info(
                 "Disconnecting from IBKR",
@@ -201,6 +426,7 @@ class IBKRDataFetcher(BaseDataFetcher):
             return []
         try:
             self._set_market_data_type(self._market_data_type_code)
+            await self._pacer.acquire(len(contracts))
             if hasattr(self._ib, "reqTickersAsync"):
                 tickers = await self._ib.reqTickersAsync(*contracts)
             else:
@@ -215,29 +441,273 @@ class IBKRDataFetcher(BaseDataFetcher):
             raise
         return list(tickers or [])
 
-    async def _request_underlying_ticker(self, contract: Contract) -> Any:
-        tickers = await self._request_tickers([contract])
-        if not tickers:
-            raise RuntimeError(f"No market data returned for underlying {contract.symbol}")
-        return tickers[0]
+    @staticmethod
+    def _snapshot_complete(ticker: Any) -> bool:
+        quoted = any(
+            isinstance(value, (int, float)) and math.isfinite(value) and value > 0
+            for value in (ticker.bid, ticker.ask)
+        )
+        return quoted and ticker.modelGreeks is not None
+
+    def _request_snapshot(self, contract: Contract) -> Tuple[Any, int, asyncio.Future]:
+        """Send one snapshot request the way ``IB.reqTickersAsync`` does.
+
+        Unlike ``IB.reqMktData`` this registers a request future, which ib_async
+        resolves when IBKR sends ``tickSnapshotEnd`` for the request.
+        """
+        # startReq/startTicker/endTicker/_endReq are ib_async wrapper internals,
+        # copied from IB.reqTickersAsync in ib_async 2.1; the dependency is pinned
+        # to ib_async~=2.1.0 in pyproject.toml. Re-check them before bumping it.
+        client, wrapper = self._ib.client, self._ib.wrapper
+        req_id = client.getReqId()
+        done = wrapper.startReq(req_id, contract)
+        ticker = wrapper.startTicker(req_id, contract, "snapshot")
+        client.reqMktData(req_id, contract, "", True, False, [])
+        return ticker, req_id, done
+
+    def _cancel_snapshot(self, req_id: int) -> None:
+        try:
+            self._ib.client.cancelMktData(req_id)
+        finally:
+            # Resolve the request future so the wrapper forgets it, even when
+            # the cancel could not be sent.
+            self._ib.wrapper._endReq(req_id)
+
+    async def _stream_tickers(self, contracts: Sequence[Contract]) -> AsyncIterator[Any]:
+        """Yield snapshot tickers as soon as each one is finished.
+
+        Contracts are requested as snapshots through a sliding window of at most
+        ``_max_inflight_snapshots`` open requests, so a large batch stays inside
+        IBKR's market data line allowance. A snapshot is finished when IBKR sends
+        ``tickSnapshotEnd`` for it, or earlier once it has a quote and greeks;
+        no-bid or greek-less contracts therefore complete as soon as IBKR is done
+        with them. Each finished snapshot frees a slot for the next contract. A
+        request still unanswered ``_snapshot_timeout`` seconds after it was sent
+        is cancelled and yielded with whatever data it has. Requests still open
+        when the consumer stops early or the generator is closed are cancelled.
+        """
+        if not contracts:
+            return
+        self._set_market_data_type(self._market_data_type_code)
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+
+        def _on_pending(tickers: Iterable[Any]) -> None:
+            for ticker in tickers:
+                queue.put_nowait(ticker)
+
+        def _on_snapshot_end(ticker: Any) -> Callable[[asyncio.Future], None]:
+            def callback(_: asyncio.Future) -> None:
+                self._ib.wrapper.endTicker(ticker, "snapshot")
+                queue.put_nowait(ticker)
+
+            return callback
+
+        self._ib.pendingTickersEvent += _on_pending
+        loop = asyncio.get_running_loop()
+        waiting = iter(contracts)
+        exhausted = False
+        # id(ticker) -> (deadline, ticker, request id, snapshot-end future);
+        # insertion order is deadline order.
+        outstanding: Dict[int, Tuple[float, Any, int, asyncio.Future]] = {}
+        timed_out = 0
+        try:
+            while True:
+                while not exhausted and len(outstanding) < self._max_inflight_snapshots:
+                    contract = next(waiting, None)
+                    if contract is None:
+                        exhausted = True
+                        break
+                    await self._pacer.acquire()
+                    ticker, req_id, done = self._request_snapshot(contract)
+                    done.add_done_callback(_on_snapshot_end(ticker))
+                    outstanding[id(ticker)] = (loop.time() + self._snapshot_timeout, ticker, req_id, done)
+                if not outstanding:
+                    break
+                deadline, oldest, req_id, _ = next(iter(outstanding.values()))
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    del outstanding[id(oldest)]
+                    self._cancel_snapshot(req_id)
+                    timed_out += 1
+                    yield oldest
+                    continue
+                try:
+                    ticker = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    continue
+                entry = outstanding.get(id(ticker))
+                if entry is not None and (entry[3].done() or self._snapshot_complete(ticker)):
+                    del outstanding[id(ticker)]
+                    yield ticker
+        finally:
+            self._ib.pendingTickersEvent -= _on_pending
+            abandoned = [req_id for _, _, req_id, done in outstanding.values() if not done.done()]
+            for req_id in abandoned:
+                try:
+                    self._cancel_snapshot(req_id)
+                except ConnectionError:
+                    pass
+            if abandoned:
+                logger.debug(
+                    "Cancelled open option snapshots | count={count}",
+                    count=len(abandoned),
+                    component="option_data",
+                    event_type="snapshot_cancel",
+                )
+        if timed_out:
+            logger.debug(
+                "Option snapshots timed out | pending={pending} total={total}",
+                pending=timed_out,
+                total=len(contracts),
+                component="option_data",
+                event_type="snapshot_timeout",
+            )
+
+    @staticmethod
+    def _contract_key(contract: Contract) -> Tuple[Any, ...]:
+        return (
+            contract.symbol,
+            contract.lastTradeDateOrContractMonth,
+            float(contract.strike),
+            contract.right,
+            contract.exchange,
+            contract.tradingClass,
+        )
 
     async def _qualify_contracts(self, contracts: Sequence[Option]) -> List[Contract]:
-        qualified: List[Contract] = []
-        for idx in range(0, len(contracts), self._contracts_per_chunk):
-            chunk = contracts[idx : idx + self._contracts_per_chunk]
-            if not chunk:
-                continue
+        """Qualify ``contracts``, asking IBKR only for ones not qualified before.
+
+        Keys are taken from the requested fields before qualification mutates the
+        contracts in place, so the same request maps to the same cached entry.
+        """
+        keys = [self._contract_key(contract) for contract in contracts]
+        misses = [(key, contract) for key, contract in zip(keys, contracts) if key not in self._qualified]
+        for idx in range(0, len(misses), self._contracts_per_chunk):
+            chunk = misses[idx : idx + self._contracts_per_chunk]
+            await self._pacer.acquire(len(chunk))
             try:
-                chunk_result = await self._ib.qualifyContractsAsync(*chunk)
+                chunk_result = await self._ib.qualifyContractsAsync(*(contract for _, contract in chunk))
             except Exception as exc:
                 logger.opt(exception=exc).warning(
                     "Unable to qualify option contracts for {symbol}",
-                    symbol=chunk[0].symbol,
+                    symbol=chunk[0][1].symbol,
                 )
                 continue
-            qualified.extend(contract for contract in chunk_result if isinstance(contract, Contract))
+            for (key, _), contract in zip(chunk, chunk_result):
+                if isinstance(contract, Contract):
+                    self._qualified[key] = contract
+                    self._qualified_dirty = True
+        if len(misses) < len(contracts):
+            logger.debug(
+                "Qualified contract cache | hits={hits} misses={misses}",
+                hits=len(contracts) - len(misses),
+                misses=len(misses),
+                component="option_data",
+                event_type="qualify_cache",
+            )
+        qualified: List[Contract] = []
+        for key in keys:
+            contract = self._qualified.get(key)
+            if contract is not None:
+                self._qualified.move_to_end(key)
+                qualified.append(contract)
+        while len(self._qualified) > self._qualified_cache_size:
+            self._qualified.popitem(last=False)
         return qualified
 
+    async def _qualify_stocks(self, symbols: Sequence[str]) -> Dict[str, Stock]:
+        """Return a Stock per symbol, qualifying only those not already qualified today."""
+        today = datetime.now(timezone.utc).date()
+        stocks: Dict[str, Stock] = {}
+        missing: List[Stock] = []
+        for symbol in symbols:
+            cached = self._qualified_stocks.get(symbol)
+            if cached is not None and cached[0] == today:
+                stocks[symbol] = cached[1]
+            else:
+                stocks[symbol] = Stock(symbol, "SMART", "USD")
+                missing.append(stocks[symbol])
+        if not missing:
+            return stocks
+        try:
+            await self._pacer.acquire(len(missing))
+            await self._ib.qualifyContractsAsync(*missing)
+        except Exception as exc:
+            logger.opt(exception=exc).warning(
+                "Unable to qualify underlying contracts | symbols={symbols}",
+                symbols=",".join(stock.symbol for stock in missing),
+                component="option_data",
+                event_type="stock_qualify_failed",
+            )
+            return stocks
+        for stock in missing:
+            if stock.conId:
+                self._qualified_stocks[stock.symbol] = (today, stock)
+        return stocks
+
+    def _prune_qualified(self) -> None:
+        today = datetime.now(timezone.utc).strftime("%Y%m%d")
+        expired = [key for key in self._qualified if key[1] < today]
+        for key in expired:
+            del self._qualified[key]
+
+    def _load_qualified(self) -> None:
+        try:
+            payload = jsonio.loads(self._qualified_path.read_bytes())
+            for entry in payload:
+                self._qualified[tuple(entry["key"])] = Contract.create(**entry["contract"])
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            logger.warning(
+                "Ignoring unreadable qualified contract cache {path}: {error}",
+                path=str(self._qualified_path),
+                error=exc,
+                component="option_data",
+                event_type="qualify_cache_load_failed",
+            )
+            self._qualified.clear()
+            return
+        self._prune_qualified()
+
+    def _qualified_payload(self) -> List[Dict[str, Any]]:
+        self._prune_qualified()
+        return [
+            {"key": list(key), "contract": util.dataclassNonDefaults(contract)}
+            for key, contract in self._qualified.items()
+        ]
+
+    def _save_qualified(self) -> None:
+        self._qualified_dirty = False
+        _write_json_atomic(self._qualified_path, self._qualified_payload())
+
+    def _load_chains(self) -> None:
+        try:
+            payload = jsonio.loads(self._chains_path.read_bytes())
+            for symbol, entry in payload.items():
+                self._chain_cache[symbol] = (float(entry["fetched_at"]), OptionChain(**entry["chain"]))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.warning(
+                "Ignoring unreadable option chain cache {path}: {error}",
+                path=str(self._chains_path),
+                error=exc,
+                component="option_data",
+                event_type="chain_cache_load_failed",
+            )
+            self._chain_cache.clear()
+
+    def _chains_payload(self) -> Dict[str, Any]:
+        return {
+            symbol: {"fetched_at": fetched_at, "chain": asdict(chain)}
+            for symbol, (fetched_at, chain) in self._chain_cache.items()
+        }
+
+    def _save_chains(self) -> None:
+        self._chains_dirty = False
+        _write_json_atomic(self._chains_path, self._chains_payload())
+
     @staticmethod
     def _meaningful_price(value: float) -> bool:
         return math.isfinite(value) and value > 0.0
@@ -249,6 +719,16 @@ class IBKRDataFetcher(BaseDataFetcher):
         raise RuntimeError(f"Unable to determine underlying price for {symbol}")
 
     async def _load_chain_metadata(self, stock_contract: Contract) -> Any:
+        cached = self._chain_cache.get(stock_contract.symbol)
+        if cached is not None and time.time() - cached[0] < self._chain_cache_ttl:
+            return cached[1]
+        chain = await self._request_chain_metadata(stock_contract)
+        self._chain_cache[stock_contract.symbol] = (time.time(), chain)
+        self._chains_dirty = True
+        return chain
+
+    async def _request_chain_metadata(self, stock_contract: Contract) -> Any:
+        await self._pacer.acquire()
         params = await self._ib.reqSecDefOptParamsAsync(
             stock_contract.symbol,
             "",
@@ -292,14 +772,14 @@ class IBKRDataFetcher(BaseDataFetcher):
             if not expiry:
                 continue
             try:
-                expiry_date = datetime.strptime(expiry, "%Y%m%d").date()
+                expiry_date = parse_expiry(expiry)
             except ValueError:
                 continue
 
             bucket = others
             if today <= expiry_date <= horizon:
                 bucket = near_term
-            elif leaps_start <= expiry_date <= leaps_end:
+            elif self._include_leaps and leaps_start <= expiry_date <= leaps_end:
                 bucket = leaps
             bucket.append((expiry_date, expiry))
 
@@ -326,18 +806,29 @@ class IBKRDataFetcher(BaseDataFetcher):
         return [expiry for _, expiry in selections]
 
     def _select_strikes(self, strikes: Sequence[Any], reference_price: float) -> List[float]:
-        cleaned = sorted(set(self._sanitize_floats(strikes)))
-        if not cleaned:
+        """Pick the ``2 * max_strikes_per_side`` strikes nearest ``reference_price``.
+
+        The nearest strikes of a sorted ladder form a contiguous window, so it
+        is grown outwards from the insertion point instead of sorting the whole
+        chain by distance. Ties go to the lower strike.
+        """
+        try:
+            # IBKR sends plain floats: convert in one call and drop non-finite values.
+            values = np.asarray(strikes, dtype=np.float64)
+            values = values[np.isfinite(values)]
+        except (TypeError, ValueError):
+            values = np.asarray(self._sanitize_floats(strikes), dtype=np.float64)
+        cleaned = np.unique(values)
+        if not cleaned.size:
             raise RuntimeError("Option chain metadata did not include strikes")
-        sorted_by_distance = sorted(cleaned, key=lambda strike: (abs(strike - reference_price), strike))
-        max_contracts = self._max_strikes_per_side * 2
-        selection: List[float] = []
-        for strike in sorted_by_distance:
-            selection.append(strike)
-            if len(selection) >= max_contracts:
-                break
-        selection.sort()
-        return selection
+        count = min(self._max_strikes_per_side * 2, cleaned.size)
+        lo = hi = int(np.searchsorted(cleaned, reference_price))
+        while hi - lo < count:
+            if hi >= cleaned.size or (lo > 0 and reference_price - cleaned[lo - 1] <= cleaned[hi] - reference_price):
+                lo -= 1
+            else:
+                hi += 1
+        return cleaned[lo:hi].tolist()
 
     def _build_exchange_order(self, symbol: str, chain_exchange: Optional[str]) -> List[str]:
         exchanges: List[str] = []
@@ -363,122 +854,295 @@ class IBKRDataFetcher(BaseDataFetcher):
                 contracts.append(contract)
         return contracts
 
-    def _quotes_to_rows(
-        self,
-        tickers: Sequence[Any],
-        symbol: str,
-    ) -> Dict[int, Dict[str, Any]]:
-        rows: Dict[int, Dict[str, Any]] = {}
-        for ticker in tickers:
+    def _quotes_to_table(self, tickers: Sequence[Any], symbol: str) -> pa.Table:
+        """Assemble option quotes column-wise into NumPy arrays and one Arrow table."""
+        tickers = [ticker for ticker in tickers if isinstance(ticker.contract, Option)]
+        count = len(tickers)
+        con_id = np.empty(count, np.int64)
+        strike = np.empty(count, np.float64)
+        option_type = np.empty(count, np.int8)
+        expiry = np.empty(count, object)
+        quotes = {name: np.zeros(count, np.float64) for name in ("bid", "ask", "mark")}
+        greeks = {name: np.zeros(count, np.float64) for name in _GREEK_FIELDS.values()}
+        # Bind the per-column arrays once so the row loop does no dict lookups.
+        bid, ask, mark = quotes["bid"], quotes["ask"], quotes["mark"]
+        greek_columns = [(attr, greeks[name]) for attr, name in _GREEK_FIELDS.items()]
+        # Greek attributes each model type actually defines (OptionComputation has
+        # no rho), resolved once per type rather than probed on every row.
+        model_columns: Dict[type, List[Tuple[str, np.ndarray]]] = {}
+        for i, ticker in enumerate(tickers):
             contract = ticker.contract
-            if not isinstance(contract, Option):
-                continue
-            expiry = datetime.strptime(contract.lastTradeDateOrContractMonth, "%Y%m%d")
-            mark = float(ticker.midpoint() or 0.0)
-            bid = float(ticker.bid or 0.0)
-            ask = float(ticker.ask or 0.0)
-            delta = getattr(ticker.modelGreeks, "delta", 0.0) if ticker.modelGreeks else 0.0
-            gamma = getattr(ticker.modelGreeks, "gamma", 0.0) if ticker.modelGreeks else 0.0
-            vega = getattr(ticker.modelGreeks, "vega", 0.0) if ticker.modelGreeks else 0.0
-            theta = getattr(ticker.modelGreeks, "theta", 0.0) if ticker.modelGreeks else 0.0
-            rho = getattr(ticker.modelGreeks, "rho", 0.0) if ticker.modelGreeks else 0.0
-            imp_vol = getattr(ticker.modelGreeks, "impliedVol", 0.0) if ticker.modelGreeks else 0.0
-            rows[contract.conId] = {
-                "symbol": symbol,
-                "expiry": expiry,
-                "strike": float(contract.strike),
-                "option_type": "CALL" if contract.right == "C" else "PUT",
-                "bid": bid,
-                "ask": ask,
-                "mark": mark,
-                "delta": float(delta or 0.0),
-                "gamma": float(gamma or 0.0),
-                "vega": float(vega or 0.0),
-                "theta": float(theta or 0.0),
-                "rho": float(rho or 0.0),
-                "implied_volatility": float(imp_vol or 0.0),
-            }
-        return rows
+            con_id[i] = contract.conId
+            strike[i] = contract.strike
+            option_type[i] = 0 if contract.right == "C" else 1
+            expiry[i] = contract.lastTradeDateOrContractMonth
+            bid[i] = ticker.bid or 0.0
+            ask[i] = ticker.ask or 0.0
+            mark[i] = ticker.midpoint() or 0.0
+            model = ticker.modelGreeks
+            if model:
+                columns = model_columns.get(type(model))
+                if columns is None:
+                    columns = [(attr, column) for attr, column in greek_columns if hasattr(model, attr)]
+                    model_columns[type(model)] = columns
+                for attr, column in columns:
+                    column[i] = getattr(model, attr) or 0.0
 
-    async def fetch_option_chain(self, symbol: str) -> OptionChainSnapshot:
-        logger.info(
-            "Fetching option chain | symbol={symbol}",
-            symbol=symbol,
-            component="option_data",
-            event_type="fetch_start",
+        # Later quotes for the same contract replace earlier ones.
+        _, last_index = np.unique(con_id[::-1], return_index=True)
+        keep = np.sort(count - 1 - last_index)
+        return pa.table(
+            {
+                "symbol": pa.repeat(pa.scalar(symbol, pa.string()), len(keep)),
+                "expiry": pc.strptime(pa.array(expiry[keep], pa.string()), format="%Y%m%d", unit="us"),
+                "strike": pa.array(strike[keep]),
+                "option_type": pa.DictionaryArray.from_arrays(pa.array(option_type[keep]), _OPTION_TYPES),
+                **{name: pa.array(values[keep]) for name, values in quotes.items()},
+                **{name: pa.array(greeks[name][keep]) for name in _GREEK_FIELDS.values()},
+            }
         )
+
+    async def _quote_contracts(self, contracts: Sequence[Option]) -> Dict[Tuple[str, str], List[Any]]:
+        """Qualify and quote ``contracts``, grouping the tickers by (symbol, expiry)."""
+        grouped: Dict[Tuple[str, str], List[Any]] = {}
+        qualified = await self._qualify_contracts(contracts)
+        async for ticker in self._stream_tickers(qualified):
+            contract = ticker.contract
+            grouped.setdefault((contract.symbol, contract.lastTradeDateOrContractMonth), []).append(ticker)
+        return grouped
+
+    async def fetch_option_chain(self, symbol: str, timestamp: Optional[datetime] = None) -> OptionChainSnapshot:
+        snapshots, failures = await self._fetch_chains([symbol], timestamp)
+        if symbol in failures:
+            raise failures[symbol]
+        return snapshots[0]
+
+    async def _fetch_chains(
+        self, symbols: Sequence[str], timestamp: Optional[datetime] = None
+    ) -> Tuple[List[OptionChainSnapshot], Dict[str, Exception]]:
+        """Fetch option chains for ``symbols`` with batched IBKR round-trips.
+
+        Stock qualification, underlying quotes, option qualification and option
+        quotes are each requested once per pass for every symbol, rather than
+        once per symbol. Failures are isolated and returned per symbol.
+        """
+        for symbol in symbols:
+            logger.info(
+                "Fetching option chain | symbol={symbol}",
+                symbol=symbol,
+                component="option_data",
+                event_type="fetch_start",
+            )
         await self.connect()
-        stock = Stock(symbol, "SMART", "USD")
-        qualified_stock = await self._ib.qualifyContractsAsync(stock)
-        if qualified_stock:
-            stock = qualified_stock[0]
-        ticker = await self._request_underlying_ticker(stock)
-        underlying_price = self._extract_underlying_price(ticker, symbol)
-
-        chain = await self._load_chain_metadata(stock)
-        expiries = self._select_expiries(chain.expirations)
-        strikes = self._select_strikes(chain.strikes, underlying_price)
-        trading_class = getattr(chain, "tradingClass", "") or ""
-
-        rows_by_conid: Dict[int, Dict[str, Any]] = {}
-        for expiry in expiries:
-            for exchange in self._build_exchange_order(symbol, chain.exchange):
-                contracts = self._build_option_contracts(symbol, expiry, strikes, exchange, trading_class)
-                qualified = await self._qualify_contracts(contracts)
-                if not qualified:
-                    logger.debug(
-                        "No qualified option contracts for {symbol} expiry={expiry} exchange={exchange}",
-                        symbol=symbol,
-                        expiry=expiry,
-                        exchange=exchange,
-                        component="option_data",
-                        event_type="contract_qualify_empty",
-                    )
+        self._prune_qualified()
+        failures: Dict[str, Exception] = {}
+
+        # Phase 1: qualify every underlying and quote them together.
+        stocks = await self._qualify_stocks(symbols)
+        try:
+            tickers = await self._request_tickers(list(stocks.values()))
+        except Exception as exc:
+            if len(stocks) <= 1:
+                return [], {symbol: exc for symbol in symbols}
+            # Retry one underlying at a time so a bad contract fails only its symbol.
+            tickers = []
+            for symbol, stock in stocks.items():
+                try:
+                    tickers.extend(await self._request_tickers([stock]))
+                except Exception as symbol_exc:
+                    failures[symbol] = symbol_exc
+        tickers_by_symbol = {ticker.contract.symbol: ticker for ticker in tickers if ticker.contract}
+
+        prices: Dict[str, float] = {}
+        for symbol in symbols:
+            if symbol in failures:
+                continue
+            ticker = tickers_by_symbol.get(symbol)
+            try:
+                if ticker is None:
+                    raise RuntimeError(f"No market data returned for underlying {symbol}")
+                prices[symbol] = self._extract_underlying_price(ticker, symbol)
+            except Exception as exc:
+                failures[symbol] = exc
+
+        # Phase 2: option chain metadata for all remaining symbols concurrently.
+        priced = [symbol for symbol in symbols if symbol in prices]
+        chain_slots = asyncio.Semaphore(self._max_inflight_chain_requests)
+
+        async def load_chain(symbol: str) -> Any:
+            async with chain_slots:
+                return await self._load_chain_metadata(stocks[symbol])
+
+        chains = await asyncio.gather(*(load_chain(symbol) for symbol in priced), return_exceptions=True)
+        plans: Dict[str, _ChainPlan] = {}
+        for symbol, chain in zip(priced, chains):
+            try:
+                if isinstance(chain, Exception):
+                    raise chain
+                plans[symbol] = _ChainPlan(
+                    symbol=symbol,
+                    underlying_price=prices[symbol],
+                    expiries=self._select_expiries(chain.expirations),
+                    strikes=self._select_strikes(chain.strikes, prices[symbol]),
+                    exchanges=self._build_exchange_order(symbol, chain.exchange),
+                    trading_class=getattr(chain, "tradingClass", "") or "",
+                )
+            except Exception as exc:
+                failures[symbol] = exc
+
+        # Phase 3: walk the exchange preference order, qualifying and quoting the
+        # option contracts of every outstanding (symbol, expiry) pair in one batch.
+        pending = [(plan, expiry) for plan in plans.values() for expiry in plan.expiries]
+        rank = 0
+        while pending:
+            contracts: List[Option] = []
+            active: List[Tuple[_ChainPlan, str, str]] = []
+            for plan, expiry in pending:
+                if rank >= len(plan.exchanges):
                     continue
-                tickers = await self._request_tickers(qualified)
-                rows = self._quotes_to_rows(tickers, symbol)
-                if not rows:
+                exchange = plan.exchanges[rank]
+                active.append((plan, expiry, exchange))
+                contracts.extend(
+                    self._build_option_contracts(plan.symbol, expiry, plan.strikes, exchange, plan.trading_class)
+                )
+            if not active:
+                break
+            try:
+                grouped = await self._quote_contracts(contracts)
+            except Exception as exc:
+                by_symbol: Dict[str, List[Option]] = {}
+                for contract in contracts:
+                    by_symbol.setdefault(contract.symbol, []).append(contract)
+                if len(by_symbol) == 1:
+                    for plan, _, _ in active:
+                        failures.setdefault(plan.symbol, exc)
+                # Retry symbol by symbol so one rejected batch fails only its symbol.
+                grouped = {}
+                for symbol, symbol_contracts in by_symbol.items():
+                    if symbol in failures:
+                        continue
+                    try:
+                        grouped.update(await self._quote_contracts(symbol_contracts))
+                    except Exception as symbol_exc:
+                        failures.setdefault(symbol, symbol_exc)
+
+            pending = []
+            for plan, expiry, exchange in active:
+                if plan.symbol in failures:
+                    continue
+                try:
+                    table = self._quotes_to_table(grouped.get((plan.symbol, expiry), ()), plan.symbol)
+                except Exception as exc:
+                    failures.setdefault(plan.symbol, exc)
+                    continue
+                if not table.num_rows:
                     logger.debug(
                         "No option quotes returned for {symbol} expiry={expiry} exchange={exchange}",
-                        symbol=symbol,
+                        symbol=plan.symbol,
                         expiry=expiry,
                         exchange=exchange,
                         component="option_data",
                         event_type="quote_fetch_empty",
                     )
+                    pending.append((plan, expiry))
                     continue
-                rows_by_conid.update(rows)
-                # Once we get data for the first viable exchange we keep moving to next expiry.
-                break
+                # Once we get data for the first viable exchange we move on to the next expiry.
+                plan.tables.append(table)
+            pending = [(plan, expiry) for plan, expiry in pending if plan.symbol not in failures]
+            rank += 1
 
-        if not rows_by_conid:
-            logger.error(
-                "No option contracts selected for {symbol}",
-                symbol=symbol,
+        timestamp = timestamp or datetime.now(timezone.utc)
+        snapshots: List[OptionChainSnapshot] = []
+        for symbol, plan in plans.items():
+            if symbol in failures or not plan.tables:
+                # The cached expiries/strikes may be stale; refetch them next scan.
+                if self._chain_cache.pop(symbol, None) is not None:
+                    self._chains_dirty = True
+            if symbol in failures:
+                continue
+            if not plan.tables:
+                logger.error(
+                    "No option contracts selected for {symbol}",
+                    symbol=symbol,
+                    component="option_data",
+                    event_type="fetch_failed",
+                )
+                failures[symbol] = RuntimeError(f"No option contracts selected for {symbol}")
+                continue
+            table = pa.concat_tables(plan.tables)
+            snapshots.append(
+                OptionChainSnapshot(
+                    symbol=symbol,
+                    underlying_price=plan.underlying_price,
+                    timestamp=timestamp,
+                    options=table.to_pylist(),
+                    table=table,
+                )
+            )
+
+        # Cache payloads are built here, on the loop thread that mutates the
+        # caches, and written with the snapshots in the background.
+        caches: List[Tuple[Path, Any]] = []
+        if self._chains_dirty:
+            self._chains_dirty = False
+            caches.append((self._chains_path, self._chains_payload()))
+        if self._qualified_dirty:
+            self._qualified_dirty = False
+            caches.append((self._qualified_path, self._qualified_payload()))
+        self._schedule_persist(snapshots, caches)
+        for snapshot in snapshots:
+            logger.info(
+                "Fetched option chain | symbol={symbol} options={count}",
+                symbol=snapshot.symbol,
+                count=len(snapshot.options),
                 component="option_data",
-                event_type="fetch_failed",
+                event_type="fetch_success",
             )
-            raise RuntimeError(f"No option contracts selected for {symbol}")
+        return snapshots, failures
 
-        snapshot = OptionChainSnapshot(
-            symbol=symbol,
-            underlying_price=underlying_price,
-            timestamp=datetime.now(timezone.utc),
-            options=list(rows_by_conid.values()),
-        )
-        self._persist_snapshot(snapshot)
-        logger.info(
-            "Fetched option chain | symbol={symbol} options={count}",
-            symbol=symbol,
-            count=len(snapshot.options),
-            component="option_data",
-            event_type="fetch_success",
-        )
-        return snapshot
+    def _schedule_persist(
+        self, snapshots: Sequence[OptionChainSnapshot], caches: Sequence[Tuple[Path, Any]] = ()
+    ) -> None:
+        """Write ``snapshots`` and ``(path, payload)`` cache files on a worker thread.
+
+        Writes are chained behind any still-running batch because snapshots
+        share the daily history CSV. ``flush`` waits for the chain to drain.
+        """
+        if not snapshots and not caches:
+            return
+        previous = self._persist_task
+
+        async def persist() -> None:
+            if previous is not None:
+                await previous
+            await asyncio.to_thread(self._persist_snapshots, snapshots)
+            for path, payload in caches:
+                await asyncio.to_thread(_write_json_atomic, path, payload)
+
+        self._persist_task = asyncio.create_task(persist())
+
+    async def flush(self) -> None:
+        """Wait until every scheduled snapshot write has reached disk."""
+        task = self._persist_task
+        if task is not None:
+            await task
+            if self._persist_task is task:
+                self._persist_task = None
+
+    def _persist_snapshots(self, snapshots: Sequence[OptionChainSnapshot]) -> None:
+        for snapshot in snapshots:
+            try:
+                self._persist_snapshot(snapshot)
+            except Exception as exc:
+                logger.opt(exception=exc).error(
+                    "Failed to persist option snapshot | symbol={symbol}",
+                    symbol=snapshot.symbol,
+                    component="option_data",
+                    event_type="persist_failed",
+                )
 
     def _persist_snapshot(self, snapshot: OptionChainSnapshot) -> None:
-        frame = snapshot.to_pandas()
-        if frame.empty:
+        if not snapshot.options:
             logger.warning(
                 "Skipping persistence for {symbol}; snapshot contained no rows",
                 symbol=snapshot.symbol,
@@ -487,27 +1151,42 @@ class IBKRDataFetcher(BaseDataFetcher):
             )
             return
 
-        frame = frame.copy()
-        frame["price"] = frame.get("mark", 0.0)
-
+        table = snapshot_to_table(snapshot)
         timestamp_utc = snapshot.timestamp.replace(tzinfo=timezone.utc)
-        timestamp_str = timestamp_utc.strftime("%Y%m%d_%H%M%S")
-        file_path = self.data_dir / f"{snapshot.symbol}_{timestamp_str}.parquet"
-        frame.to_parquet(file_path, index=False)
+        timestamp_str = f"{timestamp_utc:%Y%m%d_%H%M%S}"
+        day = f"{timestamp_utc:%Y-%m-%d}"
+        partitioned = table.append_column("date", pa.repeat(pa.scalar(day, pa.string()), table.num_rows))
+        ds.write_dataset(
+            partitioned,
+            base_dir=self.data_dir,
+            format="parquet",
+            partitioning=SNAPSHOT_PARTITIONING,
+            basename_template=f"part-{timestamp_str}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd", compression_level=3),
+        )
+        partition_dir = self.data_dir / f"symbol={snapshot.symbol}" / f"date={day}"
         logger.info(
             "Saved option snapshot to {path} | symbol={symbol} rows={rows}",
-            path=str(file_path),
+            path=str(partition_dir),
             symbol=snapshot.symbol,
-            rows=len(frame),
+            rows=table.num_rows,
             component="option_data",
             event_type="parquet_saved",
         )
 
+        if not self.history_csv:
+            return
         timestamp_local = timestamp_utc.astimezone(self._history_timezone)
-        frame["timestamp"] = timestamp_local.isoformat()
-        history_path = self.history_dir / f"{timestamp_local.strftime('%Y%m%d')}.csv"
+        history = table.set_column(
+            table.schema.get_field_index("timestamp"),
+            "timestamp",
+            pa.repeat(pa.scalar(timestamp_local.isoformat(), pa.string()), table.num_rows),
+        ).cast(_HISTORY_SCHEMA)
+        history_path = self.history_dir / f"{timestamp_local:%Y%m%d}.csv"
         header = not history_path.exists()
-        frame.to_csv(history_path, mode="a", header=header, index=False)
+        with history_path.open("ab") as sink:
+            pa_csv.write_csv(history, sink, pa_csv.WriteOptions(include_header=header))
         logger.debug(
             "Appended option snapshot to history file {path}",
             path=str(history_path),
@@ -516,31 +1195,30 @@ class IBKRDataFetcher(BaseDataFetcher):
             event_type="history_appended",
         )
 
-    async def fetch_all(self, symbols: Iterable[str]) -> List[OptionChainSnapshot]:
+    async def fetch_all(
+        self, symbols: Iterable[str], timestamp: Optional[datetime] = None
+    ) -> List[OptionChainSnapshot]:
+        """Fetch every symbol's chain, stamping snapshots with ``timestamp`` (default: now)."""
+        symbols = list(dict.fromkeys(symbols))
         logger.info(
             "Fetching option chains for {count} symbols | symbols={symbols}",
-            count=len(list(symbols)),
+            count=len(symbols),
             symbols=",".join(sorted(symbols)),
             component="option_data",
             event_type="fetch_all_start",
         )
-        tasks = [self.fetch_option_chain(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        snapshots: List[OptionChainSnapshot] = []
-        for symbol, result in zip(symbols, results):
-            if isinstance(result, Exception):
-                logger.error(
-                    "Failed to fetch data for {symbol}: {error}",
-                    symbol=symbol,
-                    error=result,
-                    component="option_data",
-                    event_type="fetch_symbol_failed",
-                )
-                continue
-            snapshots.append(result)
+        snapshots, failures = await self._fetch_chains(symbols, timestamp)
+        for symbol, error in failures.items():
+            logger.error(
+                "Failed to fetch data for {symbol}: {error}",
+                symbol=symbol,
+                error=error,
+                component="option_data",
+                event_type="fetch_symbol_failed",
+            )
         logger.info(
             "Completed fetch_all | symbols={count} successful={success}",
-            count=len(list(symbols)),
+            count=len(symbols),
             success=len(snapshots),
             component="option_data",
             event_type="fetch_all_complete",
@@ -551,12 +1229,24 @@ class IBKRDataFetcher(BaseDataFetcher):
 class LocalDataFetcher(BaseDataFetcher):
     """Loads previously persisted option snapshots from disk."""
 
-    def __init__(self, data_dir: Path) -> None:
+    def __init__(self, data_dir: Path, max_workers: int = 4) -> None:
         self.data_dir = data_dir
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # symbol -> (newest date partition, its mtime_ns, newest snapshot files)
+        self._latest_files: Dict[str, Tuple[Path, int, List[str]]] = {}
 
-    async def fetch_all(self, symbols: Iterable[str]) -> List[OptionChainSnapshot]:
+    async def fetch_all(
+        self, symbols: Iterable[str], timestamp: Optional[datetime] = None
+    ) -> List[OptionChainSnapshot]:
+        """Load the latest stored snapshots; ``timestamp`` is ignored, they keep their own."""
+        symbols = list(symbols)
+        if self._executor is None:
+            # A small dedicated pool: parquet decode saturates a disk with a few
+            # readers, and loads should not queue behind the loop's default executor.
+            self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="parquet-load")
         loop = asyncio.get_running_loop()
-        tasks = [loop.run_in_executor(None, self._load_snapshot, symbol) for symbol in symbols]
+        tasks = [loop.run_in_executor(self._executor, self._load_snapshot, symbol) for symbol in symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         snapshots: List[OptionChainSnapshot] = []
         for symbol, result in zip(symbols, results):
@@ -570,35 +1260,102 @@ class LocalDataFetcher(BaseDataFetcher):
             snapshots.append(result)
         return snapshots
 
+    async def disconnect(self) -> None:
+        """Shut down the loader pool; a later ``fetch_all`` starts a new one."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def _load_snapshot(self, symbol: str) -> OptionChainSnapshot:
         if not self.data_dir.exists():
             raise FileNotFoundError(f"Local data directory '{self.data_dir}' does not exist")
+        source, table = self._load_partitioned(symbol)
+        if table is None:
+            source, table = self._load_legacy_file(symbol)
+        if not table.num_rows:
+            raise ValueError(f"Local snapshot {source} is empty")
+        first = table.select(["timestamp", "underlying_price"]).slice(0, 1).to_pylist()[0]
+        options = table.drop_columns(
+            [name for name in ("symbol", "date", "underlying_price", "timestamp") if name in table.column_names]
+        )
+        options = options.cast(pa.schema([_widen_field(field) for field in options.schema]))
+        return OptionChainSnapshot(
+            symbol=symbol,
+            underlying_price=float(first["underlying_price"]),
+            timestamp=pd.Timestamp(first["timestamp"]).to_pydatetime(),
+            options=options.to_pylist(),
+            table=options,
+        )
+
+    def _load_partitioned(self, symbol: str) -> Tuple[Optional[Path], Optional[pa.Table]]:
+        """Read the newest snapshot from the ``symbol=``/``date=`` dataset layout."""
+        latest_dir, files = self._latest_partition_files(symbol)
+        if latest_dir is None:
+            return None, None
+        if files:
+            return latest_dir, ds.dataset(files, format="parquet").to_table()
+        dataset = ds.dataset(latest_dir, format="parquet")
+        latest = pc.max(dataset.to_table(columns=["timestamp"]).column("timestamp"))
+        table = dataset.to_table(filter=ds.field("timestamp") == latest)
+        return latest_dir, table
+
+    def _latest_partition_files(self, symbol: str) -> Tuple[Optional[Path], List[str]]:
+        """Return the newest ``date=`` directory for ``symbol`` and its newest snapshot files.
+
+        Basenames are part-<YYYYmmdd_HHMMSS>-<i>.parquet, so the newest snapshot is
+        found from the directory listing alone. The listing is cached per symbol
+        and reused while the directory's mtime is unchanged.
+        """
+        symbol_dir = self.data_dir / f"symbol={symbol}"
+        try:
+            with os.scandir(symbol_dir) as entries:
+                dates = [entry.name for entry in entries if entry.name.startswith("date=") and entry.is_dir()]
+        except FileNotFoundError:
+            return None, []
+        if not dates:
+            return None, []
+        latest_dir = symbol_dir / max(dates)
+        mtime_ns = latest_dir.stat().st_mtime_ns
+        cached = self._latest_files.get(symbol)
+        if cached is not None and cached[0] == latest_dir and cached[1] == mtime_ns:
+            return latest_dir, cached[2]
+        with os.scandir(latest_dir) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith("part-") and entry.name.endswith(".parquet") and entry.name.count("-") >= 2
+            ]
+        files: List[str] = []
+        if names:
+            prefix = f"part-{max(name.split('-')[1] for name in names)}-"
+            files = sorted(str(latest_dir / name) for name in names if name.startswith(prefix))
+        self._latest_files[symbol] = (latest_dir, mtime_ns, files)
+        return latest_dir, files
+
+    def _load_legacy_file(self, symbol: str) -> Tuple[Path, pa.Table]:
+        """Read the newest ``{symbol}_*.parquet`` file written before partitioning."""
         pattern = f"{symbol}_*.parquet"
         matches = sorted(self.data_dir.glob(pattern))
         if not matches:
             raise FileNotFoundError(
-                f"No local snapshot found for {symbol}. Expected files matching {pattern} in {self.data_dir}"
+                f"No local snapshot found for {symbol}. Expected a symbol={symbol}/ partition "
+                f"or files matching {pattern} in {self.data_dir}"
             )
         latest = matches[-1]
-        frame = pd.read_parquet(latest)
-        if frame.empty:
-            raise ValueError(f"Local snapshot {latest} is empty")
-        timestamp = pd.to_datetime(frame["timestamp"].iloc[0])
-        underlying_price = float(frame["underlying_price"].iloc[0])
-        options = frame.drop(columns=[col for col in ("symbol", "underlying_price", "timestamp") if col in frame.columns])
-        return OptionChainSnapshot(
-            symbol=symbol,
-            underlying_price=underlying_price,
-            timestamp=timestamp.to_pydatetime(),
-            options=options.to_dict(orient="records"),
-        )
+        return latest, pq.read_table(latest)
 
 
 __all__ = [
     "BaseDataFetcher",
+    "FETCH_MODES",
     "IBKRDataFetcher",
     "LocalDataFetcher",
     "OptionChainSnapshot",
+    "OPTION_SCHEMA",
+    "SNAPSHOT_PARTITIONING",
+    "open_snapshot_dataset",
+    "parse_expiry",
+    "snapshot_to_table",
     "MARKET_DATA_TYPE_CODES",
     "MARKET_DATA_CODE_TO_NAME",
 ]
@@ -0,0 +1,49 @@
+"""Message pacing for the IBKR API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+# IBKR disconnects clients that exceed ~50 messages per second; stay below it.
+DEFAULT_MESSAGES_PER_SECOND = 45.0
+
+
+class RequestPacer:
+    """Token bucket that keeps outgoing IBKR messages under a per-second budget.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Callers
+    ``await acquire(n)`` before sending ``n`` messages; waiters are served in
+    arrival order so one large batch cannot starve small requests indefinitely.
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float = DEFAULT_MESSAGES_PER_SECOND, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else int(rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, count: int = 1) -> None:
+        """Wait until ``count`` messages may be sent."""
+        async with self._lock:
+            remaining = float(count)
+            while remaining > 0:
+                self._refill()
+                take = min(remaining, self._tokens)
+                self._tokens -= take
+                remaining -= take
+                if remaining > 0:
+                    await asyncio.sleep(min(remaining, self.burst) / self.rate)
+
+
+__all__ = ["DEFAULT_MESSAGES_PER_SECOND", "RequestPacer"]
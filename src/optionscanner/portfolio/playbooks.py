@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import ClassVar, Dict, Iterable, List
 
 import pandas as pd
 
@@ -19,6 +19,13 @@ class PlaybookContext:
 class PlaybookEngine:
     """Dispatches playbook logic per strategy type."""
 
+    # Lower-cased strategy name -> handler method, looked up on the instance so
+    # subclasses can override individual handlers.
+    _HANDLERS: ClassVar[Dict[str, str]] = {
+        "pmcc": "_handle_pmcc",
+        "condor": "_handle_condor",
+    }
+
     def __init__(self, context: PlaybookContext) -> None:
         self._context = context
 
@@ -30,13 +37,21 @@ class PlaybookEngine:
         for breach in breaches:
             symbol = (breach.symbol or "portfolio").upper()
             breach_by_symbol.setdefault(symbol, []).append(breach)
-        for strategy, group in positions.groupby("strategy"):
-            if not strategy:
-                continue
-            strategy = str(strategy).lower()
-            handler = getattr(self, f"_handle_{strategy}", None)
-            if handler is None:
-                continue
+        # Only strategies with a playbook are grouped; the rest are dropped up front.
+        strategies = positions["strategy"].astype(str).str.lower()
+        handled = strategies.isin(self._HANDLERS)
+        if not handled.any():
+            return []
+        # Coerce the numeric columns the handlers read once, not once per group.
+        positions = positions[handled]
+        numeric = {
+            column: pd.to_numeric(positions[column], errors="coerce")
+            for column in ("quantity", "strike")
+            if column in positions
+        }
+        positions = positions.assign(**numeric)
+        for strategy, group in positions.groupby(strategies[handled]):
+            handler = getattr(self, self._HANDLERS[strategy])
             symbol = str(group["underlying"].iloc[0])
             symbol_breaches = breach_by_symbol.get(symbol.upper(), [])
             actions.extend(handler(symbol, group, symbol_breaches))
@@ -48,11 +63,12 @@ class PlaybookEngine:
         positions: pd.DataFrame,
         breaches: Iterable[RiskBreach],
     ) -> List[str]:
+        """Roll plan for a PMCC; ``positions["quantity"]`` is already numeric (see ``generate``)."""
         rules = self._context.roll_rules.get("pmcc", {})
         take_profit_pct = float(rules.get("take_profit_pct", 0.6))
         roll_delta = float(rules.get("roll_up_if_short_delta_gt", 0.45))
         roll_days = int(rules.get("roll_out_days", 21))
-        short_legs = positions[pd.to_numeric(positions["quantity"], errors="coerce") < 0]
+        short_legs = positions[positions["quantity"] < 0]
         if short_legs.empty:
             return []
         short = short_legs.iloc[0]
@@ -81,9 +97,10 @@ class PlaybookEngine:
         positions: pd.DataFrame,
         breaches: Iterable[RiskBreach],
     ) -> List[str]:
+        """Harvest plan for a condor; ``positions["strike"]`` is already numeric (see ``generate``)."""
         rules = self._context.roll_rules.get("condor", {})
         take_profit_pct = float(rules.get("take_profit_pct", 0.6))
-        strikes = pd.to_numeric(positions.get("strike"), errors="coerce")
+        strikes = positions["strike"] if "strike" in positions else pd.Series(dtype="float64")
         width = float(strikes.max() - strikes.min()) if not strikes.empty else 0.0
         reason = [f"width {width:.0f}"] if width == width else []  # NaN guard
         for breach in breaches:
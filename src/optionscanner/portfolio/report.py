@@ -134,7 +134,8 @@ class PortfolioReporter:
             return "Concentration: None"
         top = concentration.head(3)
         parts = [
-            f"{row.underlying} {row.gross_pct:.0%}" for _, row in top.iterrows()
+            f"{underlying} {gross_pct:.0%}"
+            for underlying, gross_pct in zip(top["underlying"].tolist(), top["gross_pct"].tolist())
         ]
         return "Concentration: " + ", ".join(parts)
 
@@ -210,7 +211,7 @@ class PortfolioReporter:
         )
         now = datetime.now(timezone.utc)
         position_lines = []
-        for _, row in positions.iterrows():
+        for row in positions.to_dict("records"):
             symbol = str(row.get("symbol", row.get("underlying", "")))
             right = str(row.get("right", ""))[:1].upper()
             strike = row.get("strike", "")
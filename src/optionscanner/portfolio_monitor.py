@@ -1,17 +1,18 @@
 """Daily portfolio monitoring using NautilusTrader + IBKR."""
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pandas as pd
-import yaml
 from ib_async import IB, Contract, Option
 from loguru import logger
 
-from logging_utils import configure_logging
+from optionscanner.event_loop import event_loop_runner
+from optionscanner.logging_utils import configure_logging
+from optionscanner.main import load_config
+from optionscanner.option_data import parse_expiry
 
 
 class PortfolioMonitor:
@@ -54,12 +55,12 @@ class PortfolioMonitor:
             days_to_expiry = None
             if isinstance(contract, Option):
                 ticker = await self._ib.reqMktDataAsync(contract, "", True, False)
-                if ticker.modelGreeks:
-                    delta = ticker.modelGreeks.delta or 0.0
-                    theta = ticker.modelGreeks.theta or 0.0
-                expiry_dt = datetime.strptime(contract.lastTradeDateOrContractMonth, "%Y%m%d").replace(
-                    tzinfo=timezone.utc
-                )
+                greeks = ticker.modelGreeks
+                if greeks:
+                    delta = greeks.delta or 0.0
+                    theta = greeks.theta or 0.0
+                expiry_date = parse_expiry(contract.lastTradeDateOrContractMonth)
+                expiry_dt = datetime(expiry_date.year, expiry_date.month, expiry_date.day, tzinfo=timezone.utc)
                 days_to_expiry = (expiry_dt - datetime.now(timezone.utc)).days
             summaries.append(
                 {
@@ -133,10 +134,6 @@ async def main() -> None:
         await monitor.disconnect()
 
 
-def load_config(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as file:
-        return yaml.safe_load(file)
-
-
 if __name__ == "__main__":
-    asyncio.run(main())
+    with event_loop_runner() as runner:
+        runner.run(main())
@@ -6,7 +6,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Mapping, Optional
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from loguru import logger
 
@@ -115,12 +115,48 @@ class PositionCache:
         signal: TradeSignal,
         snapshot: Optional[OptionChainSnapshot] = None,
     ) -> None:
+        self._record(strategy_name, signal, self._snapshot_context(snapshot), datetime.now(timezone.utc).isoformat())
+
+    def record_signals(
+        self,
+        signals: Iterable[Tuple[str, TradeSignal]],
+        snapshots: Mapping[str, OptionChainSnapshot],
+        seen_at: Optional[datetime] = None,
+    ) -> None:
+        """Record a run's ``(strategy_name, signal)`` pairs in one pass.
+
+        ``snapshots`` is keyed by upper-case symbol. The timestamp and each
+        symbol's snapshot context are computed once rather than per signal. A
+        signal that cannot be recorded is logged and skipped so the rest of the
+        run is still cached.
+        """
+        now = (seen_at or datetime.now(timezone.utc)).isoformat()
+        contexts: Dict[str, Dict[str, object]] = {}
+        for strategy_name, signal in signals:
+            try:
+                symbol = (signal.symbol or "").upper()
+                context = contexts.get(symbol)
+                if context is None:
+                    context = contexts[symbol] = self._snapshot_context(snapshots.get(symbol))
+                self._record(strategy_name, signal, context, now)
+            except Exception:
+                logger.exception(
+                    "Failed to cache signal | symbol={symbol} strategy={strategy}",
+                    symbol=getattr(signal, "symbol", None),
+                    strategy=strategy_name,
+                )
+
+    @staticmethod
+    def _snapshot_context(snapshot: Optional[OptionChainSnapshot]) -> Dict[str, object]:
+        if snapshot is None:
+            return {}
+        return {
+            "underlying_price": float(snapshot.underlying_price),
+            "snapshot_ts": snapshot.timestamp.isoformat(),
+        }
+
+    def _record(self, strategy_name: str, signal: TradeSignal, context: Dict[str, object], now: str) -> None:
         key = self._entry_key(signal)
-        now = datetime.now(timezone.utc).isoformat()
-        context: Dict[str, object] = {}
-        if snapshot is not None:
-            context["underlying_price"] = float(snapshot.underlying_price)
-            context["snapshot_ts"] = snapshot.timestamp.isoformat()
         entry = self._entries.get(key)
         if entry:
             entry.last_seen = now
@@ -142,7 +178,7 @@ class PositionCache:
             expiry=signal.expiry.isoformat(),
             opened_at=now,
             rationale=signal.rationale,
-            context=context,
+            context=dict(context),
         )
         self._entries[key] = cached
         logger.info(
@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+import csv
+import functools
 import json
-from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 from loguru import logger
 from zoneinfo import ZoneInfo
 
@@ -19,15 +22,33 @@ from optionscanner.notifications import SlackNotifier
 from optionscanner.option_data import BaseDataFetcher, OptionChainSnapshot
 from optionscanner.position_cache import ExitRecommendation, PositionCache
 from optionscanner.signal_ranking import SignalRanker, StrategyConfig, load_strategy_configs
-from optionscanner.stock_data import StockDataFetcher
-from optionscanner.technical_indicators import TechnicalIndicatorProcessor
 from optionscanner.market_state import DictMarketStateProvider, MarketStateClassifier, MarketStateResult
 from optionscanner.market_context import MarketContextProvider, MarketContextConfig
 from optionscanner.economic_calendar_ai import EconomicCalendarAIFetcher
-from optionscanner.scheduling import compute_next_run, parse_schedule_times
+from optionscanner.scheduling import compute_next_run, parse_schedule_times, sleep_until
 from optionscanner.strategies.base import BaseOptionStrategy, TradeSignal
 from optionscanner.trade_history import TradeHistory
 
+if TYPE_CHECKING:
+    from optionscanner.stock_data import StockDataFetcher
+    from optionscanner.technical_indicators import TechnicalIndicatorProcessor
+
+# Downstream readers may index the signals CSV by position; keep this column order stable.
+_SIGNAL_CSV_FIELDS = (
+    "symbol",
+    "strategy",
+    "direction",
+    "rationale",
+    "ai_reason",
+    "selection_type",
+    "composite_score",
+    "reason",
+)
+_SIGNAL_LOG_SCHEMA = pa.schema(
+    [(name, pa.float64() if name == "composite_score" else pa.string()) for name in _SIGNAL_CSV_FIELDS]
+    + [("as_of", pa.timestamp("us", tz="UTC"))]
+)
+
 
 async def run_once(
     fetcher: BaseDataFetcher,
@@ -61,6 +82,9 @@ async def run_once(
         config: Optional config dict
     """
     loop = asyncio.get_running_loop()
+    # One canonical timestamp per run, shared by the snapshots and result files.
+    run_time = datetime.now(timezone.utc)
+    timestamp = run_time.strftime("%Y%m%d_%H%M%S")
     if trade_executor:
         trade_executor.set_event_loop(loop)
 
@@ -86,7 +110,7 @@ async def run_once(
             indicator_processor=indicator_processor,
             history_kwargs=stock_history_kwargs or {},
         )
-    snapshots = await fetcher.fetch_all(symbol_list)
+    snapshots = await fetcher.fetch_all(symbol_list, timestamp=run_time)
     if underlying_context:
         for snapshot in snapshots:
             context = underlying_context.get(snapshot.symbol.upper())
@@ -129,20 +153,26 @@ async def run_once(
         symbols=symbol_list,
     )
 
-    # Collect signals from all strategies
+    # Collect signals from all strategies. Each strategy scans on an executor
+    # thread so they overlap and the event loop stays responsive; results are
+    # recorded afterwards in strategy order.
+    strategy_results = await asyncio.gather(
+        *(loop.run_in_executor(None, strategy.on_data, snapshots) for strategy in strategies),
+        return_exceptions=True,
+    )
     aggregated_signals: List[Tuple[str, TradeSignal]] = []
-    for strategy in strategies:
+    for strategy, result in zip(strategies, strategy_results):
+        if isinstance(result, Exception):
+            logger.opt(exception=result).error("Strategy {name} failed", name=strategy.name)
+            continue
         try:
-            signals = strategy.on_data(snapshots)
-            for signal in signals:
-                aggregated_signals.append((strategy.name, signal))
-                cache.record_signal(strategy.name, signal, snapshot_by_symbol.get((signal.symbol or "").upper()))
+            aggregated_signals.extend((strategy.name, signal) for signal in result)
         except Exception:
             logger.exception("Strategy {name} failed", name=strategy.name)
+    cache.record_signals(aggregated_signals, snapshot_by_symbol, seen_at=run_time)
 
     exit_recommendations = cache.evaluate_exits(snapshot_by_symbol)
     cache.save()
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     if exit_recommendations:
         _export_exit_recommendations(results_dir, exit_recommendations, timestamp)
     if not aggregated_signals:
@@ -159,51 +189,67 @@ async def run_once(
         market_context=market_context,
         signal_history=signal_history,
     )
-    ranked_signals = ranker.rank_signals(aggregated_signals)
 
     # AI signal selection (top 5 qualitative)
     ai_selector = AISignalSelector(enable_gemini=enable_gemini, top_k=5)
-    ai_result = ai_selector.select(
-        aggregated_signals,
-        market_context=market_context.get_context().to_dict() if market_context.get_context() else None,
+    current_context = market_context.get_context()
+
+    # The Gemini selection is network-bound and independent of the quantitative
+    # ranking, so both run on executor threads concurrently.
+    ranked_signals, ai_result = await asyncio.gather(
+        loop.run_in_executor(None, ranker.rank_signals, aggregated_signals),
+        loop.run_in_executor(
+            None,
+            functools.partial(
+                ai_selector.select,
+                aggregated_signals,
+                market_context=current_context.to_dict() if current_context else None,
+            ),
+        ),
     )
 
-    # Save all signals to CSV for reference
-    file_path = results_dir / f"signals_{timestamp}.csv"
-    rows: List[Dict[str, Any]] = []
-
     # Build a lookup for AI reasons by (strategy_name, signal) tuple
     ai_reason_lookup: Dict[str, str] = ai_result.ai_reasons
 
-    for strategy_name, signal in ai_result.selections:
-        signal_id = f"{signal.symbol}_{strategy_name}"
-        ai_reason = ai_reason_lookup.get(signal_id, "")
-        rows.append({
-            "symbol": signal.symbol,
-            "strategy": strategy_name,
-            "direction": signal.direction,
-            "rationale": signal.rationale,
-            "ai_reason": ai_reason,
-            "selection_type": "AI",
-        })
-
-    for score in ranked_signals:
-        rows.append({
-            "symbol": score.signal.symbol,
-            "strategy": score.strategy_name,
-            "direction": score.signal.direction,
-            "rationale": score.signal.rationale,
-            "composite_score": score.composite_score,
-            "reason": score.reason,
-            "selection_type": "QUANT",
-        })
-
-    if rows:
-        all_signals_df = pd.DataFrame(rows)
-        all_signals_df.to_csv(file_path, index=False)
-        logger.info("Saved {count} signals to {path}", count=len(all_signals_df), path=str(file_path))
-    else:
-        file_path = None
+    # Rows are positional tuples in _SIGNAL_CSV_FIELDS order; no per-signal dicts.
+    signal_rows: List[Tuple[Any, ...]] = [
+        (
+            signal.symbol,
+            strategy_name,
+            signal.direction,
+            signal.rationale,
+            ai_reason_lookup.get(f"{signal.symbol}_{strategy_name}", ""),
+            "AI",
+            None,
+            "",
+        )
+        for strategy_name, signal in ai_result.selections
+    ]
+    signal_rows.extend(
+        (
+            score.signal.symbol,
+            score.strategy_name,
+            score.signal.direction,
+            score.signal.rationale,
+            "",
+            "QUANT",
+            score.composite_score,
+            score.reason,
+        )
+        for score in ranked_signals
+    )
+
+    file_path: Optional[Path] = None
+    if signal_rows:
+        _append_signal_log(results_dir / "signals", signal_rows, run_time)
+        if (config or {}).get("signals_csv", True):
+            # A per-run CSV for humans; the Parquet log above is the durable record.
+            file_path = results_dir / f"signals_{timestamp}.csv"
+            with file_path.open("w", newline="", encoding="utf-8") as handle:
+                writer = csv.writer(handle)
+                writer.writerow(_SIGNAL_CSV_FIELDS)
+                writer.writerows(signal_rows)
+            logger.info("Saved {count} signals to {path}", count=len(signal_rows), path=str(file_path))
 
     # Save AI selection results to JSON
     ai_json_path = results_dir / f"gemini_signal_selection_{timestamp}.json"
@@ -233,22 +279,25 @@ async def run_once(
     # Get top 5 for execution (quantitative ranking)
     finalist_payload = [(s.strategy_name, s.signal, s.composite_score, s.reason) for s in ranked_signals]
 
+    # Slack delivery and order placement are independent; overlap them.
+    follow_ups = []
     if slack_notifier:
-        loop = asyncio.get_running_loop()
         if not ranked_signals and not ai_result.selections:
             logger.info("No signals to send to Slack")
         else:
             # Send both AI picks (5) and quantitative picks (5) = 10 total
-            await loop.run_in_executor(
-                None, slack_notifier.send_ai_and_quant_signals,
+            follow_ups.append(("Slack notification", slack_notifier.send_ai_and_quant_signals_async(
                 ai_result.selections, ai_result.ai_reasons, ranked_signals, file_path, market_context
-            )
+            )))
 
     if trade_executor and finalist_payload:
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(
+        follow_ups.append(("Trade execution", loop.run_in_executor(
             None, trade_executor.execute_finalists, finalist_payload, snapshot_by_symbol
-        )
+        )))
+    results = await asyncio.gather(*(task for _, task in follow_ups), return_exceptions=True)
+    for (name, _), result in zip(follow_ups, results):
+        if isinstance(result, Exception):
+            logger.opt(exception=result).error("{name} failed", name=name)
 
 
 async def _fetch_underlying_context(
@@ -265,7 +314,11 @@ async def _fetch_underlying_context(
         logger.exception("Failed to download underlying stock history")
         return {}, {}
 
-    processor = indicator_processor or TechnicalIndicatorProcessor()
+    if indicator_processor is None:
+        from optionscanner.technical_indicators import TechnicalIndicatorProcessor
+
+        indicator_processor = TechnicalIndicatorProcessor()
+    processor = indicator_processor
     processor.ensure_default_moving_averages()
     classifier = MarketStateClassifier()
     context: Dict[str, Dict[str, Any]] = {}
@@ -312,6 +365,31 @@ async def _fetch_underlying_context(
     return context, state_results
 
 
+def _append_signal_log(log_dir: Path, rows: Sequence[Tuple[Any, ...]], run_time: datetime) -> None:
+    """Append one run's signals to the date-partitioned Parquet signal log."""
+    columns = dict(zip(_SIGNAL_CSV_FIELDS, zip(*rows)))
+    table = pa.table(
+        {
+            **{name: pa.array(columns[name], _SIGNAL_LOG_SCHEMA.field(name).type) for name in _SIGNAL_CSV_FIELDS},
+            "as_of": pa.array([run_time] * len(rows), _SIGNAL_LOG_SCHEMA.field("as_of").type),
+            "date": pa.array([f"{run_time:%Y-%m-%d}"] * len(rows), pa.string()),
+        }
+    )
+    try:
+        ds.write_dataset(
+            table,
+            base_dir=log_dir,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive"),
+            basename_template=f"signals-{run_time:%Y%m%d_%H%M%S}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+    except Exception as exc:
+        logger.warning("Failed to append signal log | path={path} error={error}", path=str(log_dir), error=exc)
+        return
+    logger.info("Appended {count} signals to {path}", count=len(rows), path=str(log_dir))
+
+
 def _export_exit_recommendations(
     results_dir: Path,
     recommendations: List[ExitRecommendation],
@@ -385,7 +463,7 @@ async def run_scheduler(
             next_time=next_run.isoformat(),
             seconds=sleep_seconds,
         )
-        await asyncio.sleep(sleep_seconds)
+        await sleep_until(next_run)
         start = datetime.now(tz)
         logger.info("Starting scheduled run at {start}", start=start.isoformat())
         try:
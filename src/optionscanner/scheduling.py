@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_right
 from datetime import datetime, timedelta, time as dt_time
 from typing import Any, Dict, List
 
@@ -42,21 +44,38 @@ def parse_schedule_times(schedule_config: Dict[str, Any]) -> List[dt_time]:
 
 
 def compute_next_run(now: datetime, scheduled_times: List[dt_time]) -> datetime:
-    """Compute the next scheduled run time after *now* for the configured times."""
-
-    candidates: List[datetime] = []
-    for scheduled_time in scheduled_times:
-        candidate = now.replace(
-            hour=scheduled_time.hour,
-            minute=scheduled_time.minute,
-            second=0,
-            microsecond=0,
-        )
-        if candidate <= now:
-            candidate += timedelta(days=1)
-        candidates.append(candidate)
+    """Compute the next scheduled run time after *now* for the configured times.
+
+    *scheduled_times* must be sorted, as returned by :func:`parse_schedule_times`;
+    the next slot is then found by bisection instead of building every candidate.
+    """
+
+    if not scheduled_times:
+        raise ValueError("scheduled_times must not be empty")
+    index = bisect_right(scheduled_times, now.time(), key=lambda value: value.replace(second=0, microsecond=0))
+    day = now
+    if index == len(scheduled_times):
+        # Every slot today has passed; roll over to the first one tomorrow.
+        index = 0
+        day = now + timedelta(days=1)
+    scheduled_time = scheduled_times[index]
+    return day.replace(hour=scheduled_time.hour, minute=scheduled_time.minute, second=0, microsecond=0)
+
+
+async def sleep_until(target: datetime, *, max_interval: float = 300.0) -> None:
+    """Sleep until the wall-clock *target* without drifting.
+
+    ``asyncio.sleep`` runs on the loop's monotonic clock, which pauses while the
+    host is suspended and ignores wall-clock corrections, so one multi-hour sleep
+    can fire late. Sleeping in slices of at most *max_interval* seconds and
+    re-reading the wall clock keeps runs aligned with the schedule.
+    """
 
-    return min(candidates)
+    while True:
+        remaining = (target - datetime.now(target.tzinfo)).total_seconds()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(remaining, max_interval))
 
 
-__all__ = ["compute_next_run", "parse_schedule_times", "DEFAULT_SCHEDULE_TIME"]
+__all__ = ["compute_next_run", "parse_schedule_times", "sleep_until", "DEFAULT_SCHEDULE_TIME"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -39,6 +39,7 @@ class StockDataFetcher:
         exchange: str = "SMART",
         currency: str = "USD",
         history_dir: Optional[Path] = None,
+        max_concurrent_requests: int = 6,
     ) -> None:
         self.host = host
         self.port = port
@@ -53,6 +54,9 @@ class StockDataFetcher:
         self._lock = asyncio.Lock()
         self._market_data_type_code = MARKET_DATA_TYPES[market_data_type]
         self._connected = False
+        # IBKR paces historical data by request count, not concurrency; a few
+        # requests in flight overlap their round trips without tripping it.
+        self._history_slots = asyncio.Semaphore(max_concurrent_requests)
         default_history = Path("historydata") / "stock_prices"
         self.history_dir = Path(history_dir) if history_dir else default_history
         self.history_dir.mkdir(parents=True, exist_ok=True)
@@ -106,16 +110,23 @@ class StockDataFetcher:
         return frame
 
     async def fetch_history_many(self, symbols: Iterable[str], **kwargs: Any) -> Dict[str, pd.DataFrame]:
-        """Download history for multiple symbols sequentially."""
+        """Download history for multiple symbols concurrently, in input order.
 
-        results: Dict[str, pd.DataFrame] = {}
-        for symbol in symbols:
-            try:
-                results[symbol] = await self.fetch_history(symbol, **kwargs)
-            except Exception as exc:  # pragma: no cover - network errors
-                logger.exception("Failed to download stock data | symbol={symbol}", symbol=symbol)
-                results[symbol] = pd.DataFrame()
-        return results
+        At most ``max_concurrent_requests`` downloads are in flight at once. A
+        symbol whose download fails maps to an empty DataFrame.
+        """
+
+        async def fetch_one(symbol: str) -> pd.DataFrame:
+            async with self._history_slots:
+                try:
+                    return await self.fetch_history(symbol, **kwargs)
+                except Exception:
+                    logger.exception("Failed to download stock data | symbol={symbol}", symbol=symbol)
+                    return pd.DataFrame()
+
+        symbols = list(dict.fromkeys(symbols))
+        frames = await asyncio.gather(*(fetch_one(symbol) for symbol in symbols))
+        return dict(zip(symbols, frames))
 
     def _build_request(self, overrides: Dict[str, str]) -> HistoricalDataRequest:
         request = HistoricalDataRequest()
@@ -146,7 +157,7 @@ class StockDataFetcher:
     def _persist_history(self, symbol: str, frame: pd.DataFrame) -> None:
         if frame.empty:
             return
-        snapshot_time = datetime.utcnow()
+        snapshot_time = datetime.now(timezone.utc).replace(tzinfo=None)
         timestamp_str = snapshot_time.strftime("%Y%m%d_%H%M%S")
         symbol_upper = symbol.upper()
         parquet_path = self.history_dir / f"{symbol_upper}_{timestamp_str}.parquet"
@@ -0,0 +1,16 @@
+"""Generated by tools/gen_strategy_registry.py; do not edit by hand."""
+
+SOURCE_DIGEST = "6f75a055db1847245fc1da72ce85acad"
+
+STRATEGY_CLASSES = (
+    ("optionscanner.strategies.strategy_covered_call", "CoveredCallStrategy"),
+    ("optionscanner.strategies.strategy_earnings_gambal", "EarningsGambalStrategy"),
+    ("optionscanner.strategies.strategy_iron_condor", "IronCondorStrategy"),
+    ("optionscanner.strategies.strategy_pmcc", "PoorMansCoveredCallStrategy"),
+    ("optionscanner.strategies.strategy_put_credit_spread", "PutCreditSpreadStrategy"),
+    ("optionscanner.strategies.strategy_tqqq_rotation", "TqqqQqqRotationStrategy"),
+    ("optionscanner.strategies.strategy_vertical_spread", "VerticalSpreadStrategy"),
+    ("optionscanner.strategies.strategy_vix_fear_fade", "VixFearFadeStrategy"),
+    ("optionscanner.strategies.strategy_whale_following", "WhaleFollowingStrategy"),
+    ("optionscanner.strategies.strategy_wheel", "WheelStrategy"),
+)
@@ -1,3 +1,4 @@
+import dataclasses
 import unittest
 from datetime import datetime, timedelta, timezone
 
@@ -96,6 +97,26 @@ class SignalValidationAgentTests(unittest.TestCase):
         self.assertTrue(review)
         self.assertIsNone(client.last_user_prompt)
 
+    def test_review_batch_matches_per_signal_reviews(self) -> None:
+        client = DummyGeminiClient(response="unused")
+        agent = SignalValidationAgent(client=client, enable_gemini=False)
+        first = build_signal()
+        signals = [
+            first,
+            dataclasses.replace(first, strike=510.0),
+            dataclasses.replace(first, direction="LONG_PUT", option_type="PUT"),
+            dataclasses.replace(first, symbol="AAPL"),
+        ]
+        snapshot = build_snapshot()
+
+        batch = agent.review_batch(signals, {"NVDA": snapshot})
+
+        expected = [
+            agent.review(signal, snapshot if signal.symbol == "NVDA" else None, signals) for signal in signals
+        ]
+        self.assertEqual(batch, expected)
+        self.assertIn("disagree", batch[2])
+
 
 if __name__ == "__main__":
     unittest.main()
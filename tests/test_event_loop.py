@@ -0,0 +1,30 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from optionscanner import event_loop
+
+
+def test_loop_factory_prefers_uvloop(monkeypatch):
+    fake = types.SimpleNamespace(new_event_loop=asyncio.new_event_loop)
+    monkeypatch.setitem(sys.modules, "uvloop", fake)
+    monkeypatch.setattr(event_loop.sys, "platform", "linux")
+    monkeypatch.delenv("OPTIONSCANNER_DISABLE_UVLOOP", raising=False)
+    assert event_loop.loop_factory() is fake.new_event_loop
+
+
+@pytest.mark.parametrize("value", ["1", "true", "Yes", " on "])
+def test_loop_factory_respects_disable_flag(monkeypatch, value):
+    fake = types.SimpleNamespace(new_event_loop=asyncio.new_event_loop)
+    monkeypatch.setitem(sys.modules, "uvloop", fake)
+    monkeypatch.setattr(event_loop.sys, "platform", "linux")
+    monkeypatch.setenv("OPTIONSCANNER_DISABLE_UVLOOP", value)
+    assert event_loop.loop_factory() is None
+
+
+def test_event_loop_runner_sets_current_loop():
+    with event_loop.event_loop_runner() as runner:
+        assert asyncio.get_event_loop() is runner.get_loop()
+        assert runner.run(asyncio.sleep(0, result=1)) == 1
@@ -0,0 +1,166 @@
+"""Tests for the Gemini client generation cache."""
+import os
+import time
+
+import pytest
+
+from optionscanner import gemini_client
+from optionscanner.gemini_client import GeminiClient, GenerationCache
+
+
+class DummyResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class DummyModel:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def generate_content(self, prompt: str) -> DummyResponse:
+        self.calls += 1
+        return DummyResponse(self.text)
+
+
+class DummyGenai:
+    def __init__(self, model: DummyModel) -> None:
+        self.model = model
+        self.configure_calls = 0
+        self.models_built = 0
+
+    def configure(self, api_key: str) -> None:
+        self.configure_calls += 1
+
+    def GenerationConfig(self, **kwargs):  # noqa: N802 - mirrors SDK name
+        return kwargs
+
+    def GenerativeModel(self, *args, **kwargs):  # noqa: N802 - mirrors SDK name
+        self.models_built += 1
+        return self.model
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEMINI_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("GEMINI_CACHE_ENABLE", "true")
+    monkeypatch.delenv("GEMINI_CACHE_TTL_SECONDS", raising=False)
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    client = GeminiClient()
+    client.model_name = "test-model"
+    model = DummyModel("cached answer")
+    monkeypatch.setattr(gemini_client, "genai", DummyGenai(model))
+    return client, model
+
+
+def test_generate_reuses_cached_response(client):
+    gemini, model = client
+
+    first = gemini.generate(system_prompt="sys", user_prompt="user")
+    second = gemini.generate(system_prompt="sys", user_prompt="user")
+
+    assert first == second == "cached answer"
+    assert model.calls == 1
+
+
+def test_generate_misses_on_different_prompt(client):
+    gemini, model = client
+
+    gemini.generate(system_prompt="sys", user_prompt="one")
+    gemini.generate(system_prompt="sys", user_prompt="two")
+
+    assert model.calls == 2
+
+
+def test_generate_skips_cache_unless_enabled(client, monkeypatch):
+    gemini, model = client
+    monkeypatch.delenv("GEMINI_CACHE_ENABLE")
+
+    gemini.generate(system_prompt="sys", user_prompt="user")
+    gemini.generate(system_prompt="sys", user_prompt="user")
+
+    assert model.calls == 2
+
+
+def test_expired_entry_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEMINI_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("GEMINI_CACHE_ENABLE", "1")
+    cache = GenerationCache(default_ttl_seconds=60)
+    path = cache.path_for(cache.make_key("a", "b"))
+    cache.write(path, "stale")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.read(path) is None
+
+
+def test_eviction_keeps_newest_entries(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEMINI_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("GEMINI_CACHE_ENABLE", "1")
+    cache = GenerationCache(max_entries=2)
+    paths = []
+    for index in range(3):
+        path = cache.path_for(cache.make_key(index))
+        cache.write(path, str(index))
+        stamp = time.time() - (10 - index)
+        os.utime(path, (stamp, stamp))
+        paths.append(path)
+
+    assert not paths[0].exists()
+    assert paths[1].exists()
+    assert paths[2].exists()
+
+
+def test_models_are_reused_per_system_prompt(monkeypatch):
+    model = DummyModel("ok")
+    fake_genai = DummyGenai(model)
+    monkeypatch.setattr(gemini_client, "genai", fake_genai)
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    gemini = GeminiClient(model_cache_size=2)
+
+    for prompt in ("validate", "explain", "validate", "explain"):
+        gemini._ensure_model(prompt)
+    assert fake_genai.models_built == 2
+    assert fake_genai.configure_calls == 1
+
+    gemini._ensure_model("third")
+    gemini._ensure_model("validate")
+    assert fake_genai.models_built == 4
+
+
+class _Obj:
+    def __init__(self, **kwargs) -> None:
+        self.__dict__.update(kwargs)
+
+
+def test_extract_text_prefers_text_attribute():
+    gemini = GeminiClient()
+    assert gemini._extract_text_from_response(_Obj(text="  hello ")) == "hello"
+
+
+def test_extract_text_joins_candidate_parts():
+    gemini = GeminiClient()
+    response = _Obj(
+        text="",
+        candidates=[_Obj(content=_Obj(parts=[_Obj(text="a"), _Obj(text=""), _Obj(text="b ")]))],
+    )
+    assert gemini._extract_text_from_response(response) == "a b"
+
+
+def test_extract_text_handles_dict_shaped_candidates():
+    gemini = GeminiClient()
+    response = _Obj(candidates=[{"content": {"parts": [{"text": "x"}, "y"]}}])
+    assert gemini._extract_text_from_response(response) == "x y"
+
+
+def test_extract_text_raises_with_finish_reason():
+    gemini = GeminiClient()
+    response = _Obj(candidates=[{"finish_reason": "SAFETY", "content": {"parts": []}}])
+    with pytest.raises(gemini_client.GeminiClientError, match="finish_reason=SAFETY"):
+        gemini._extract_text_from_response(response)
+
+
+def test_extract_text_single_part_fast_path():
+    gemini = GeminiClient()
+    response = _Obj(text=None, candidates=[_Obj(content=_Obj(parts=[_Obj(text=" only ")]))])
+    assert gemini._extract_text_from_response(response) == "only"
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from optionscanner import jsonio
+
+
+def test_dumps_encodes_numpy_values():
+    payload = {"count": np.int64(3), "mark": np.float32(1.5), "strikes": np.array([100.0, 105.0])}
+    assert jsonio.loads(jsonio.dumps(payload)) == {"count": 3, "mark": 1.5, "strikes": [100.0, 105.0]}
+
+
+def test_dumps_matches_stdlib_fallback(monkeypatch):
+    payload = {"count": np.int64(3), "text": "ok …and 2 more", "nested": [1, None, True]}
+    encoded = jsonio.dumps(payload)
+    monkeypatch.setattr(jsonio, "orjson", None)
+    assert jsonio.dumps(payload) == encoded
+    assert "…".encode() in encoded
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        jsonio.dumps({"value": object()})
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
 
-from optionscanner.main import discover_strategies, resolve_market_data_type
+from optionscanner import main as main_module
+from optionscanner.main import (
+    IBKRConnectionSettings,
+    _camel_to_snake,
+    discover_strategies,
+    load_config,
+    resolve_market_data_type,
+)
 from optionscanner.strategies.strategy_put_credit_spread import PutCreditSpreadStrategy
 
 
@@ -52,3 +60,153 @@ def test_resolve_market_data_type_auto_uppercase() -> None:
         result = resolve_market_data_type("AUTO")
         assert result == "FROZEN"
 
+
+
+def test_load_config_returns_independent_copies(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("tickers: [SPY]\nportfolio:\n  enabled: true\n", encoding="utf-8")
+
+    first = load_config(config_path)
+    first["tickers"].append("QQQ")
+    second = load_config(config_path)
+
+    assert second["tickers"] == ["SPY"]
+    assert second["portfolio"] == {"enabled": True}
+
+
+def test_load_config_reloads_after_file_change(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("tickers: [SPY]\n", encoding="utf-8")
+    assert load_config(config_path)["tickers"] == ["SPY"]
+
+    config_path.write_text("tickers: [SPY, QQQ]\n", encoding="utf-8")
+    assert load_config(config_path)["tickers"] == ["SPY", "QQQ"]
+
+
+def test_camel_to_snake_matches_strategy_slugs() -> None:
+    assert _camel_to_snake("PutCreditSpreadStrategy") == "put_credit_spread_strategy"
+    assert _camel_to_snake("TqqqQqqRotationStrategy") == "tqqq_qqq_rotation_strategy"
+
+
+def test_load_config_writes_and_prefers_json_sidecar(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("tickers: [SPY]\n", encoding="utf-8")
+    load_config(config_path)
+
+    sidecar = tmp_path / "config.yaml.json"
+    assert sidecar.exists()
+    assert json.loads(sidecar.read_text(encoding="utf-8"))["config"] == {"tickers": ["SPY"]}
+
+    main_module._CONFIG_CACHE.clear()
+    with patch("yaml.load", side_effect=AssertionError("YAML should not be parsed")):
+        assert load_config(config_path) == {"tickers": ["SPY"]}
+
+
+def test_load_config_ignores_stale_json_sidecar(tmp_path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("tickers: [SPY]\n", encoding="utf-8")
+    load_config(config_path)
+
+    config_path.write_text("tickers: [QQQ, IWM]\n", encoding="utf-8")
+    main_module._CONFIG_CACHE.clear()
+    assert load_config(config_path) == {"tickers": ["QQQ", "IWM"]}
+
+
+def test_ibkr_connection_settings_prefers_config_over_env() -> None:
+    settings = IBKRConnectionSettings.from_config(
+        {"host": "gateway", "port": "4002"},
+        {"IBKR_HOST": "ignored", "IBKR_CLIENT_ID": " 7 "},
+    )
+    assert settings == IBKRConnectionSettings(host="gateway", port=4002, client_id=7)
+
+
+def test_ibkr_connection_settings_defaults_invalid_client_id() -> None:
+    settings = IBKRConnectionSettings.from_config({"client_id": "abc"}, {})
+    assert settings == IBKRConnectionSettings(host="ib-gateway", port=4004, client_id=1)
+
+
+def test_ibkr_connection_settings_rejects_invalid_port() -> None:
+    with pytest.raises(ValueError, match="ibkr.port"):
+        IBKRConnectionSettings.from_config({"port": "not-a-port"}, {})
+
+
+def test_strategy_registry_matches_module_scan():
+    from optionscanner.strategies._registry import STRATEGY_CLASSES
+
+    from optionscanner.strategies._registry import SOURCE_DIGEST
+
+    module_names = main_module._strategy_module_names()
+    scanned = main_module._scan_strategy_classes(module_names)
+    message = "Strategy registry is out of date; run `python tools/gen_strategy_registry.py`"
+    assert list(STRATEGY_CLASSES) == [(cls.__module__, cls.__name__) for cls in scanned], message
+    assert SOURCE_DIGEST == main_module._strategy_source_digest(module_names), message
+
+
+def test_discover_strategies_does_not_import_disabled_registry_entries(monkeypatch):
+    module_name = "optionscanner.strategies.strategy_wheel"
+    monkeypatch.delitem(main_module.sys.modules, module_name, raising=False)
+    imported = []
+    real_import = main_module.importlib.import_module
+
+    def tracking_import(name, *args, **kwargs):
+        imported.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(main_module.importlib, "import_module", tracking_import)
+    monkeypatch.setattr(main_module, "_registry_is_current", lambda *args: True)
+    main_module._discover_strategy_classes.cache_clear()
+    strategies = discover_strategies({"WheelStrategy": {"enabled": False}})
+    assert module_name not in imported
+    assert "WheelStrategy" not in {strategy.__class__.__name__ for strategy in strategies}
+
+
+def test_registry_older_than_strategy_sources_is_still_used(tmp_path, monkeypatch):
+    import os
+    import shutil
+
+    strategy_dir = tmp_path / "strategies"
+    shutil.copytree(main_module._STRATEGY_DIR, strategy_dir, ignore=shutil.ignore_patterns("__pycache__"))
+    # A git checkout writes _registry.py before the strategy_*.py files.
+    os.utime(strategy_dir / "_registry.py", ns=(1, 1))
+    monkeypatch.setattr(main_module, "_STRATEGY_DIR", strategy_dir)
+    main_module._discover_strategy_classes.cache_clear()
+    try:
+        entries = main_module._discover_strategy_classes(main_module._strategy_source_mtimes())
+    finally:
+        main_module._discover_strategy_classes.cache_clear()
+
+    assert entries and all(loaded is None for _, _, loaded in entries)
+
+
+def test_registry_is_stale_when_a_strategy_source_changes(tmp_path, monkeypatch):
+    import shutil
+
+    from optionscanner.strategies._registry import SOURCE_DIGEST, STRATEGY_CLASSES
+
+    strategy_dir = tmp_path / "strategies"
+    shutil.copytree(main_module._STRATEGY_DIR, strategy_dir, ignore=shutil.ignore_patterns("__pycache__"))
+    monkeypatch.setattr(main_module, "_STRATEGY_DIR", strategy_dir)
+    module_names = main_module._strategy_module_names()
+    assert main_module._registry_is_current(STRATEGY_CLASSES, SOURCE_DIGEST, module_names)
+
+    wheel = strategy_dir / "strategy_wheel.py"
+    wheel.write_text(wheel.read_text(encoding="utf-8") + "\n\nclass ExtraWheelStrategy:\n    pass\n", encoding="utf-8")
+    assert not main_module._registry_is_current(STRATEGY_CLASSES, SOURCE_DIGEST, module_names)
+
+
+def test_discover_strategies_scans_when_registry_names_missing_class(monkeypatch):
+    from optionscanner.strategies import _registry
+
+    renamed = tuple(
+        (module, "RenamedWheelStrategy" if name == "WheelStrategy" else name)
+        for module, name in _registry.STRATEGY_CLASSES
+    )
+    monkeypatch.setattr(_registry, "STRATEGY_CLASSES", renamed)
+    monkeypatch.setattr(main_module, "_registry_is_current", lambda *args: True)
+    main_module._discover_strategy_classes.cache_clear()
+    try:
+        strategies = discover_strategies()
+    finally:
+        main_module._discover_strategy_classes.cache_clear()
+
+    assert "WheelStrategy" in {strategy.__class__.__name__ for strategy in strategies}
@@ -51,6 +51,26 @@ class MarketStateClassifierTests(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.state, MarketState.UPTREND)
 
+    def test_uses_last_complete_row(self) -> None:
+        history = pd.DataFrame(
+            {
+                "symbol": ["AMD", "AMD"],
+                "close": [103.0, 90.0],
+                "ma5": [105.0, 95.0],
+                "ma10": [104.0, None],
+                "ma30": [100.0, 99.0],
+            },
+            index=pd.to_datetime(["2024-02-01", "2024-02-02"]),
+        )
+
+        result = self.classifier.classify(history)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.state, MarketState.UPTREND)
+        self.assertEqual(result.symbol, "AMD")
+        self.assertEqual(result.close, 103.0)
+        self.assertEqual(result.as_of, pd.Timestamp("2024-02-01", tz="UTC"))
+
     def test_processor_adds_expected_columns(self) -> None:
         history = self._make_history([100 + i for i in range(35)])
         enriched = self.processor.process(history)
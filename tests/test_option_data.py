@@ -0,0 +1,672 @@
+"""Tests for the IBKR option data fetcher."""
+import asyncio
+import itertools
+import os
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+from eventkit import Event
+from ib_async import Option, OptionChain, Stock
+
+from optionscanner import jsonio
+from optionscanner.option_data import (
+    OPTION_SCHEMA,
+    IBKRDataFetcher,
+    LocalDataFetcher,
+    OptionChainSnapshot,
+    open_snapshot_dataset,
+    parse_expiry,
+)
+
+
+class FakeTicker:
+    def __init__(self, contract) -> None:
+        self.contract = contract
+        self.bid = float("nan")
+        self.ask = float("nan")
+        self.modelGreeks = None
+
+
+class FakeIB:
+    """Answers snapshot requests after a per-strike delay; ``None`` never answers.
+
+    Also stands in for the ib_async client and wrapper. ``ends`` maps strikes to
+    a delay after which IBKR reports the snapshot finished (``tickSnapshotEnd``)
+    without having sent a quote.
+    """
+
+    def __init__(self, delays, ends=None) -> None:
+        self.delays = delays
+        self.ends = ends or {}
+        self.pendingTickersEvent = Event("pendingTickersEvent")
+        self.cancelled = []
+        self.client = self.wrapper = self
+        self._req_ids = itertools.count(1)
+        self._futures = {}
+        self._tickers = {}
+
+    def reqMarketDataType(self, code: int) -> None:
+        pass
+
+    def getReqId(self) -> int:
+        return next(self._req_ids)
+
+    def startReq(self, key, contract=None):
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        return future
+
+    def _endReq(self, key, result=None, success=True) -> None:
+        future = self._futures.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result([])
+
+    def startTicker(self, req_id, contract, tick_type):
+        ticker = FakeTicker(contract)
+        self._tickers[req_id] = ticker
+        return ticker
+
+    def endTicker(self, ticker, tick_type) -> int:
+        return 0
+
+    def reqMktData(self, req_id, contract, generic_ticks, snapshot, regulatory_snapshot, options) -> None:
+        loop = asyncio.get_running_loop()
+        ticker = self._tickers[req_id]
+        delay = self.delays.get(contract.strike)
+        if delay is not None:
+            loop.call_later(delay, self._fill, ticker)
+        end = self.ends.get(contract.strike)
+        if end is not None:
+            loop.call_later(end, self._endReq, req_id)
+
+    def _fill(self, ticker) -> None:
+        ticker.bid, ticker.ask = 1.0, 1.2
+        ticker.modelGreeks = SimpleNamespace(delta=0.5)
+        self.pendingTickersEvent.emit({ticker})
+
+    def cancelMktData(self, req_id) -> None:
+        self.cancelled.append(self._tickers[req_id].contract.strike)
+
+
+def _fetcher(tmp_path, monkeypatch, fake_ib) -> IBKRDataFetcher:
+    monkeypatch.chdir(tmp_path)
+    fetcher = IBKRDataFetcher("127.0.0.1", 4002, 1, tmp_path / "data", "FROZEN")
+    fetcher._ib = fake_ib
+    return fetcher
+
+
+def test_stream_tickers_yields_in_completion_order(tmp_path, monkeypatch):
+    fake_ib = FakeIB({100.0: 0.05, 105.0: 0.0, 110.0: 0.02})
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    contracts = [Option("AAA", "20300118", strike, "C", "SMART") for strike in (100.0, 105.0, 110.0)]
+
+    async def collect():
+        return [ticker.contract.strike async for ticker in fetcher._stream_tickers(contracts)]
+
+    assert asyncio.run(collect()) == [105.0, 110.0, 100.0]
+    assert fake_ib.cancelled == []
+
+
+def test_stream_tickers_returns_stragglers_after_timeout(tmp_path, monkeypatch):
+    fake_ib = FakeIB({100.0: 0.0, 105.0: None})
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    fetcher._snapshot_timeout = 0.05
+    contracts = [Option("AAA", "20300118", strike, "P", "SMART") for strike in (100.0, 105.0)]
+
+    async def collect():
+        return [ticker async for ticker in fetcher._stream_tickers(contracts)]
+
+    tickers = asyncio.run(collect())
+    assert [ticker.contract.strike for ticker in tickers] == [100.0, 105.0]
+    assert tickers[1].modelGreeks is None
+    assert fake_ib.cancelled == [105.0]
+    assert len(fake_ib.pendingTickersEvent) == 0
+
+
+def test_stream_tickers_finishes_unquoted_contracts_on_snapshot_end(tmp_path, monkeypatch):
+    fake_ib = FakeIB({100.0: 0.0}, ends={105.0: 0.01})
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    fetcher._snapshot_timeout = 5.0
+    contracts = [Option("AAA", "20300118", strike, "C", "SMART") for strike in (100.0, 105.0)]
+
+    async def collect():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        tickers = [ticker async for ticker in fetcher._stream_tickers(contracts)]
+        return tickers, loop.time() - started
+
+    tickers, elapsed = asyncio.run(collect())
+    assert [ticker.contract.strike for ticker in tickers] == [100.0, 105.0]
+    assert tickers[1].bid != tickers[1].bid  # no quote ever arrived
+    assert elapsed < 1.0
+    assert fake_ib.cancelled == []
+
+
+def test_stream_tickers_cancels_open_requests_when_closed_early(tmp_path, monkeypatch):
+    fake_ib = FakeIB({100.0: 0.0, 105.0: None, 110.0: None})
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    fetcher._snapshot_timeout = 5.0
+    contracts = [Option("AAA", "20300118", strike, "C", "SMART") for strike in (100.0, 105.0, 110.0)]
+
+    async def first_only():
+        stream = fetcher._stream_tickers(contracts)
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    assert asyncio.run(first_only()).contract.strike == 100.0
+    assert sorted(fake_ib.cancelled) == [105.0, 110.0]
+    assert list(fake_ib._futures) == [1]  # only the yielded snapshot still awaits its end
+    assert len(fake_ib.pendingTickersEvent) == 0
+
+
+def _snapshot():
+    row = {
+        "symbol": "AAA",
+        "expiry": datetime(2030, 1, 18),
+        "strike": 102.5,
+        "option_type": "CALL",
+        "bid": 1.0,
+        "ask": 1.2,
+        "mark": 1.1,
+        "delta": 0.5,
+        "gamma": 0.1,
+        "vega": 0.2,
+        "theta": -0.1,
+        "rho": 0.01,
+        "implied_volatility": 0.3,
+    }
+    return OptionChainSnapshot(
+        symbol="AAA",
+        underlying_price=101.5,
+        timestamp=datetime(2026, 1, 5, 15, 30, tzinfo=timezone.utc),
+        options=[row, {**row, "option_type": "PUT", "delta": -0.5}],
+    )
+
+
+def test_persisted_snapshot_round_trips_through_local_fetcher(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+    fetcher._persist_snapshot(_snapshot())
+
+    (written,) = (tmp_path / "data").glob("symbol=AAA/date=2026-01-05/part-20260105_153000-*.parquet")
+    assert pq.read_schema(written).remove_metadata() == OPTION_SCHEMA.remove(0)
+    assert pq.ParquetFile(written).metadata.row_group(0).column(0).compression == "ZSTD"
+
+    local = LocalDataFetcher(tmp_path / "data", max_workers=2)
+    loaded = asyncio.run(local.fetch_all(["AAA"]))[0]
+    assert local._executor._max_workers == 2
+    asyncio.run(local.disconnect())
+    assert local._executor is None
+    assert loaded.underlying_price == 101.5
+    assert loaded.to_pandas()["bid"].dtype == "float64"
+    assert [row["option_type"] for row in loaded.options] == ["CALL", "PUT"]
+    assert loaded.options[0]["strike"] == 102.5
+    assert loaded.options[1]["price"] == 1.1
+    assert loaded.options[0]["theta"] == -0.1
+    assert list((tmp_path / "historydata").glob("*.csv"))
+
+
+def test_history_csv_can_be_disabled(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+    fetcher.history_csv = False
+    fetcher._persist_snapshot(_snapshot())
+
+    assert list((tmp_path / "data").glob("symbol=AAA/date=*/*.parquet"))
+    assert not list((tmp_path / "historydata").glob("*.csv"))
+
+
+def test_local_fetcher_reads_latest_partitioned_snapshot(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+    older = _snapshot()
+    newer = _snapshot()
+    newer.timestamp = older.timestamp.replace(hour=20)
+    newer.underlying_price = 99.0
+    fetcher._persist_snapshot(older)
+    local = LocalDataFetcher(tmp_path / "data")
+    assert asyncio.run(local.fetch_all(["AAA"]))[0].underlying_price == 101.5
+
+    fetcher._persist_snapshot(newer)
+    date_dir = tmp_path / "data" / "symbol=AAA" / "date=2026-01-05"
+    stat = date_dir.stat()
+    os.utime(date_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    loaded = asyncio.run(local.fetch_all(["AAA"]))[0]
+    assert loaded.underlying_price == 99.0
+    assert len(loaded.options) == 2
+
+    dataset = open_snapshot_dataset(tmp_path / "data")
+    table = dataset.to_table(filter=(ds.field("symbol") == "AAA") & (ds.field("date") >= "2026-01-01"))
+    assert table.num_rows == 4
+
+
+class QualifyingIB(FakeIB):
+    def __init__(self) -> None:
+        super().__init__({})
+        self.qualify_requests = 0
+
+    def isConnected(self) -> bool:
+        return False
+
+    async def qualifyContractsAsync(self, *contracts):
+        self.qualify_requests += len(contracts)
+        for contract in contracts:
+            contract.conId = int(contract.strike * 10)
+        return [None if contract.strike > 200 else contract for contract in contracts]
+
+
+def test_qualified_contracts_are_cached_and_persisted(tmp_path, monkeypatch):
+    fake_ib = QualifyingIB()
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+
+    def build(expiry):
+        return [Option("AAA", expiry, strike, "C", "SMART") for strike in (100.0, 105.0, 250.0)]
+
+    first = asyncio.run(fetcher._qualify_contracts(build("20300118") + build("20000121")))
+    second = asyncio.run(fetcher._qualify_contracts(build("20300118")))
+    assert [contract.conId for contract in first] == [1000, 1050, 1000, 1050]
+    assert [contract.conId for contract in second] == [1000, 1050]
+    assert fake_ib.qualify_requests == 7  # the unqualifiable strike is retried
+
+    asyncio.run(fetcher.disconnect())
+    reloaded = _fetcher(tmp_path, monkeypatch, QualifyingIB())
+    assert sorted(key[1:3] for key in reloaded._qualified) == [("20300118", 100.0), ("20300118", 105.0)]
+    assert reloaded._qualified[("AAA", "20300118", 100.0, "C", "SMART", "")].conId == 1000
+
+
+def test_fetch_pass_persists_newly_qualified_contracts(tmp_path, monkeypatch):
+    fake_ib = QualifyingIB()
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+
+    async def noop():
+        return None
+
+    async def qualify(names):
+        return {name: Stock(name, "SMART", "USD") for name in names}
+
+    async def quote(contracts):
+        return [SimpleNamespace(contract=contract) for contract in contracts]
+
+    async def chain(stock):
+        return OptionChain("SMART", 1, stock.symbol, "100", ["20300118"], [100.0])
+
+    async def stream(contracts):
+        for contract in contracts:
+            yield SimpleNamespace(contract=contract, bid=1.0, ask=1.2, midpoint=lambda: 1.1, modelGreeks=None)
+
+    monkeypatch.setattr(fetcher, "connect", noop)
+    monkeypatch.setattr(fetcher, "_qualify_stocks", qualify)
+    monkeypatch.setattr(fetcher, "_request_tickers", quote)
+    monkeypatch.setattr(fetcher, "_extract_underlying_price", lambda ticker, symbol: 100.0)
+    monkeypatch.setattr(fetcher, "_load_chain_metadata", chain)
+    monkeypatch.setattr(fetcher, "_stream_tickers", stream)
+    monkeypatch.setattr(fetcher, "_select_expiries", lambda expirations: list(expirations))
+
+    async def fetch():
+        snapshots = await fetcher.fetch_all(["AAA"])
+        await fetcher.flush()
+        return snapshots
+
+    assert [snapshot.symbol for snapshot in asyncio.run(fetch())] == ["AAA"]
+    reloaded = _fetcher(tmp_path, monkeypatch, QualifyingIB())
+    assert {key[:3] for key in reloaded._qualified} == {("AAA", "20300118", 100.0)}
+    assert not fetcher._qualified_dirty
+
+
+def test_quotes_to_table_builds_rows_and_keeps_latest_quote(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+
+    def quote(strike, right, bid, con_id):
+        contract = Option("AAA", "20300118", strike, right, "SMART")
+        contract.conId = con_id
+        ticker = FakeTicker(contract)
+        ticker.bid, ticker.ask = bid, bid + 0.2
+        ticker.midpoint = lambda: bid + 0.1
+        ticker.modelGreeks = SimpleNamespace(delta=0.4, gamma=None, impliedVol=0.25)
+        return ticker
+
+    tickers = [quote(100.0, "C", 1.0, 1), quote(100.0, "P", 2.0, 2), quote(100.0, "C", 1.5, 1)]
+    table = fetcher._quotes_to_table(tickers, "AAA")
+
+    rows = table.to_pylist()
+    assert [(row["option_type"], row["bid"]) for row in rows] == [("PUT", 2.0), ("CALL", 1.5)]
+    assert rows[1]["expiry"] == datetime(2030, 1, 18)
+    assert rows[1]["mark"] == pytest.approx(1.6)
+    assert (rows[1]["delta"], rows[1]["gamma"], rows[1]["implied_volatility"]) == (0.4, 0.0, 0.25)
+
+    snapshot = OptionChainSnapshot("AAA", 100.0, datetime(2026, 1, 5, tzinfo=timezone.utc), rows, table=table)
+    fetcher._persist_snapshot(snapshot)
+    loaded = asyncio.run(LocalDataFetcher(tmp_path / "data").fetch_all(["AAA"]))[0]
+    assert [row["option_type"] for row in loaded.options] == ["PUT", "CALL"]
+
+
+class HeartbeatIB(FakeIB):
+    def __init__(self) -> None:
+        super().__init__({})
+        self.pings = 0
+        self.disconnected = False
+
+    def isConnected(self) -> bool:
+        return not self.disconnected
+
+    async def reqCurrentTimeAsync(self):
+        self.pings += 1
+        return datetime.now(timezone.utc)
+
+    def disconnect(self) -> None:
+        self.disconnected = True
+
+
+def test_heartbeat_pings_until_disconnect(tmp_path, monkeypatch):
+    fake_ib = HeartbeatIB()
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    fetcher._heartbeat_interval = 0.01
+
+    async def scenario():
+        fetcher._start_heartbeat()
+        await asyncio.sleep(0.05)
+        task = fetcher._heartbeat_task
+        await fetcher.disconnect()
+        await asyncio.sleep(0)
+        return task
+
+    task = asyncio.run(scenario())
+    assert fake_ib.pings >= 2
+    assert task.cancelled()
+    assert fake_ib.disconnected
+
+
+class ChainIB(FakeIB):
+    def __init__(self) -> None:
+        super().__init__({})
+        self.chain_requests = 0
+
+    async def reqSecDefOptParamsAsync(self, symbol, exchange, sec_type, con_id):
+        self.chain_requests += 1
+        return [OptionChain("SMART", con_id, symbol, "100", ["20300118"], [95.0, 100.0])]
+
+
+def test_chain_metadata_is_cached_and_persisted(tmp_path, monkeypatch):
+    fake_ib = ChainIB()
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    stock = Stock("AAA", "SMART", "USD")
+
+    first = asyncio.run(fetcher._load_chain_metadata(stock))
+    second = asyncio.run(fetcher._load_chain_metadata(stock))
+    assert first is second
+    assert fake_ib.chain_requests == 1
+
+    fetcher._save_chains()
+    reloaded = _fetcher(tmp_path, monkeypatch, ChainIB())
+    assert asyncio.run(reloaded._load_chain_metadata(stock)) == first
+    assert reloaded._ib.chain_requests == 0
+
+    reloaded._chain_cache_ttl = 0
+    asyncio.run(reloaded._load_chain_metadata(stock))
+    assert reloaded._ib.chain_requests == 1
+
+
+def test_parse_expiry_matches_strptime_and_rejects_bad_input():
+    assert parse_expiry("20300118") == datetime.strptime("20300118", "%Y%m%d").date()
+    for bad in ("203001", "2030011X", "20301318"):
+        with pytest.raises(ValueError):
+            parse_expiry(bad)
+
+
+def test_summary_fetch_mode_narrows_chain_selection(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    full = IBKRDataFetcher("127.0.0.1", 4002, 1, tmp_path / "data", "FROZEN")
+    summary = IBKRDataFetcher("127.0.0.1", 4002, 1, tmp_path / "data", "FROZEN", fetch_mode="SUMMARY")
+    today = datetime.now(timezone.utc).date()
+    expirations = [(today + timedelta(days=days)).strftime("%Y%m%d") for days in (*range(1, 60, 7), 270)]
+    strikes = [float(strike) for strike in range(80, 121)]
+
+    assert expirations[-1] in full._select_expiries(expirations)
+    assert summary._select_expiries(expirations) == expirations[:4]
+    assert summary._select_strikes(strikes, 100.2) == [98.0, 99.0, 100.0, 101.0, 102.0, 103.0]
+    with pytest.raises(ValueError):
+        IBKRDataFetcher("127.0.0.1", 4002, 1, tmp_path / "data", "FROZEN", fetch_mode="scanner")
+
+
+def test_scheduled_persistence_is_flushed_on_disconnect(tmp_path, monkeypatch):
+    fake_ib = HeartbeatIB()
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    written = []
+    persist = fetcher._persist_snapshot
+
+    def record(snapshot):
+        if snapshot.symbol == "BAD":
+            raise OSError("disk full")
+        persist(snapshot)
+        written.append(snapshot.timestamp.hour)
+
+    monkeypatch.setattr(fetcher, "_persist_snapshot", record)
+    first, second = _snapshot(), _snapshot()
+    second.timestamp = first.timestamp.replace(hour=20)
+    broken = _snapshot()
+    broken.symbol = "BAD"
+
+    async def scenario():
+        fetcher._schedule_persist([first, broken])
+        fetcher._schedule_persist([second])
+        await fetcher.disconnect()
+
+    asyncio.run(scenario())
+    assert written == [15, 20]
+    assert fetcher._persist_task is None
+    assert len(list((tmp_path / "data").glob("symbol=AAA/date=2026-01-05/*.parquet"))) == 2
+
+
+def test_select_strikes_matches_distance_sort(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+    rng = random.Random(7)
+    for _ in range(200):
+        strikes = [rng.choice((0.5, 1.0, 2.5, 5.0)) * rng.randint(1, 80) for _ in range(rng.randint(1, 60))]
+        reference = rng.uniform(-10.0, 450.0)
+        expected = sorted(sorted(set(strikes), key=lambda strike: (abs(strike - reference), strike))[:16])
+        assert fetcher._select_strikes(strikes + ["", None, "nan"], reference) == expected
+        assert fetcher._select_strikes(strikes + [float("nan"), float("inf")], reference) == expected
+
+
+class WindowIB(FakeIB):
+    """Fills each snapshot shortly after it is requested and tracks open requests."""
+
+    def __init__(self) -> None:
+        super().__init__({})
+        self.open = 0
+        self.peak = 0
+
+    def reqMktData(self, req_id, contract, generic_ticks, snapshot, regulatory_snapshot, options) -> None:
+        ticker = self._tickers[req_id]
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        asyncio.get_running_loop().call_later(0.001, self._fill, ticker)
+
+    def _fill(self, ticker) -> None:
+        self.open -= 1
+        super()._fill(ticker)
+
+
+def test_stream_tickers_bounds_open_snapshot_requests(tmp_path, monkeypatch):
+    fake_ib = WindowIB()
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    fetcher._max_inflight_snapshots = 4
+    contracts = [Option("AAA", "20300118", float(strike), "C", "SMART") for strike in range(20)]
+
+    async def collect():
+        return [ticker.contract.strike async for ticker in fetcher._stream_tickers(contracts)]
+
+    assert sorted(asyncio.run(collect())) == [float(strike) for strike in range(20)]
+    assert fake_ib.peak == 4
+
+
+class StockIB(FakeIB):
+    def __init__(self, unknown=()) -> None:
+        super().__init__({})
+        self.unknown = set(unknown)
+        self.qualified = []
+
+    async def qualifyContractsAsync(self, *contracts):
+        self.qualified.extend(contract.symbol for contract in contracts)
+        for contract in contracts:
+            if contract.symbol not in self.unknown:
+                contract.conId = len(contract.symbol)
+        return [None if contract.symbol in self.unknown else contract for contract in contracts]
+
+
+def test_underlying_contracts_are_qualified_once_per_day(tmp_path, monkeypatch):
+    fake_ib = StockIB(unknown={"ZZZ"})
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+
+    first = asyncio.run(fetcher._qualify_stocks(["AAA", "ZZZ"]))
+    second = asyncio.run(fetcher._qualify_stocks(["AAA", "ZZZ", "BB"]))
+    assert second["AAA"] is first["AAA"]
+    assert second["AAA"].conId == 3
+    assert fake_ib.qualified == ["AAA", "ZZZ", "ZZZ", "BB"]
+
+    fetcher._qualified_stocks["AAA"] = (date(2000, 1, 3), first["AAA"])
+    asyncio.run(fetcher._qualify_stocks(["AAA"]))
+    assert fake_ib.qualified[-1] == "AAA"
+
+
+def test_fetch_all_bounds_concurrent_chain_requests(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+    fetcher._max_inflight_chain_requests = 3
+    symbols = [f"S{index}" for index in range(10)]
+    inflight = {"open": 0, "peak": 0}
+
+    async def noop():
+        return None
+
+    async def qualify(names):
+        return {name: Stock(name, "SMART", "USD") for name in names}
+
+    async def quote(contracts):
+        return [SimpleNamespace(contract=contract) for contract in contracts]
+
+    async def chain(stock):
+        inflight["open"] += 1
+        inflight["peak"] = max(inflight["peak"], inflight["open"])
+        await asyncio.sleep(0.001)
+        inflight["open"] -= 1
+        raise RuntimeError(f"no chain for {stock.symbol}")
+
+    monkeypatch.setattr(fetcher, "connect", noop)
+    monkeypatch.setattr(fetcher, "_qualify_stocks", qualify)
+    monkeypatch.setattr(fetcher, "_request_tickers", quote)
+    monkeypatch.setattr(fetcher, "_extract_underlying_price", lambda ticker, symbol: 100.0)
+    monkeypatch.setattr(fetcher, "_load_chain_metadata", chain)
+
+    snapshots, failures = asyncio.run(fetcher._fetch_chains(symbols))
+    assert snapshots == []
+    assert sorted(failures) == sorted(symbols)
+    assert inflight["peak"] == 3
+
+
+def test_fetch_chains_isolates_failures_per_symbol(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+    expiry = (date.today() + timedelta(days=10)).strftime("%Y%m%d")
+
+    async def noop():
+        return None
+
+    async def qualify(names):
+        return {name: Stock(name, "SMART", "USD") for name in names}
+
+    async def quote(contracts):
+        if len(contracts) > 1 and any(contract.symbol == "DDD" for contract in contracts):
+            raise RuntimeError("batch rejected")
+        if contracts[0].symbol == "DDD":
+            raise RuntimeError("no permissions for DDD")
+        return [SimpleNamespace(contract=contract) for contract in contracts]
+
+    async def chain(stock):
+        return OptionChain("SMART", 1, stock.symbol, "100", [expiry], [100.0])
+
+    async def qualify_options(contracts):
+        if any(contract.symbol == "CCC" for contract in contracts):
+            raise RuntimeError("CCC contracts rejected")
+        for index, contract in enumerate(contracts):
+            # BBB comes back malformed: no conId for its quote row.
+            contract.conId = None if contract.symbol == "BBB" else index + 1
+        return list(contracts)
+
+    async def stream(contracts):
+        for contract in contracts:
+            yield SimpleNamespace(contract=contract, bid=1.0, ask=1.2, midpoint=lambda: 1.1, modelGreeks=None)
+
+    monkeypatch.setattr(fetcher, "connect", noop)
+    monkeypatch.setattr(fetcher, "_qualify_stocks", qualify)
+    monkeypatch.setattr(fetcher, "_request_tickers", quote)
+    monkeypatch.setattr(fetcher, "_extract_underlying_price", lambda ticker, symbol: 100.0)
+    monkeypatch.setattr(fetcher, "_load_chain_metadata", chain)
+    monkeypatch.setattr(fetcher, "_qualify_contracts", qualify_options)
+    monkeypatch.setattr(fetcher, "_stream_tickers", stream)
+    monkeypatch.setattr(fetcher, "_schedule_persist", lambda snapshots, caches=(): None)
+
+    snapshots, failures = asyncio.run(fetcher._fetch_chains(["AAA", "BBB", "CCC", "DDD"]))
+    assert [snapshot.symbol for snapshot in snapshots] == ["AAA"]
+    assert snapshots[0].table.num_rows > 0
+    assert sorted(failures) == ["BBB", "CCC", "DDD"]
+    assert "no permissions" in str(failures["DDD"])
+    assert "CCC contracts rejected" in str(failures["CCC"])
+    assert isinstance(failures["BBB"], TypeError)
+
+
+def test_failed_chain_drops_cached_metadata(tmp_path, monkeypatch):
+    fake_ib = ChainIB()
+    fetcher = _fetcher(tmp_path, monkeypatch, fake_ib)
+    expiry = (date.today() + timedelta(days=10)).strftime("%Y%m%d")
+    fetcher._chain_cache["AAA"] = (time.time(), OptionChain("SMART", 3, "AAA", "100", [expiry], [95.0, 100.0]))
+
+    async def noop():
+        return None
+
+    async def qualify(names):
+        return {name: Stock(name, "SMART", "USD") for name in names}
+
+    async def quote(contracts):
+        return [SimpleNamespace(contract=contract) for contract in contracts]
+
+    async def reject(contracts):
+        raise RuntimeError("contract not found")
+
+    monkeypatch.setattr(fetcher, "connect", noop)
+    monkeypatch.setattr(fetcher, "_qualify_stocks", qualify)
+    monkeypatch.setattr(fetcher, "_request_tickers", quote)
+    monkeypatch.setattr(fetcher, "_extract_underlying_price", lambda ticker, symbol: 100.0)
+    monkeypatch.setattr(fetcher, "_qualify_contracts", reject)
+
+    async def fetch():
+        result = await fetcher._fetch_chains(["AAA"])
+        await fetcher.flush()
+        return result
+
+    _, failures = asyncio.run(fetch())
+    assert "AAA" in failures
+    assert "AAA" not in fetcher._chain_cache
+    assert fake_ib.chain_requests == 0
+    assert jsonio.loads(fetcher._chains_path.read_bytes()) == {}
+
+
+def test_columnar_to_pandas_matches_row_path(tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path, monkeypatch, FakeIB({}))
+    tickers = []
+    for strike, right in ((100.0, "C"), (100.0, "P"), (102.5, "C")):
+        contract = Option("AAA", "20300118", strike, right, "SMART")
+        contract.conId = len(tickers) + 1
+        ticker = FakeTicker(contract)
+        ticker.bid, ticker.ask = 1.0, 1.5
+        ticker.midpoint = lambda: 1.25
+        ticker.modelGreeks = SimpleNamespace(delta=0.3, gamma=0.01, vega=0.1, theta=-0.02, impliedVol=0.2)
+        tickers.append(ticker)
+    table = fetcher._quotes_to_table(tickers, "AAA")
+    timestamp = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+    columnar = OptionChainSnapshot("AAA", 100.0, timestamp, table.to_pylist(), {"iv_rank": 0.4}, table=table)
+    rows = OptionChainSnapshot("AAA", 100.0, timestamp, table.to_pylist(), {"iv_rank": 0.4})
+    pd.testing.assert_frame_equal(columnar.to_pandas(), rows.to_pandas())
@@ -0,0 +1,35 @@
+"""Tests for the IBKR request pacer."""
+import asyncio
+import time
+
+import pytest
+
+from optionscanner.pacing import RequestPacer
+
+
+def test_burst_is_available_immediately():
+    pacer = RequestPacer(rate=100.0, burst=10)
+
+    async def scenario():
+        start = time.monotonic()
+        await pacer.acquire(10)
+        return time.monotonic() - start
+
+    assert asyncio.run(scenario()) < 0.05
+
+
+def test_requests_beyond_burst_are_spread_at_rate():
+    pacer = RequestPacer(rate=100.0, burst=5)
+
+    async def scenario():
+        start = time.monotonic()
+        await asyncio.gather(*(pacer.acquire() for _ in range(15)))
+        return time.monotonic() - start
+
+    # 5 from the burst, 10 more at 100/s -> ~0.1s.
+    assert asyncio.run(scenario()) == pytest.approx(0.1, abs=0.06)
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        RequestPacer(rate=0)
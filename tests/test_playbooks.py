@@ -0,0 +1,44 @@
+"""Tests for the strategy playbook engine."""
+import pandas as pd
+
+from optionscanner.portfolio.playbooks import PlaybookContext, PlaybookEngine
+from optionscanner.portfolio.rules import RiskBreach
+
+
+def test_generate_dispatches_only_strategies_with_playbooks():
+    engine = PlaybookEngine(PlaybookContext(roll_rules={"condor": {"take_profit_pct": 0.5}}))
+    positions = pd.DataFrame(
+        [
+            {"strategy": "Condor", "underlying": "SPY", "symbol": "SPY P", "strike": 400.0, "quantity": -1},
+            {"strategy": "condor", "underlying": "SPY", "symbol": "SPY C", "strike": "450", "quantity": "-1"},
+            {"strategy": "PMCC", "underlying": "AAPL", "symbol": "AAPL L", "quantity": "1", "delta": 0.8},
+            {"strategy": "PMCC", "underlying": "AAPL", "symbol": "AAPL C", "quantity": "-1", "delta": 0.5},
+            {"strategy": "wheel", "underlying": "MSFT", "symbol": "MSFT P", "quantity": -1},
+            {"strategy": None, "underlying": "NVDA", "symbol": "NVDA", "quantity": 100},
+        ]
+    )
+    breaches = [RiskBreach(metric="gamma", symbol="spy", value=2.0, limit=1.0, detail="")]
+
+    actions = engine.generate(positions, breaches)
+
+    assert actions[0] == "SPY Condor: harvest profits near 50% credit (width 50; gamma elevated)"
+    assert actions[1].startswith("PMCC AAPL: close short AAPL C")
+    assert len(actions) == 2
+
+
+def test_generate_skips_positions_without_playbooks():
+    engine = PlaybookEngine(PlaybookContext(roll_rules={}))
+    positions = pd.DataFrame([{"strategy": "wheel", "underlying": "MSFT", "quantity": -1}])
+
+    assert engine.generate(positions, []) == []
+
+
+def test_subclass_handler_overrides_are_used():
+    class CustomEngine(PlaybookEngine):
+        def _handle_condor(self, symbol, positions, breaches):
+            return [f"custom {symbol} {positions['strike'].sum():.0f}"]
+
+    engine = CustomEngine(PlaybookContext(roll_rules={}))
+    positions = pd.DataFrame([{"strategy": "condor", "underlying": "SPY", "strike": "400", "quantity": -1}])
+
+    assert engine.generate(positions, []) == ["custom SPY 400"]
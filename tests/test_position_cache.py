@@ -146,3 +146,40 @@ def test_position_cache_reconciles_positions(tmp_path) -> None:
     # Reconcile with no positions -> should mark closed
     cache.reconcile_with_positions([])
     assert any(entry.status == "closed" for entry in cache._entries.values())
+
+
+def test_record_signals_batches_a_run(tmp_path) -> None:
+    cache = PositionCache(tmp_path / "cache.json")
+    seen_at = datetime(2026, 1, 5, 15, 30, tzinfo=timezone.utc)
+    snapshot = OptionChainSnapshot(symbol="AMD", underlying_price=120.0, timestamp=seen_at, options=[])
+    signals = [
+        ("PutCredit", _make_signal("amd", 110.0, "BULL_PUT_CREDIT_SPREAD")),
+        ("PutCredit", _make_signal("AMD", 105.0, "BULL_PUT_CREDIT_SPREAD")),
+        ("Wheel", _make_signal("TSLA", 200.0, "SHORT_PUT")),
+    ]
+
+    cache.record_signals(signals, {"AMD": snapshot}, seen_at=seen_at)
+    cache.save()
+
+    entries = json.loads((tmp_path / "cache.json").read_text())
+    assert len(entries) == 3
+    by_strike = {entry["strike"]: entry for entry in entries}
+    assert by_strike[110.0]["context"] == {"underlying_price": 120.0, "snapshot_ts": seen_at.isoformat()}
+    assert by_strike[110.0]["opened_at"] == seen_at.isoformat()
+    assert by_strike[200.0]["context"] == {}
+
+
+def test_record_signals_skips_a_malformed_signal(tmp_path) -> None:
+    cache = PositionCache(tmp_path / "cache.json")
+    broken = _make_signal("AMD", 110.0, "SHORT_PUT")
+    broken.strike = None
+    signals = [
+        ("Wheel", broken),
+        ("Wheel", _make_signal("TSLA", 200.0, "SHORT_PUT")),
+    ]
+
+    cache.record_signals(signals, {})
+    cache.save()
+
+    entries = json.loads((tmp_path / "cache.json").read_text())
+    assert [entry["symbol"] for entry in entries] == ["TSLA"]
@@ -2,6 +2,7 @@ import asyncio
 from datetime import datetime, timezone
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 from optionscanner.option_data import OptionChainSnapshot
@@ -10,12 +11,16 @@ from optionscanner.strategies.base import TradeSignal
 
 
 class DummyFetcher:
-    async def fetch_all(self, symbols):
+    def __init__(self) -> None:
+        self.timestamps = []
+
+    async def fetch_all(self, symbols, timestamp=None):
+        self.timestamps.append(timestamp)
         return [
             OptionChainSnapshot(
                 symbol=symbol,
                 underlying_price=100.0,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=timestamp,
                 options=[],
             )
             for symbol in symbols
@@ -56,6 +61,102 @@ def test_run_once_omits_ai_fields_when_disabled(tmp_path):
     )
     files = list(tmp_path.glob("signals_*.csv"))
     assert files, "Expected a signals CSV to be written"
+    (run_time,) = fetcher.timestamps
+    assert files[0].name == f"signals_{run_time:%Y%m%d_%H%M%S}.csv"
     df = pd.read_csv(files[0])
     assert "explanation" not in df.columns
     assert "validation" not in df.columns
+
+
+class FailingStrategy:
+    name = "FailingStrategy"
+
+    def on_data(self, snapshots):
+        raise RuntimeError("boom")
+
+
+def test_run_once_isolates_failing_strategies(tmp_path):
+    asyncio.run(
+        run_once(
+            DummyFetcher(),
+            [FailingStrategy(), DummyStrategy()],
+            ["NVDA", "AAPL"],
+            tmp_path,
+            enable_gemini=False,
+        )
+    )
+    df = pd.read_csv(next(tmp_path.glob("signals_*.csv")))
+    assert set(df["strategy"]) == {"DummyStrategy"}
+    assert set(df["symbol"]) == {"NVDA", "AAPL"}
+
+
+def test_run_once_streams_signal_rows_with_fixed_columns(tmp_path):
+    asyncio.run(run_once(DummyFetcher(), [DummyStrategy()], ["NVDA"], tmp_path, enable_gemini=False))
+    df = pd.read_csv(next(tmp_path.glob("signals_*.csv")))
+    assert list(df.columns) == [
+        "symbol",
+        "strategy",
+        "direction",
+        "rationale",
+        "ai_reason",
+        "selection_type",
+        "composite_score",
+        "reason",
+    ]
+    assert len(df) >= 1
+    assert set(df["selection_type"]) == {"QUANT"}
+
+
+def test_run_once_appends_signals_to_parquet_log(tmp_path):
+    config = {"signals_csv": False}
+    asyncio.run(
+        run_once(DummyFetcher(), [DummyStrategy()], ["NVDA"], tmp_path, enable_gemini=False, config=config)
+    )
+    assert not list(tmp_path.glob("signals_*.csv"))
+    parts = list((tmp_path / "signals").glob("date=*/*.parquet"))
+    assert len(parts) == 1
+    table = pq.read_table(parts[0])
+    assert table.column("symbol").to_pylist()[0] == "NVDA"
+    assert "as_of" in table.column_names
+
+
+class FailingSlackNotifier:
+    async def send_ai_and_quant_signals_async(self, *args):
+        raise RuntimeError("slack down")
+
+
+class FailingTradeExecutor:
+    def __init__(self):
+        self.calls = 0
+
+    def set_event_loop(self, loop):
+        pass
+
+    def execute_finalists(self, finalists, snapshots):
+        self.calls += 1
+        raise RuntimeError("gateway down")
+
+
+def test_run_once_logs_follow_up_failures_without_raising(tmp_path):
+    from loguru import logger
+
+    messages = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]), level="ERROR")
+    executor = FailingTradeExecutor()
+    try:
+        asyncio.run(
+            run_once(
+                DummyFetcher(),
+                [DummyStrategy()],
+                ["NVDA"],
+                tmp_path,
+                slack_notifier=FailingSlackNotifier(),
+                enable_gemini=False,
+                trade_executor=executor,
+            )
+        )
+    finally:
+        logger.remove(sink_id)
+    assert executor.calls == 1
+    assert "Slack notification failed" in messages
+    assert "Trade execution failed" in messages
@@ -1,9 +1,11 @@
+import asyncio
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 from zoneinfo import ZoneInfo
 
-from optionscanner.scheduling import compute_next_run, parse_schedule_times
+from optionscanner.scheduling import compute_next_run, parse_schedule_times, sleep_until
 
 
 class SchedulerUtilsTests(unittest.TestCase):
@@ -40,6 +42,38 @@ class SchedulerUtilsTests(unittest.TestCase):
 
         self.assertEqual(next_run, datetime(2024, 5, 2, 6, 30, tzinfo=tz))
 
+    def test_compute_next_run_skips_slot_that_is_due_now(self):
+        tz = ZoneInfo("America/Los_Angeles")
+        now = datetime(2024, 5, 1, 10, 0, 0, 1, tzinfo=tz)
+        schedule = parse_schedule_times({"times": ["06:30", "10:00"]})
+
+        self.assertEqual(compute_next_run(now, schedule), datetime(2024, 5, 2, 6, 30, tzinfo=tz))
+        self.assertEqual(
+            compute_next_run(now.replace(hour=9, minute=59), schedule), datetime(2024, 5, 1, 10, 0, tzinfo=tz)
+        )
+
+    def test_sleep_until_returns_immediately_for_past_target(self):
+        target = datetime.now(timezone.utc) - timedelta(seconds=5)
+
+        with patch("optionscanner.scheduling.asyncio.sleep", new=AsyncMock()) as sleep:
+            asyncio.run(sleep_until(target))
+
+        sleep.assert_not_called()
+
+    def test_sleep_until_caps_each_sleep_interval(self):
+        target = datetime.now(timezone.utc) + timedelta(hours=2)
+        calls = []
+
+        async def fake_sleep(seconds):
+            calls.append(seconds)
+            raise asyncio.CancelledError
+
+        with patch("optionscanner.scheduling.asyncio.sleep", new=fake_sleep):
+            with self.assertRaises(asyncio.CancelledError):
+                asyncio.run(sleep_until(target, max_interval=60.0))
+
+        self.assertEqual(calls, [60.0])
+
 
 if __name__ == "__main__":
     unittest.main()
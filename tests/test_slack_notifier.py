@@ -1,10 +1,15 @@
+import asyncio
 import os
+import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from unittest import mock
 
 import pandas as pd
 
-from optionscanner.notifications.slack import SlackNotifier
+from optionscanner.notifications.slack import SlackClientError, SlackNotifier
 
 
 class SlackNotifierTests(unittest.TestCase):
@@ -65,6 +70,29 @@ class SlackNotifierTests(unittest.TestCase):
             self.assertIn(symbol, text)
             self.assertIn("CSV saved to results/signals.csv", text)
 
+        notifier.send_signals(df.to_dict("records"), csv_path)
+
+        self.assertEqual([payload for _, payload in self.sent[3:]], [payload for _, payload in self.sent[:3]])
+
+    def test_option_line_lists_only_present_fields(self):
+        notifier = SlackNotifier({"enabled": True, "webhook_url": "https://hooks.test"}, post=self.fake_post)
+        df = pd.DataFrame(
+            [
+                {"symbol": "NVDA", "option_type": "PUT", "strike": 95.0, "expiry": "2026-04-18"},
+                {"symbol": "AAPL", "option_type": "CALL", "strike": None, "expiry": None},
+            ]
+        )
+
+        notifier.send_signals(df)
+        notifier.send_signals([{"symbol": "MSFT", "strategy": "Momentum"}])
+
+        full, partial, bare = (payload["text"] for _, payload in self.sent)
+        self.assertIn("Option: PUT 95.0 exp 2026-04-18", full)
+        self.assertIn("Option: CALL\n", partial + "\n")
+        self.assertNotIn("nan", partial)
+        self.assertNotIn("Option:", bare)
+        self.assertNotIn("None", bare)
+
     def test_environment_variable_used_when_config_missing(self):
         os.environ["SLACK_WEBHOOK_URL"] = "https://hooks.env"
         self.addCleanup(lambda: os.environ.pop("SLACK_WEBHOOK_URL", None))
@@ -97,6 +125,119 @@ class SlackNotifierTests(unittest.TestCase):
         url, _payload = self.sent[0]
         self.assertEqual(url, "https://hooks.secret")
 
+    def test_async_send_posts_on_dedicated_thread(self):
+        threads = []
+
+        def recording_post(url, payload):
+            threads.append(threading.current_thread().name)
+            self.fake_post(url, payload)
+
+        notifier = SlackNotifier({"enabled": True, "webhook_url": "https://hooks.test"}, post=recording_post)
+        self.addCleanup(notifier.close)
+
+        with mock.patch.object(SlackNotifier, "_build_ai_and_quant_message", return_value="picks"):
+            asyncio.run(notifier.send_ai_and_quant_signals_async([], {}, [object()]))
+
+        self.assertEqual(len(self.sent), 1)
+        self.assertTrue(threads[0].startswith("slack-post"))
+
+    def test_webhook_posts_reuse_one_connection_across_notifiers(self):
+        peers = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # noqa: N802 - http.server hook name
+                self.rfile.read(int(self.headers["Content-Length"]))
+                peers.append(self.client_address)
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        env = {key: value for key, value in os.environ.items() if key.lower() != "http_proxy"}
+        patcher = mock.patch.dict(os.environ, env, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        url = f"http://127.0.0.1:{server.server_address[1]}/hook"
+        notifier = SlackNotifier({"enabled": True, "webhook_url": url})
+        self.addCleanup(notifier.close)
+        df = pd.DataFrame([{"symbol": "NVDA"}])
+
+        notifier.send_signals(df)
+        notifier.send_signals(df)
+        SlackNotifier({"enabled": True, "webhook_url": url}).send_signals(df)
+
+        self.assertEqual(len(peers), 3)
+        self.assertEqual(len(set(peers)), 1)
+
+    def test_removed_webhook_pauses_further_posts(self):
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # noqa: N802 - http.server hook name
+                self.rfile.read(int(self.headers["Content-Length"]))
+                hits.append(self.path)
+                self.send_response(400 if self.path == "/bad" else 404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        env = {key: value for key, value in os.environ.items() if key.lower() != "http_proxy"}
+        patcher = mock.patch.dict(os.environ, env, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        notifier = SlackNotifier({"enabled": True, "webhook_url": f"{base_url}/gone"})
+        df = pd.DataFrame([{"symbol": "NVDA"}])
+
+        notifier.send_signals(df)
+        notifier.send_signals(df)
+        with self.assertRaises(SlackClientError):
+            notifier._post(notifier.settings.webhook_url, {"text": "direct"})
+
+        self.assertEqual(hits, ["/gone"])
+
+        # A rejected message fails on its own without pausing later posts.
+        notifier = SlackNotifier({"enabled": True, "webhook_url": f"{base_url}/bad"})
+        for _ in range(2):
+            with self.assertRaises(SlackClientError):
+                notifier._post(notifier.settings.webhook_url, {"text": "direct"})
+
+        self.assertEqual(hits, ["/gone", "/bad", "/bad"])
+
+    def test_secret_file_direct_and_placeholder_layouts(self):
+        from optionscanner.notifications.slack import _read_secret_file
+
+        with tempfile.TemporaryDirectory() as tmp:
+            direct = Path(tmp) / "direct.yaml"
+            direct.write_text("# comment\nslack_webhook_url: 'https://hooks.slack.com/services/A/B/C'\n", encoding="utf-8")
+            nested = Path(tmp) / "nested.yaml"
+            nested.write_text(
+                "slack_webhook_url: https://hooks.slack.com/services/XXX\nslack:\n  webhook_url: https://hooks.nested\n",
+                encoding="utf-8",
+            )
+            notifier = SlackNotifier({"enabled": False}, post=self.fake_post)
+            for path, expected in ((direct, "https://hooks.slack.com/services/A/B/C"), (nested, "https://hooks.nested")):
+                stat = path.stat()
+                data = _read_secret_file(str(path), stat.st_mtime_ns, stat.st_size)
+                self.assertEqual(notifier._extract_webhook_from_data(data), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
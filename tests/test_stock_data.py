@@ -0,0 +1,57 @@
+"""Tests for concurrent underlying history downloads."""
+import asyncio
+from types import SimpleNamespace
+
+from optionscanner.market_state import MarketState, StockMarketStateProvider
+from optionscanner.stock_data import StockDataFetcher
+
+
+class FakeHistoryIB:
+    def __init__(self, failing=()) -> None:
+        self.failing = set(failing)
+        self.open = 0
+        self.peak = 0
+
+    async def reqHistoricalDataAsync(self, contract, **kwargs):
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        try:
+            await asyncio.sleep(0.01)
+            if contract.symbol in self.failing:
+                raise RuntimeError("no data")
+            return [
+                SimpleNamespace(date=f"2024-01-{day:02d}", open=1.0, high=1.0, low=1.0, close=100.0 + day, volume=1)
+                for day in range(1, 32)
+            ]
+        finally:
+            self.open -= 1
+
+
+def _fetcher(tmp_path, fake_ib, **kwargs) -> StockDataFetcher:
+    fetcher = StockDataFetcher("127.0.0.1", 4002, 2, history_dir=tmp_path, **kwargs)
+    fetcher._ib = fake_ib
+    fetcher._connected = True
+    return fetcher
+
+
+def test_fetch_history_many_is_concurrent_bounded_and_ordered(tmp_path):
+    fake_ib = FakeHistoryIB(failing={"BAD"})
+    fetcher = _fetcher(tmp_path, fake_ib, max_concurrent_requests=3)
+    symbols = ["E", "D", "BAD", "C", "B", "A"]
+
+    histories = asyncio.run(fetcher.fetch_history_many(symbols))
+
+    assert list(histories) == symbols
+    assert histories["BAD"].empty
+    assert len(histories["A"]) == 31
+    assert fake_ib.peak == 3
+
+
+def test_market_state_refresh_skips_failed_downloads(tmp_path):
+    provider = StockMarketStateProvider(_fetcher(tmp_path, FakeHistoryIB(failing={"BAD"})))
+
+    results = asyncio.run(provider.refresh(["AAA", "BAD"]))
+
+    assert results["BAD"] is None
+    assert results["AAA"].state == MarketState.BULL
+    assert provider.get_state("aaa") == MarketState.BULL
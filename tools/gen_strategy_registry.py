@@ -0,0 +1,46 @@
+"""Regenerate ``optionscanner/strategies/_registry.py`` from the strategy modules.
+
+Run after adding, renaming, or removing a strategy::
+
+    python tools/gen_strategy_registry.py
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from optionscanner.main import (  # noqa: E402
+    _STRATEGY_DIR,
+    _scan_strategy_classes,
+    _strategy_module_names,
+    _strategy_source_digest,
+)
+
+HEADER = '''"""Generated by tools/gen_strategy_registry.py; do not edit by hand."""
+
+SOURCE_DIGEST = "{digest}"
+
+STRATEGY_CLASSES = (
+'''
+
+
+def render() -> str:
+    module_names = _strategy_module_names()
+    lines = [HEADER.format(digest=_strategy_source_digest(module_names))]
+    for cls in _scan_strategy_classes(module_names):
+        lines.append(f'    ("{cls.__module__}", "{cls.__name__}"),\n')
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def main() -> None:
+    target = _STRATEGY_DIR / "_registry.py"
+    target.write_text(render(), encoding="utf-8")
+    print(f"Wrote {target}")
+
+
+if __name__ == "__main__":
+    main()